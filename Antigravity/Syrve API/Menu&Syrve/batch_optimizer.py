@@ -0,0 +1,162 @@
+"""
+batch_optimizer.py
+Batch counts and sizes for every PF item of a day's plan.
+
+The sheet formula for batches is CEILING(target / Standard_Output) per
+product: it ignores how the product is stored (Bag 5L, GN 1/1 = 3 kg,
+Bag 1.5L) and what one machine can take (10 GN trays, 50 L gas range,
+20 kg blast chiller). Here each PF is made in
+    produced = requirement rounded up to whole storage packs
+    batches  = fewest batches of whole packs that fit every machine the
+               product passes, packs spread as evenly as possible
+Every operation takes its Duration_Min per batch whatever the size, so the
+fewest batches is also the fewest equipment minutes, and one pack is the
+most that can be over-produced.
+
+Items are planned together, parents before children: the quantity a
+parent actually produces (after pack rounding) is what its PF children
+must supply, so rounding up the borsch base also sizes the broth.
+
+These are the batches the kitchen makes: the Daily Production Plan (and
+through it the Chef Job List and Resource Load) and the Production
+Schedule use them. The Batch_Plan table shows the CEILING counts beside
+them for comparison.
+
+Usage:  python batch_optimizer.py [Sales_Forecast.tsv]
+"""
+
+import math
+import sys
+import time
+from collections import namedtuple
+
+from bom_engine import load_bom_index
+from cost_rollup import load_sale_ratios
+from model import FlowStep, Uom, read_table
+from kitchen import (BATCH_CAPACITY, GN_TRAY, GN_TRAY_KG, MANUAL_EQUIPMENT,
+                     availability_minutes)
+from production_planner import FORECAST_FILE, batch_counts, load_forecast, plan_totals
+
+BatchPlan = namedtuple('BatchPlan', 'code required unit pack max_batch batches batch_size produced minutes')
+
+BATCH_PLAN_COLUMNS = [
+    "Product_Code", "Product_Name", "Required_Qty", "Unit", "Storage_Pack", "Max_Batch",
+    "Batches", "Batch_Size", "Total_Produced", "Over_Production", "Equipment_Min",
+    "Sheet_Batches", "Sheet_Equipment_Min",
+]
+
+
+def load_storage_units(path='UOM_Mapping.tsv'):
+    """{Product_Code: (Base_UOM, Storage_UOM, Storage_Ratio)}."""
+    return {u.code: (u.base, u.storage, u.storage_ratio) for u in read_table(path, Uom)}
+
+
+def load_operations(path='Production_Flow.tsv'):
+    """{Product_Code: [(Equipment_ID, Duration_Min per batch), …]}."""
+    ops = {}
+    for step in read_table(path, FlowStep):
+        ops.setdefault(step.product, []).append((step.equipment or MANUAL_EQUIPMENT, step.duration))
+    return ops
+
+
+def machine_limit(equipment, storage_uom, pack):
+    """Largest batch (base units) one machine takes; trays convert via a GN pack."""
+    limit = BATCH_CAPACITY.get(equipment)
+    if limit is None:
+        return math.inf
+    qty, unit = limit
+    if unit == GN_TRAY:
+        return qty * (pack if storage_uom == GN_TRAY and pack else GN_TRAY_KG)
+    return qty
+
+
+def best_batches(required, pack, max_batch):
+    """
+    (batches, largest batch, total produced): the total is the requirement
+    rounded up to whole packs, split over the fewest batches the limit allows.
+    """
+    if required <= 0:
+        return 0, 0.0, 0.0
+    if not pack:
+        n = 1 if max_batch == math.inf else math.ceil(round(required / max_batch, 9))
+        return n, round(required / n, 6), round(required, 6)
+    packs = math.ceil(round(required / pack, 9))
+    per_batch = max(math.floor(round(max_batch / pack, 9)), 1) if max_batch != math.inf else packs
+    n = math.ceil(packs / per_batch)
+    return n, round(math.ceil(packs / n) * pack, 6), round(packs * pack, 6)
+
+
+def optimize(index, forecast, storage, operations):
+    """{pf_code: BatchPlan} for the forecast, parents planned before children."""
+    plans = {}
+
+    def produce(code, qty):
+        if not code.startswith('PF-'):
+            return qty
+        unit, storage_uom, pack = storage.get(code, ("", "", None))
+        ops = operations.get(code, [])
+        limit = min((machine_limit(e, storage_uom, pack) for e, _ in ops), default=math.inf)
+        n, size, produced = best_batches(qty, pack, limit)
+        minutes = n * sum(d for _, d in ops)
+        plans[code] = BatchPlan(code, qty, unit, pack, limit, n, size, produced, minutes)
+        return produced
+
+    plan_totals(index, forecast, produce)
+    return {code: plans[code] for code in index.order if code in plans}
+
+
+def equipment_load(plans, operations):
+    """{Equipment_ID: minutes} for the chosen batch counts."""
+    load = {}
+    for plan in plans.values():
+        for equipment, duration in operations.get(plan.code, []):
+            load[equipment] = load.get(equipment, 0) + plan.batches * duration
+    return load
+
+
+def batch_plan_rows(index, plans, operations, sale_ratios):
+    """Rows of the Batch_Plan table, with the sheet formula's batches for comparison."""
+    sheet = batch_counts(index, {p.code: p.required for p in plans.values()}, sale_ratios)
+    for p in plans.values():
+        per_batch = sum(d for _, d in operations.get(p.code, []))
+        name = index.nom.get(p.code, {}).get('Name', '')
+        yield [p.code, name, _num(p.required), p.unit, _num(p.pack or ""),
+               "" if p.max_batch == math.inf else _num(p.max_batch),
+               p.batches, _num(p.batch_size), _num(p.produced), _num(p.produced - p.required),
+               _num(p.minutes), sheet[p.code], _num(sheet[p.code] * per_batch)]
+
+
+def _num(value):
+    if isinstance(value, float):
+        value = round(value, 3)
+        return int(value) if value.is_integer() else value
+    return value
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else FORECAST_FILE
+    index = load_bom_index()
+    forecast = load_forecast(path)
+    storage, operations = load_storage_units(), load_operations()
+
+    start = time.perf_counter()
+    plans = optimize(index, forecast, storage, operations)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"{'Product':<22} {'required':>9} {'batches':>7} {'size':>7} {'made':>8} {'over':>7} {'min':>6}  sheet")
+    for row in batch_plan_rows(index, plans, operations, load_sale_ratios()):
+        code, _, req, unit, _, _, n, size, made, over, minutes, sheet_n, sheet_min = row
+        print(f"{code:<22} {req:>7} {unit:<2} {n:>6} {size:>7} {made:>8} {over:>7} {minutes:>6}  "
+              f"{sheet_n} batches / {sheet_min} min")
+
+    print("\nEquipment load (min):")
+    avail = availability_minutes()
+    for equipment, minutes in equipment_load(plans, operations).items():
+        limit = avail.get(equipment)
+        flag = "  OVERLOADED" if limit is not None and minutes > limit else ""
+        print(f"  {equipment:<22} {minutes:>6g} / {limit if limit is not None else '-'}{flag}")
+    print(f"\nOptimized {len(plans)} PF items in {elapsed:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
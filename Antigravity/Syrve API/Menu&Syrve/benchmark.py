@@ -0,0 +1,330 @@
+"""
+benchmark.py
+Time and memory of the pipeline's steps on synthetic menus (see
+synthetic_menu.py) from 30 to 100,000 items, to show where each step
+stops scaling and to catch regressions.
+
+For every size a synthetic working directory is written once, then each
+case runs in it in a fresh interpreter, so the caches and module state of
+one case (dataset, lru_caches) do not flatter the next, and the generators
+start without .build manifests, i.e. rebuild every table:
+
+    generate_tsvs          catalog YAML → TSVs, parse cache cold
+    generate_costing       every costing table, HTML views included
+    generate_operations    every operational table
+    bom_explosion          BOM index, whole-menu plan_requirements and the
+                           per-unit vector of every forecast dish
+    price_scenarios        every PF/SALE item re-costed under SCENARIOS
+                           random purchase price scenarios
+    upload_serialization   every SHEET_MAP table diffed against an empty
+                           sheet, packed by plan_batches and JSON-encoded
+                           as the batchUpdate bodies
+
+Each case records its wall time and the peak RSS of its process
+(interpreter and imports included, ~20 MB of it). The menu is written by a
+worker process as well: Linux carries a parent's peak RSS over into the
+children it starts, so the driver itself has to stay small. A case that
+fails or runs past --timeout is not run at larger sizes (nor are the cases
+that need its output). Between sizes the table shows
+the scaling exponent: ×10 items at exponent 1 is ×10 time; well above 1
+is where a step stops scaling.
+
+Results are written to RESULTS_FILE as JSON. When BASELINE_FILE exists
+(--save-baseline stores the current run as the baseline) every case and
+size is compared with it, and the run exits 1 when time or memory grew by
+more than --threshold (relative; differences under MIN_DELTA_SECONDS /
+MIN_DELTA_MB are noise) or when a case that was ok in the baseline now
+fails, times out or is skipped. Timings are only comparable on one machine, so
+both files live in .build/.
+
+Usage:  python benchmark.py [--sizes 30,300,3000,30000,100000] [--cases a,b]
+                            [--threshold 0.25] [--timeout 600] [--save-baseline]
+                            [--depth D] [--fanout F] [--mod-groups G]
+                            [--mod-items I] [--steps S] [--seed N]
+"""
+
+import contextlib
+import csv
+import datetime
+import io
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from build_manifest import BUILD_DIR
+from synthetic_menu import DEFAULT_SPEC, make_menu, parse_spec
+
+RESULTS_FILE  = os.path.join(BUILD_DIR, 'benchmark.json')
+BASELINE_FILE = os.path.join(BUILD_DIR, 'benchmark_baseline.json')
+SIZES             = [30, 300, 3_000, 30_000, 100_000]
+THRESHOLD         = 0.25
+TIMEOUT_S         = 600
+SCENARIOS         = 1_000
+MIN_DELTA_SECONDS = 0.05
+MIN_DELTA_MB      = 5.0
+
+
+# ─── Cases ──────────────────────────────────────────────────────────────────
+# Each case imports what it needs and returns the callable that is timed,
+# so import time is not counted. They run with the synthetic directory as cwd.
+def case_generate_tsvs():
+    from generate_tsvs import generate
+    return generate
+
+
+def case_generate_costing():
+    import generate_costing
+    return generate_costing.main
+
+
+def case_generate_operations():
+    import generate_operations
+    return generate_operations.main
+
+
+def case_bom_explosion():
+    from bom_engine import load_bom_index
+    from production_planner import load_forecast, plan_requirements
+
+    def run():
+        index, forecast = load_bom_index(), load_forecast()
+        plan_requirements(index, forecast)
+        for code in forecast:
+            index.unit_requirements(code)
+    return run
+
+
+def case_price_scenarios():
+    from price_scenarios import load_scenarios_engine, random_scenarios
+
+    def run():
+        engine = load_scenarios_engine()
+        _, multipliers = random_scenarios(engine, SCENARIOS)
+        engine.food_cost_pct(engine.run(multipliers))
+    return run
+
+
+def case_upload_serialization():
+    from upload_to_sheets import SHEET_MAP, diff_table, load_rows, plan_batches
+
+    def run():
+        blocks = []
+        for table_file, sheet_name in SHEET_MAP:
+            rects, _ = diff_table([], load_rows(table_file))
+            blocks += [(sheet_name, r0, c0, values) for r0, c0, values in rects]
+        for data in plan_batches(blocks):
+            json.dumps({"valueInputOption": "USER_ENTERED", "data": data}).encode()
+    return run
+
+
+# name → (setup, cases whose output it reads)
+CASES = {
+    'generate_tsvs':        (case_generate_tsvs,        []),
+    'generate_costing':     (case_generate_costing,     ['generate_tsvs']),
+    'generate_operations':  (case_generate_operations,  ['generate_tsvs']),
+    'bom_explosion':        (case_bom_explosion,        ['generate_tsvs']),
+    'price_scenarios':      (case_price_scenarios,      ['generate_tsvs']),
+    'upload_serialization': (case_upload_serialization, ['generate_costing', 'generate_operations']),
+}
+
+
+# ─── Worker (one case, one fresh process) ───────────────────────────────────
+def peak_rss_mb():
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10   # bytes on macOS, KiB elsewhere
+
+
+def install_prices(path='Purchasing.tsv'):
+    """Replace the in-code price list with the synthetic menu's one."""
+    import purchasing
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        rows = list(csv.reader(f, delimiter='\t'))[1:]
+    purchasing.purchasing_data[:] = [tuple(row) for row in rows]
+
+
+def worker(case):
+    """Run one case in the cwd and print {seconds, memory_mb} as JSON."""
+    install_prices()
+    run = CASES[case][0]()
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        run()
+        seconds = time.perf_counter() - start
+    print(json.dumps({'seconds': seconds, 'memory_mb': peak_rss_mb()}))
+
+
+def menu_worker(directory, spec):
+    """Write the synthetic menu and print its counts as JSON."""
+    print(json.dumps(make_menu(directory, spec)))
+
+
+def run_worker(args, directory, timeout=None):
+    cmd = [sys.executable, os.path.abspath(__file__)] + args
+    return subprocess.run(cmd, cwd=directory, capture_output=True, text=True, timeout=timeout)
+
+
+def run_case(case, directory, timeout):
+    """{status, seconds, memory_mb[, error]} of one case run in `directory`."""
+    try:
+        proc = run_worker(['--worker', case], directory, timeout)
+    except subprocess.TimeoutExpired:
+        return {'status': 'timeout', 'seconds': timeout, 'memory_mb': None}
+    if proc.returncode != 0:
+        error = (proc.stderr.strip().splitlines() or ['exit status %d' % proc.returncode])[-1]
+        return {'status': 'failed', 'seconds': None, 'memory_mb': None, 'error': error}
+    return dict(status='ok', **json.loads(proc.stdout.strip().splitlines()[-1]))
+
+
+# ─── Suite ──────────────────────────────────────────────────────────────────
+def option(name, default, parse=str):
+    return parse(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+
+
+def run_suite(sizes, cases, spec, timeout):
+    """[{case, size, status, seconds, memory_mb, menu}] for every size, smallest first."""
+    results, stopped = [], set()
+    for size in sizes:
+        with tempfile.TemporaryDirectory(prefix='menu_benchmark_') as directory:
+            start = time.perf_counter()
+            flags = ['--menu', directory]
+            for field, value in spec._replace(items=size)._asdict().items():
+                flags += ['--' + field.replace('_', '-'), str(value)]
+            proc = run_worker(flags, directory)
+            if proc.returncode != 0:
+                sys.exit(f"Synthetic menu of {size} items failed:\n{proc.stderr}")
+            menu = json.loads(proc.stdout)
+            print(f"── {size} items: synthetic menu in {time.perf_counter() - start:.1f} s "
+                  f"({', '.join(f'{v} {k}' for k, v in menu.items())})")
+            for case in cases:
+                blocked = case in stopped or any(dep in stopped for dep in CASES[case][1])
+                if blocked:
+                    stopped.add(case)
+                    result = {'status': 'skipped', 'seconds': None, 'memory_mb': None}
+                else:
+                    result = run_case(case, directory, timeout)
+                    if result['status'] != 'ok':
+                        stopped.add(case)
+                result = dict(case=case, size=size, menu=menu, **result)
+                results.append(result)
+                print_result(result, results)
+    return results
+
+
+def exponent(result, results):
+    """log-log slope of time against items from the previous size of the same case."""
+    previous = [r for r in results if r['case'] == result['case'] and r['size'] < result['size']
+                and r['status'] == 'ok']
+    if result['status'] != 'ok' or not previous:
+        return None
+    prev = previous[-1]
+    if min(prev['seconds'], result['seconds']) < 0.01:       # too short to tell
+        return None
+    return math.log(result['seconds'] / prev['seconds']) / math.log(result['size'] / prev['size'])
+
+
+def print_result(result, results):
+    line = f"   {result['case']:<22} {result['status']:<8}"
+    if result['status'] == 'ok':
+        line += f" {result['seconds']:>9.3f} s {result['memory_mb']:>8.1f} MB"
+        slope = exponent(result, results)
+        if slope is not None:
+            line += f"   scaling ×n^{slope:.2f}"
+    elif result.get('error'):
+        line += f" {result['error']}"
+    print(line)
+
+
+def regressions(results, baseline, threshold):
+    """
+    [(case, size, metric, baseline value, current value)] that grew past the
+    threshold; a case that was ok in the baseline and no longer is comes back
+    as (case, size, 'status', 'ok', its status now).
+    """
+    before = {(r['case'], r['size']): r for r in baseline['results'] if r['status'] == 'ok'}
+    found = []
+    for r in results:
+        base = before.get((r['case'], r['size']))
+        if base is None:
+            continue
+        if r['status'] != 'ok':
+            found.append((r['case'], r['size'], 'status', 'ok', r['status']))
+            continue
+        for metric, min_delta in (('seconds', MIN_DELTA_SECONDS), ('memory_mb', MIN_DELTA_MB)):
+            old, new = base[metric], r[metric]
+            if new is None:
+                continue
+            if new > old * (1 + threshold) and new - old > min_delta:
+                found.append((r['case'], r['size'], metric, old, new))
+    return found
+
+
+def save(path, document):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=1)
+
+
+def main():
+    if '--worker' in sys.argv:
+        worker(option('--worker', None))
+        return
+    if '--menu' in sys.argv:
+        menu_worker(option('--menu', None), parse_spec(sys.argv, DEFAULT_SPEC))
+        return
+
+    sizes = option('--sizes', SIZES, lambda v: [int(s) for s in v.split(',')])
+    cases = option('--cases', list(CASES), lambda v: v.split(','))
+    threshold = option('--threshold', THRESHOLD, float)
+    timeout = option('--timeout', TIMEOUT_S, float)
+    spec = parse_spec(sys.argv, DEFAULT_SPEC)
+    unknown = [c for c in cases if c not in CASES]
+    if unknown:
+        sys.exit(f"Unknown case(s): {', '.join(unknown)}; known: {', '.join(CASES)}")
+
+    results = run_suite(sorted(sizes), cases, spec, timeout)
+    document = {
+        'created':  datetime.datetime.now().isoformat(timespec='seconds'),
+        'python':   platform.python_version(),
+        'platform': platform.platform(),
+        'spec':     {k: v for k, v in spec._asdict().items() if k != 'items'},
+        'results':  results,
+    }
+    save(RESULTS_FILE, document)
+    print(f"\nResults saved to {RESULTS_FILE}")
+    if '--save-baseline' in sys.argv:
+        save(BASELINE_FILE, document)
+        print(f"Baseline saved to {BASELINE_FILE}")
+        return
+
+    try:
+        with open(BASELINE_FILE, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print(f"No baseline ({BASELINE_FILE}); run with --save-baseline to create one.")
+        return
+    if baseline['spec'] != document['spec']:
+        print("Baseline was taken with a different menu shape; not compared.")
+        return
+    found = regressions(results, baseline, threshold)
+    if not found:
+        print(f"No regressions against the baseline of {baseline['created']} "
+              f"(threshold {threshold:.0%}).")
+        return
+    print(f"{len(found)} regression(s) against the baseline of {baseline['created']}:")
+    for case, size, metric, old, new in found:
+        if metric == 'status':
+            print(f"   {case:<22} {size:>7} items  {metric:<9} {old} → {new}")
+            continue
+        growth = f" (+{new / old - 1:.0%})" if old else ""
+        print(f"   {case:<22} {size:>7} items  {metric:<9} {old:.3f} → {new:.3f}{growth}")
+    sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+bom_engine.py
+Indexed BOM explosion engine shared by the generators.
+
+Builds a parent → children adjacency index from BOM.tsv once, orders every
+item topologically (raising BomCycleError on loops) and memoizes a per-unit
+requirement vector per item, so exploding a dish costs O(its vector) instead
+of a full BOM scan at every recursion level. No recursion is used anywhere,
+so arbitrarily deep BOMs are safe.
+"""
+
+from collections import deque
+
+from model import BomLine, Item, read_table
+
+
+class BomCycleError(ValueError):
+    """The BOM contains a loop (an item that is, directly or not, its own child)."""
+
+    def __init__(self, cycle):
+        self.cycle = cycle
+        super().__init__("BOM cycle detected: " + " → ".join(cycle))
+
+
+class BomIndex:
+    """
+    children[parent] = [(child_code, qty_per_parent_unit), ...]
+    parents[child]   = [parent_code, ...]                      (where-used)
+    order            = every code, parents before their children
+    """
+
+    def __init__(self, bom_lines, nom):
+        # bom_lines: model.BomLine records; nom: {code: model.Item}
+        self.nom = nom
+        self.children = {}
+        self.parents = {}
+        for line in bom_lines:
+            if line.qty is None:
+                continue
+            # child qty per 1 unit of parent = gross / parent standard output
+            ratio = line.qty / self.std_output(line.parent)
+            self.children.setdefault(line.parent, []).append((line.child, ratio))
+            self.parents.setdefault(line.child, []).append(line.parent)
+
+        self.order = self._topological_order()
+        self.position = {code: i for i, code in enumerate(self.order)}
+        self._unit_cache = {}
+
+    # ─── Structure ──────────────────────────────────────────────────────────
+    def std_output(self, code):
+        """Standard_Output_Amount of an item; 1.0 for sales items/portions."""
+        item = self.nom.get(code)
+        return (item.std_output if item else None) or 1.0
+
+    def _topological_order(self):
+        # Kahn's algorithm; codes are seeded in first-seen BOM order so the
+        # result is stable between runs.
+        indegree = {}
+        for parent, kids in self.children.items():
+            indegree.setdefault(parent, 0)
+            for child, _ in kids:
+                indegree[child] = indegree.get(child, 0) + 1
+
+        queue = deque(code for code, deg in indegree.items() if deg == 0)
+        order = []
+        while queue:
+            code = queue.popleft()
+            order.append(code)
+            for child, _ in self.children.get(code, ()):
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    queue.append(child)
+
+        if len(order) < len(indegree):
+            stuck = {code for code, deg in indegree.items() if deg > 0}
+            raise BomCycleError(self._find_cycle(stuck))
+        return order
+
+    def _find_cycle(self, stuck):
+        # Every stuck code still has a stuck parent, so walking parents must
+        # eventually revisit a code; the walk between the two visits is a loop.
+        code = next(iter(stuck))
+        path, seen = [], {}
+        while code not in seen:
+            seen[code] = len(path)
+            path.append(code)
+            code = next(p for p in self.parents[code] if p in stuck)
+        cycle = path[seen[code]:] + [code]
+        cycle.reverse()   # parent → child direction
+        return cycle
+
+    def descendants(self, code):
+        """All codes reachable below `code` (excluding itself)."""
+        found, stack = set(), [code]
+        while stack:
+            for child, _ in self.children.get(stack.pop(), ()):
+                if child not in found:
+                    found.add(child)
+                    stack.append(child)
+        return found
+
+    # ─── Requirements ───────────────────────────────────────────────────────
+    def unit_requirements(self, code):
+        """
+        Memoized {descendant_code: qty} needed for 1 unit of `code`, summed
+        over every BOM path. Vectors are built children-first (reverse
+        topological order) so each one is composed from cached child vectors.
+        """
+        if code not in self._unit_cache:
+            pending = [c for c in self.descendants(code) | {code}
+                       if c not in self._unit_cache]
+            pending.sort(key=lambda c: self.position.get(c, -1), reverse=True)
+            for c in pending:
+                self._unit_cache[c] = self._build_vector(c)
+        return self._unit_cache[code]
+
+    def _build_vector(self, code):
+        vector = {}
+        for child, ratio in self.children.get(code, ()):
+            vector[child] = vector.get(child, 0) + ratio
+            for sub_code, sub_qty in self._unit_cache[child].items():
+                vector[sub_code] = vector.get(sub_code, 0) + ratio * sub_qty
+        return vector
+
+    def explode(self, code, qty, prefix='PF-'):
+        """
+        Total requirement of every descendant for `qty` units of `code`,
+        filtered to codes starting with `prefix` (None = keep all).
+        Drop-in for the old recursive generate_operations.explode_bom.
+        """
+        return {c: q * qty for c, q in self.unit_requirements(code).items()
+                if prefix is None or c.startswith(prefix)}
+
+
+def load_bom_index(nom_path='Nomenclature.tsv', bom_path='BOM.tsv'):
+    nom = {item.code: item for item in read_table(nom_path, Item)}
+    return BomIndex(read_table(bom_path, BomLine), nom)
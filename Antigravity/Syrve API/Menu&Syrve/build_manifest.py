@@ -0,0 +1,83 @@
+"""
+build_manifest.py
+Incremental regeneration for the table generators.
+
+Each generator keeps a manifest (.build/<generator>.json) that maps every
+output table to the content hashes of its input files, of the code that
+builds it, of the generator options (e.g. --formulas) and of the output
+itself and any views rendered from it. A re-run only rebuilds tables whose
+fingerprint changed; pass --force to rebuild everything.
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+BUILD_DIR = '.build'
+FORCE     = '--force' in sys.argv
+
+
+def file_hash(path):
+    """sha256 of a file's bytes, or None if it does not exist."""
+    h = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                h.update(chunk)
+    except FileNotFoundError:
+        return None
+    return h.hexdigest()
+
+
+class BuildManifest:
+    def __init__(self, name, code_files, options=None):
+        self.path = os.path.join(BUILD_DIR, f"{name}.json")
+        self._hashes = {}
+        self.code = {p: self.hash(p) for p in code_files}
+        self.options = options or {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.entries = {}
+
+    def hash(self, path):
+        # Inputs are shared between tables; hash each file once per run
+        if path not in self._hashes:
+            self._hashes[path] = file_hash(path)
+        return self._hashes[path]
+
+    def fingerprint(self, inputs):
+        return {
+            "inputs":  {p: self.hash(p) for p in inputs},
+            "code":    self.code,
+            "options": self.options,
+        }
+
+    def is_stale(self, output, inputs, views=()):
+        """`views` are extra files rendered from the same output (e.g. HTML)."""
+        entry = self.entries.get(output)
+        if FORCE or entry is None:
+            return True
+        if entry.get("output") != file_hash(output):   # missing or hand-edited
+            return True
+        recorded = entry.get("views", {})
+        if any(recorded.get(v) != file_hash(v) for v in views):
+            return True
+        return entry["fingerprint"] != self.fingerprint(inputs)
+
+    def record(self, output, inputs, views=(), **extra):
+        self.entries[output] = {
+            "fingerprint": self.fingerprint(inputs),
+            "output":      file_hash(output),
+            "views":       {v: file_hash(v) for v in views},
+            **extra,
+        }
+
+    def save(self):
+        os.makedirs(BUILD_DIR, exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, self.path)
@@ -0,0 +1,381 @@
+"""
+catalog_store.py
+The catalog's source of truth: YAML files under catalog/, checked against
+SCHEMA and for dangling references on load, and indexed for lookups.
+
+    groups.yaml           groups, categories, modifier schemas
+    items.yaml            nomenclature + UOM, yield, nutrition, portion size
+    bom.yaml              bills of materials (Processing Loss balanced here)
+    modifiers.yaml        modifier groups/items per schema
+    production_flow.yaml  operations per PF item
+
+Catalog keeps every item in file order plus indexes by short code, name,
+group and category, so lookups stay O(1) however many dishes are added.
+Parsed files are cached in .build/catalog.pickle by sha256, so only the YAML
+files that changed since the last load are parsed again.
+export_tsvs() writes the TSVs the generators and Sheets upload read
+(Groups, Product_Categories, Modifier_Schema_Registry, API_Mapping_Table,
+Nomenclature, BOM, Modifier_Schemes, Production_Flow, UOM_Mapping).
+"""
+
+import csv
+import os
+import pickle
+import uuid
+from decimal import Decimal, ROUND_HALF_UP
+
+import yaml
+
+from build_manifest import BUILD_DIR, file_hash
+
+CATALOG_DIR = 'catalog'
+CACHE_FILE  = os.path.join(BUILD_DIR, 'catalog.pickle')
+NAMESPACE   = uuid.UUID('12345678-1234-5678-1234-567812345678')
+LOSS_ITEM   = "Processing Loss"
+
+# What export_tsvs() writes, in order
+TSV_FILES = [
+    'Groups.tsv', 'Product_Categories.tsv', 'Modifier_Schema_Registry.tsv',
+    'API_Mapping_Table.tsv', 'Nomenclature.tsv', 'BOM.tsv', 'Modifier_Schemes.tsv',
+    'Production_Flow.tsv', 'UOM_Mapping.tsv',
+]
+
+# libyaml parses a few thousand items ~10× faster than the pure-Python loader
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+NUMBER = (int, float)
+TEXT   = (str, int, float)        # codes/names that YAML may read as numbers
+
+# file → {section: {field: (types, required)}}
+SCHEMA = {
+    'groups.yaml': {
+        'groups':     {'code': (str, True), 'name': (str, True), 'parent': (str, False),
+                       'description': (str, False), 'sys_id': (str, False)},
+        'categories': {'code': (str, True), 'name': (str, True), 'group': (str, True),
+                       'sys_id': (str, False)},
+        'schemas':    {'code': (str, True), 'name': (str, True), 'dish': (str, True),
+                       'sys_id': (str, False)},
+    },
+    'items.yaml': {
+        'items': {'name': (str, True), 'prefix': (str, True), 'type': (str, True),
+                  'code': (str, False), 'sys_id': (str, False), 'order_item_type': (str, False),
+                  'syrve_sync': (bool, False), 'measure_unit': (str, False),
+                  'group': (str, False), 'category': (str, False), 'notes': (str, False),
+                  'output': (dict, False), 'nutrition': (dict, False), 'uom': (dict, False),
+                  'yield': (NUMBER, False), 'portion_kg': (NUMBER, False)},
+    },
+    'bom.yaml': {
+        'boms': {'parent': (str, True), 'ingredients': (list, True), 'loss': ((bool,) + NUMBER, False)},
+    },
+    'modifiers.yaml': {
+        'modifier_schemes': {'schema': (str, True), 'dish': (str, True),
+                             'groups': (list, True), 'items': (list, True)},
+    },
+    'production_flow.yaml': {
+        'production_flow': {'product': (str, True), 'steps': (list, True)},
+    },
+}
+
+NESTED = {   # dict-valued item fields: {field: (types, required)}
+    'output':    {'amount': (NUMBER, True), 'uom': (str, True)},
+    'nutrition': {'kcal': (NUMBER, True), 'protein': (NUMBER, True),
+                  'fat': (NUMBER, True), 'carbs': (NUMBER, True)},
+    'uom':       {'base': (str, True), 'storage': (str, True), 'storage_ratio': (NUMBER, True),
+                  'sale': (str, True), 'sale_ratio': (NUMBER, True)},
+}
+
+
+class CatalogError(ValueError):
+    """The catalog files break SCHEMA or reference something that does not exist."""
+
+    def __init__(self, problems):
+        self.problems = problems
+        super().__init__("Catalog is invalid:\n  " + "\n  ".join(problems))
+
+
+def generate_uuid(name):
+    return str(uuid.uuid5(NAMESPACE, name))
+
+
+def make_short_code(name, prefix):
+    clean = "".join(c for c in name if c.isalnum() or c.isspace()).upper()
+    parts = clean.split()
+    if prefix == "PF" and parts[0] == "SF":
+        parts = parts[1:]
+    return f"{prefix}-{'_'.join(parts[:2])}"
+
+
+def text(value):
+    """TSV cell for a YAML scalar (None → empty, 11.7 → "11.7", True → "Yes")."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "Yes" if value else "No"
+    return str(value)
+
+
+def check_fields(entry, fields, where, problems):
+    if not isinstance(entry, dict):
+        problems.append(f"{where}: expected a mapping, got {type(entry).__name__}")
+        return
+    for name, (types, required) in fields.items():
+        if name not in entry:
+            if required:
+                problems.append(f"{where}: missing '{name}'")
+        elif not isinstance(entry[name], types) or (types is NUMBER and isinstance(entry[name], bool)):
+            problems.append(f"{where}: '{name}' has the wrong type ({entry[name]!r})")
+    for name in entry.keys() - fields.keys():
+        problems.append(f"{where}: unknown field '{name}'")
+
+
+def parse_file(path, filename, cache):
+    """One catalog file's sections, from the parse cache while its sha256 is unchanged."""
+    full = os.path.abspath(os.path.join(path, filename))
+    digest = file_hash(full)
+    hit = cache.get(full)
+    if hit and hit[0] == digest:
+        return hit[1]
+    with open(full, 'r', encoding='utf-8') as f:
+        doc = yaml.load(f, Loader=Loader) or {}
+    cache[full] = (digest, doc)
+    return doc
+
+
+def load_sections(path, cache_file=CACHE_FILE):
+    """{section: [entries]} of every catalog file, schema-checked."""
+    # The cache is only ever a shortcut: anything unreadable or of the wrong
+    # shape (truncated file, older format) is dropped and the YAML re-parsed
+    try:
+        with open(cache_file, 'rb') as f:
+            cache = pickle.load(f)
+    except Exception:
+        cache = {}
+    if not isinstance(cache, dict):
+        cache = {}
+    cache = {k: v for k, v in cache.items()
+             if isinstance(v, tuple) and len(v) == 2 and isinstance(v[1], dict)}
+    before = {k: v[0] for k, v in cache.items()}
+
+    data, problems = {}, []
+    for filename, sections in SCHEMA.items():
+        doc = parse_file(path, filename, cache)
+        for section, fields in sections.items():
+            entries = doc.get(section) or []
+            for i, entry in enumerate(entries):
+                where = f"{filename}:{section}[{i}]"
+                check_fields(entry, fields, where, problems)
+                for name, sub in NESTED.items():
+                    if section == 'items' and isinstance(entry, dict) and name in entry:
+                        check_fields(entry[name], sub, f"{where}.{name}", problems)
+            data[section] = entries
+    if problems:
+        raise CatalogError(problems)
+    if cache_file and {k: v[0] for k, v in cache.items()} != before:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump(cache, f, pickle.HIGHEST_PROTOCOL)
+    # Catalog adds derived keys to the entries; keep the cached copies clean
+    return pickle.loads(pickle.dumps(data, pickle.HIGHEST_PROTOCOL))
+
+
+class Catalog:
+    """
+    Loaded catalog. `items` keeps file order; by_code / by_name map to the
+    same item dicts (with derived 'code' and 'sys_id'); by_group /
+    by_category list the items filed under each code.
+    """
+
+    def __init__(self, sections):
+        self.groups = sections['groups']
+        self.categories = sections['categories']
+        self.schemas = sections['schemas']
+        self.items = sections['items']
+        self.boms = sections['boms']
+        self.modifier_schemes = sections['modifier_schemes']
+        self.production_flow = sections['production_flow']
+
+        for entry in self.groups + self.categories + self.schemas:
+            entry.setdefault('sys_id', generate_uuid(entry['name']))
+        self.by_code, self.by_name, self.by_group, self.by_category = {}, {}, {}, {}
+        for item in self.items:
+            item.setdefault('code', make_short_code(item['name'], item['prefix']))
+            item.setdefault('sys_id', generate_uuid(item['name']))
+            self.by_code[item['code']] = item
+            self.by_name[item['name']] = item
+            self.by_group.setdefault(item.get('group', ''), []).append(item)
+            self.by_category.setdefault(item.get('category', ''), []).append(item)
+        self.schema_by_dish = {s['dish']: s for s in self.schemas}
+        problems = self.reference_problems()
+        if problems:
+            raise CatalogError(problems)
+
+    def reference_problems(self):
+        """Every reference to a group, category, schema or item that does not exist."""
+        problems = []
+        groups = {g['code'] for g in self.groups}
+        categories = {c['code'] for c in self.categories}
+        schemas = {s['code'] for s in self.schemas}
+
+        def need(found, where, kind, key):
+            if not found:
+                problems.append(f"{where}: unknown {kind} '{key}'")
+
+        def item(where, key):
+            need(key in self.by_code or key in self.by_name, where, "item", key)
+
+        for i, g in enumerate(self.groups):
+            if g.get('parent'):
+                need(g['parent'] in groups, f"groups.yaml:groups[{i}]", "parent group", g['parent'])
+        for i, c in enumerate(self.categories):
+            need(c['group'] in groups, f"groups.yaml:categories[{i}]", "group", c['group'])
+        for i, sch in enumerate(self.schemas):
+            need(sch['dish'] in self.by_code, f"groups.yaml:schemas[{i}]", "dish code", sch['dish'])
+        for i, it in enumerate(self.items):
+            where = f"items.yaml:items[{i}]"
+            if it.get('group'):
+                need(it['group'] in groups, where, "group", it['group'])
+            if it.get('category'):
+                need(it['category'] in categories, where, "category", it['category'])
+        for i, bom in enumerate(self.boms):
+            where = f"bom.yaml:boms[{i}]"
+            item(where, bom['parent'])
+            for k, ingredient in enumerate(bom['ingredients']):
+                item(f"{where}.ingredients[{k}]", ingredient[0])
+            if bom.get('loss') is not False:
+                item(where, LOSS_ITEM)
+        for i, scheme in enumerate(self.modifier_schemes):
+            where = f"modifiers.yaml:modifier_schemes[{i}]"
+            need(scheme['schema'] in schemas, where, "schema", scheme['schema'])
+            item(where, scheme['dish'])
+            offered = set()
+            for k, g in enumerate(scheme['groups']):
+                item(f"{where}.groups[{k}]", g['group'])
+                offered.add(g['group'])
+            for k, row in enumerate(scheme['items']):
+                need(row['group'] in offered, f"{where}.items[{k}]", "group of this schema", row['group'])
+                item(f"{where}.items[{k}]", row['item'])
+        for i, entry in enumerate(self.production_flow):
+            item(f"production_flow.yaml:production_flow[{i}]", entry['product'])
+        return problems
+
+    def item(self, key):
+        """Item by short code or by name."""
+        found = self.by_code.get(key) or self.by_name.get(key)
+        if found is None:
+            raise KeyError(f"Unknown catalog item: {key}")
+        return found
+
+
+def load_catalog(path=CATALOG_DIR):
+    return Catalog(load_sections(path))
+
+
+# ─── Exports ────────────────────────────────────────────────────────────────
+def _writer(f):
+    return csv.writer(f, delimiter='\t', lineterminator='\n')
+
+
+def bom_rows(catalog):
+    """BOM.tsv rows; parents without an explicit `loss` get a balancing Processing Loss line."""
+    loss_item = catalog.item(LOSS_ITEM)
+    for bom in catalog.boms:
+        parent = catalog.item(bom['parent'])
+        net = Decimal("0")
+        for child_name, qty_gross, unit in bom['ingredients']:
+            child = catalog.item(child_name)
+            net += Decimal(str(qty_gross)) * Decimal(str(child.get('yield', 1.0)))
+            yield [parent['code'], parent['name'], child['code'], child['name'], text(qty_gross), unit]
+
+        loss = bom.get('loss')
+        if loss is False:
+            continue
+        output = parent.get('output', {})
+        if loss is None:
+            std = Decimal(str(output.get('amount', 0)))
+            loss = float((std - net).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP))
+        yield [parent['code'], parent['name'], loss_item['code'], loss_item['name'],
+               text(loss), output.get('uom') or "kg"]
+
+
+def modifier_rows(catalog):
+    for scheme in catalog.modifier_schemes:
+        dish = catalog.item(scheme['dish'])
+        limits = {g['group']: (g['min'], g['max']) for g in scheme['groups']}
+        for row in scheme['items']:
+            group, item = catalog.item(row['group']), catalog.item(row['item'])
+            mn, mx = limits[row['group']]
+            yield [scheme['schema'], dish['code'], dish['name'], group['code'], group['name'],
+                   text(mn), text(mx), item['code'], item['name'], text(row['default']),
+                   text(item.get('portion_kg', 0))]
+
+
+def export_tsvs(catalog, out_dir='.'):
+    """Write every catalog TSV into out_dir; returns {filename: rows written}."""
+    counts = {}
+
+    def write(filename, header, rows):
+        n = 0
+        with open(os.path.join(out_dir, filename), 'w', encoding='utf-8', newline='') as f:
+            w = _writer(f)
+            w.writerow(header)
+            for row in rows:
+                w.writerow(row)
+                n += 1
+        counts[filename] = n
+
+    write('Groups.tsv', ["Group_Code", "Syrve_System_ID", "Group_Name", "Parent_Group_Code", "Description"],
+          ([g['code'], g['sys_id'], g['name'], g.get('parent', ''), g.get('description', '')]
+           for g in catalog.groups))
+    write('Product_Categories.tsv', ["Category_Code", "Syrve_System_ID", "Category_Name", "Parent_Group_Code"],
+          ([c['code'], c['sys_id'], c['name'], c['group']] for c in catalog.categories))
+    write('Modifier_Schema_Registry.tsv', ["Schema_Code", "Syrve_System_ID", "Schema_Name", "Dish_Short_Code"],
+          ([s['code'], s['sys_id'], s['name'], s['dish']] for s in catalog.schemas))
+    write('API_Mapping_Table.tsv', ["Short_Code", "Syrve_System_ID", "Item_Name"],
+          ([i['code'], i['sys_id'], i['name']] for i in catalog.items))
+
+    def nomenclature():
+        for i in catalog.items:
+            output, nutrition = i.get('output', {}), i.get('nutrition', {})
+            schema = catalog.schema_by_dish.get(i['code'])
+            yield [i['code'], i['sys_id'], i['name'], i['type'], i.get('order_item_type', ''),
+                   i.get('notes', ''), text(output.get('amount')), output.get('uom', ''),
+                   text(i.get('syrve_sync', True)),
+                   i.get('measure_unit', ''), i.get('group', ''), i.get('category', ''),
+                   schema['code'] if schema else '',
+                   text(nutrition.get('kcal')), text(nutrition.get('protein')),
+                   text(nutrition.get('fat')), text(nutrition.get('carbs')), text(i.get('yield'))]
+
+    write('Nomenclature.tsv', [
+        "Short_Code", "Syrve_System_ID", "Name", "Type", "OrderItemType",
+        "UsageNotes", "Standard_Output_Amount", "Standard_Output_UOM", "Syrve_Sync",
+        "measureUnit", "groupId", "productCategoryId", "modifierSchemaId",
+        "kcal_per100g", "protein_per100g", "fat_per100g", "carbs_per100g", "Yield",
+    ], nomenclature())
+    write('BOM.tsv', ["Parent_Code", "Parent_Name", "Child_Code", "Child_Name", "QuantityGross", "Unit"],
+          bom_rows(catalog))
+    write('Modifier_Schemes.tsv', [
+        "Schema_Code", "Target_Dish_Code", "Target_Dish_Name", "Modifier_Group_Code",
+        "Modifier_Group_Name", "MinAmount_Group", "MaxAmount_Group", "Modifier_Item_Code",
+        "Modifier_Item_Name", "DefaultAmount_Item", "Portion_Size_kg",
+    ], modifier_rows(catalog))
+
+    def flow():
+        for entry in catalog.production_flow:
+            product = catalog.item(entry['product'])
+            for operation, equipment, temperature, duration, bottleneck, notes in entry['steps']:
+                yield [product['code'], product['name'], operation, equipment,
+                       text(temperature), text(duration), text(bottleneck), notes]
+
+    write('Production_Flow.tsv', ["Product_Code", "Product_Name", "Operation", "Equipment_ID",
+                                  "Temperature", "Duration_Min", "Is_Bottleneck", "Notes"], flow())
+
+    def uom():
+        for i in catalog.items:
+            u = i.get('uom')
+            if u:
+                yield [i['code'], i['name'], u['base'], u['storage'], text(u['storage_ratio']),
+                       u['sale'], text(u['sale_ratio'])]
+
+    write('UOM_Mapping.tsv', ["Product_Code", "Product_Name", "Base_UOM", "Storage_UOM",
+                              "Storage_Ratio", "Sale_UOM", "Sale_Ratio"], uom())
+    return counts
@@ -1,5 +1,17 @@
+"""
+cleanup_nomenclature.py
+Drops Nomenclature rows whose Name is their Short_Code and rows repeating a
+Syrve_System_ID, then runs the full catalog check (validate_catalog.py).
+
+Usage:  python cleanup_nomenclature.py            (clean, then check)
+        python cleanup_nomenclature.py --check    (check only, no rewrite)
+"""
+
 import csv
 import os
+import sys
+
+from validate_catalog import check
 
 def cleanup_nomenclature():
     file_path = 'Nomenclature.tsv'
@@ -13,7 +25,7 @@ def cleanup_nomenclature():
          open(temp_path, 'w', encoding='utf-8', newline='') as f_out:
         
         reader = csv.DictReader(f_in, delimiter='\t')
-        writer = csv.DictWriter(f_out, fieldnames=reader.fieldnames, delimiter='\t')
+        writer = csv.DictWriter(f_out, fieldnames=reader.fieldnames, delimiter='\t', lineterminator='\n')
         writer.writeheader()
         
         count = 0
@@ -38,4 +50,7 @@ def cleanup_nomenclature():
     print(f"Cleaned up {count} duplicate/invalid rows from Nomenclature.tsv.")
 
 if __name__ == "__main__":
-    cleanup_nomenclature()
+    if '--check' not in sys.argv:
+        cleanup_nomenclature()
+    if not check()['ok']:
+        sys.exit(1)
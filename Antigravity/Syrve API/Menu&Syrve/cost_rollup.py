@@ -0,0 +1,131 @@
+"""
+cost_rollup.py
+Food-cost rollup computed in Python instead of per-row whole-column Sheets
+formulas (COUNTIF/SUMIF/VLOOKUP over A:A on every BOM line, which made the
+workbook recalculate in O(N²)).
+
+Parents are costed children-first (reverse topological order of the BOM), so
+every Unit_Cost is known before it is used one level up. The numbers match
+what the old formulas produced; run a generator with --formulas to emit the
+formulas again for auditing.
+"""
+
+import sys
+from decimal import Decimal, ROUND_HALF_UP
+
+from bom_engine import BomIndex
+from model import Uom, read_table
+from purchasing import purchasing_data
+
+# "--formulas" keeps the Sheets formulas instead of computed values
+FORMULA_MODE = '--formulas' in sys.argv
+
+
+def yield_for(item):
+    """Yield of a BOM child (model.Item or None) as cell text: its Nomenclature Yield, else "1"."""
+    return item.yield_text if item is not None and item.yield_text else "1"
+
+
+def price_per_base_unit(code_for_name):
+    """{Short_Code: Purchase_Price / Base_Unit_Ratio}  (Purchasing_Inventory col F)."""
+    prices = {}
+    for name, _, price, ratio in purchasing_data:
+        prices[code_for_name(name)] = float(price) / float(ratio)
+    return prices
+
+
+def load_sale_ratios(path='UOM_Mapping.tsv'):
+    """{Product_Code: Sale_Ratio}  (UOM_Mapping col G)."""
+    return {u.code: u.sale_ratio for u in read_table(path, Uom)}
+
+
+def round_half_up(value, places=0):
+    """Sheets ROUND() semantics (Python's round() is banker's rounding)."""
+    exp = Decimal(1).scaleb(-places)
+    return float(Decimal(str(value)).quantize(exp, rounding=ROUND_HALF_UP))
+
+
+def cell(value):
+    """Render a computed number the way it is written into a table cell."""
+    if isinstance(value, float):
+        value = round(value, 6)
+        return str(int(value)) if value.is_integer() else str(value)
+    return str(value)
+
+
+class CostRollup:
+    """
+    lines[i]       = computed columns for bom_lines[i] (model.BomLine):
+                     yield, net, unit_cost, line_cost,
+                     batch_validation, cost_per_sales_unit
+    unit_cost[c]   = cost per net unit of an item that has a BOM
+    totals[parent] = (sum of Total_Line_Cost, sum of QuantityNet)
+    """
+
+    def __init__(self, bom_lines, nom, prices, sale_ratios):
+        self.nom = nom
+        self.prices = prices
+        self.sale_ratios = sale_ratios
+        self.unit_cost = {}
+        self.totals = {}
+        self.lines = [None] * len(bom_lines)
+
+        rows_by_parent = {}
+        for i, line in enumerate(bom_lines):
+            rows_by_parent.setdefault(line.parent, []).append(i)
+
+        order = BomIndex(bom_lines, nom).order
+        for parent in reversed(order):
+            if parent not in rows_by_parent:
+                continue
+            cost_sum = net_sum = 0.0
+            for i in rows_by_parent[parent]:
+                line = bom_lines[i]
+                gross = line.qty or 0.0
+                y_perc = yield_for(self.nom.get(line.child))
+                net = gross * float(y_perc)
+                unit = self.child_unit_cost(line.child)
+                line_cost = gross * unit
+                cost_sum += line_cost
+                net_sum += net
+                self.lines[i] = {"yield": y_perc, "net": net,
+                                 "unit_cost": unit, "line_cost": line_cost}
+            self.totals[parent] = (cost_sum, net_sum)
+            if net_sum:
+                self.unit_cost[parent] = cost_sum / net_sum
+
+            validation = self.batch_validation(parent, net_sum)
+            per_sales_unit = self.cost_per_sales_unit(parent)
+            for i in rows_by_parent[parent]:
+                self.lines[i]["batch_validation"] = validation
+                self.lines[i]["cost_per_sales_unit"] = per_sales_unit
+
+    def child_unit_cost(self, code):
+        # IF(COUNTIF(A:A, C)>0, SUMIF(..J)/SUMIF(..H), VLOOKUP(Purchasing)) wrapped in IFERROR(…, 0)
+        if code in self.totals:
+            return self.unit_cost.get(code, 0.0)
+        return self.prices.get(code, 0.0)
+
+    def batch_validation(self, parent, net_sum):
+        item = self.nom.get(parent)
+        if item is None:
+            return "#N/A"
+        std = item.std_output
+        # Same test as the sheet formula: Nomenclature col 4 is Type
+        if parent.startswith("SALE-") or item.type == "Compound":
+            ratio = self.sale_ratios.get(parent)
+            produced = round_half_up(net_sum / ratio, 2) if ratio else -1
+        else:
+            produced = round_half_up(net_sum, 2)
+        return "OK" if std is not None and produced == std else "YIELD ERR"
+
+    def cost_per_sales_unit(self, parent):
+        cost_sum, net_sum = self.totals[parent]
+        if not net_sum:
+            return "#DIV/0!"
+        ratio = self.sale_ratios.get(parent)
+        return (cost_sum / net_sum) * (ratio if ratio is not None else 1)
+
+    def base_cost(self, dish_code):
+        """SUMIF(BOM!A:A, dish, BOM!J:J)."""
+        return self.totals.get(dish_code, (0.0, 0.0))[0]
@@ -0,0 +1,51 @@
+"""
+dataset.py
+In-process cache of the pipeline's TSV inputs.
+
+Every loader in the generators, the planners and syrve_sync.py reads its
+TSVs through read_tsv() (dict rows) or model.read_table() (typed records),
+so when several stages run in one process (pipeline.py) each file is parsed
+once, not once per script and table. An entry is reused while the file's
+mtime and size are unchanged, so a stage that rewrites a TSV (generate_tsvs,
+cleanup_nomenclature) is seen by the stages after it. The returned rows are
+shared: treat them as read-only.
+"""
+
+import csv
+import os
+import threading
+
+_cache = {}                    # (abspath, parser) → ((mtime_ns, size), result)
+_lock = threading.Lock()
+stats = {'parsed': 0, 'hits': 0}
+
+
+def cached(path, parse):
+    """parse(file) for `path`, reused while the file is unchanged; FileNotFoundError if missing."""
+    full = os.path.abspath(path)
+    st = os.stat(full)
+    key = (st.st_mtime_ns, st.st_size)
+    with _lock:
+        hit = _cache.get((full, parse))
+        if hit and hit[0] == key:
+            stats['hits'] += 1
+            return hit[1]
+        with open(full, 'r', encoding='utf-8', newline='') as f:
+            result = parse(f)
+        _cache[(full, parse)] = (key, result)
+        stats['parsed'] += 1
+        return result
+
+
+def _dict_rows(f):
+    return list(csv.DictReader(f, delimiter='\t'))
+
+
+def read_tsv(path):
+    """Rows of a tab-separated file as dicts; FileNotFoundError if it is missing."""
+    return cached(path, _dict_rows)
+
+
+def clear():
+    with _lock:
+        _cache.clear()
@@ -1,41 +1,178 @@
-import os
+"""
+download_sheet.py
+Reads the Google Spreadsheet back into a local snapshot cache.
+
+`snapshot` pulls every sheet in upload_to_sheets.SHEET_MAP with one
+values:batchGet per render option (UNFORMATTED_VALUE and FORMULA) and stores
+both in SQLite (sheets_snapshot.sqlite) under a timestamp. Diffing,
+validation and reverse-sync tools read the cache with load_sheet() instead
+of calling the API.
+
+Usage:
+    python download_sheet.py snapshot
+    python download_sheet.py list
+    python download_sheet.py [dump] [sheet] [--refresh]   (default: BOM)
+"""
+
+import sys
 import json
+import sqlite3
+import datetime
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 
+from upload_to_sheets import SHEET_MAP
+
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets.readonly']
 SPREADSHEET_ID = '1-bNwX3XkDiYADdJ1AuoqQM4YhvKSMxnJ_QkMuPGU2u8'
+SNAPSHOT_DB = 'sheets_snapshot.sqlite'
+SNAPSHOT_KEEP = 20   # older snapshots are deleted when a new one is taken
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id             INTEGER PRIMARY KEY AUTOINCREMENT,
+    taken_at       TEXT NOT NULL,
+    spreadsheet_id TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS cells (
+    snapshot_id INTEGER NOT NULL REFERENCES snapshots(id) ON DELETE CASCADE,
+    sheet       TEXT    NOT NULL,
+    row         INTEGER NOT NULL,
+    col         INTEGER NOT NULL,
+    value       TEXT,              -- JSON, keeps numbers/booleans typed
+    formula     TEXT,              -- JSON, same as value for plain cells
+    PRIMARY KEY (snapshot_id, sheet, row, col)
+);
+"""
 
 def authenticate():
     cred_path = 'gdisk_cred.json'
     creds = Credentials.from_service_account_file(cred_path, scopes=SCOPES)
     return build('sheets', 'v4', credentials=creds)
 
+def connect(path=SNAPSHOT_DB):
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    return conn
+
+def sheet_names():
+    # Same sheet may be fed by more than one file; keep SHEET_MAP order
+    return list(dict.fromkeys(name for _, name in SHEET_MAP))
+
+def quoted(sheet_name):
+    return "'" + sheet_name.replace("'", "''") + "'"
+
+def batch_get(service, names, render_option):
+    """{sheet: rows} for all `names` in a single batchGet call."""
+    result = service.spreadsheets().values().batchGet(
+        spreadsheetId=SPREADSHEET_ID,
+        ranges=[quoted(n) for n in names],
+        valueRenderOption=render_option,
+        dateTimeRenderOption='FORMATTED_STRING'
+    ).execute()
+    return {name: vr.get('values', []) for name, vr in zip(names, result.get('valueRanges', []))}
+
+def take_snapshot(service, conn):
+    """Fetch values + formulas for every sheet and store them; returns the snapshot id."""
+    names = sheet_names()
+    values = batch_get(service, names, 'UNFORMATTED_VALUE')
+    formulas = batch_get(service, names, 'FORMULA')
+
+    taken_at = datetime.datetime.now().isoformat(timespec='seconds')
+    with conn:
+        cur = conn.execute("INSERT INTO snapshots (taken_at, spreadsheet_id) VALUES (?, ?)",
+                           (taken_at, SPREADSHEET_ID))
+        snapshot_id = cur.lastrowid
+        for name in names:
+            conn.executemany(
+                "INSERT INTO cells VALUES (?, ?, ?, ?, ?, ?)",
+                _cells(snapshot_id, name, values[name], formulas[name]))
+        conn.execute("DELETE FROM snapshots WHERE id NOT IN "
+                     "(SELECT id FROM snapshots ORDER BY id DESC LIMIT ?)", (SNAPSHOT_KEEP,))
+    return snapshot_id
+
+def _cells(snapshot_id, sheet, values, formulas):
+    for r in range(max(len(values), len(formulas))):
+        val_row = values[r] if r < len(values) else []
+        form_row = formulas[r] if r < len(formulas) else []
+        for c in range(max(len(val_row), len(form_row))):
+            val = val_row[c] if c < len(val_row) else ""
+            form = form_row[c] if c < len(form_row) else val
+            if val == "" and form == "":
+                continue
+            yield (snapshot_id, sheet, r, c,
+                   json.dumps(val, ensure_ascii=False), json.dumps(form, ensure_ascii=False))
+
+def latest_snapshot(conn):
+    """(id, taken_at) of the newest snapshot, or None."""
+    return conn.execute("SELECT id, taken_at FROM snapshots ORDER BY id DESC LIMIT 1").fetchone()
+
+def load_sheet(conn, sheet, snapshot_id=None, field='value'):
+    """Rows of one sheet from the cache (`field` = 'value' or 'formula'); latest snapshot by default."""
+    if snapshot_id is None:
+        latest = latest_snapshot(conn)
+        if latest is None:
+            return []
+        snapshot_id = latest[0]
+    column = 'formula' if field == 'formula' else 'value'
+    rows = []
+    for r, c, cell in conn.execute(
+            f"SELECT row, col, {column} FROM cells WHERE snapshot_id = ? AND sheet = ? ORDER BY row, col",
+            (snapshot_id, sheet)):
+        while len(rows) <= r:
+            rows.append([])
+        row = rows[r]
+        while len(row) < c:
+            row.append("")
+        row.append(json.loads(cell))
+    return rows
+
+def dump(conn, sheet):
+    values = load_sheet(conn, sheet)
+    formulas = load_sheet(conn, sheet, field='formula')
+
+    if not values:
+        print('No data found.')
+    else:
+        for i, row in enumerate(values):
+            form_row = formulas[i] if i < len(formulas) else []
+            print(f"Row {i+1}:")
+            for j, val in enumerate(row):
+                form_val = form_row[j] if j < len(form_row) else val
+                if str(val) != str(form_val):
+                    print(f"  Col {j+1}: {val} (Formula: {form_val})")
+                else:
+                    print(f"  Col {j+1}: {val}")
+
 def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    cmd = args[0] if args and args[0] in ('snapshot', 'list', 'dump') else 'dump'
+    if args and args[0] == cmd:
+        args = args[1:]
+
+    conn = connect()
     try:
-        service = authenticate()
-        sheet = service.spreadsheets()
-        result = sheet.values().get(spreadsheetId=SPREADSHEET_ID, range='BOM!A1:J100', valueRenderOption='UNFORMATTED_VALUE', dateTimeRenderOption='FORMATTED_STRING').execute()
-        values = result.get('values', [])
-        
-        # Also let's get formulas
-        result_formulas = sheet.values().get(spreadsheetId=SPREADSHEET_ID, range='BOM!A1:J100', valueRenderOption='FORMULA').execute()
-        formulas = result_formulas.get('values', [])
-
-        if not values:
-            print('No data found.')
-        else:
-            for i, row in enumerate(values):
-                form_row = formulas[i] if i < len(formulas) else []
-                print(f"Row {i+1}:")
-                for j, val in enumerate(row):
-                    form_val = form_row[j] if j < len(form_row) else val
-                    if str(val) != str(form_val):
-                        print(f"  Col {j+1}: {val} (Formula: {form_val})")
-                    else:
-                        print(f"  Col {j+1}: {val}")
+        if cmd == 'list':
+            for snapshot_id, taken_at, cells in conn.execute(
+                    "SELECT s.id, s.taken_at, COUNT(c.row) FROM snapshots s "
+                    "LEFT JOIN cells c ON c.snapshot_id = s.id GROUP BY s.id ORDER BY s.id"):
+                print(f"#{snapshot_id}  {taken_at}  {cells} cells")
+            return
+
+        if cmd == 'snapshot' or '--refresh' in sys.argv or latest_snapshot(conn) is None:
+            snapshot_id = take_snapshot(authenticate(), conn)
+            print(f"Snapshot #{snapshot_id}: {len(sheet_names())} sheets cached in {SNAPSHOT_DB}")
+            if cmd == 'snapshot':
+                return
+
+        _, taken_at = latest_snapshot(conn)
+        print(f"(snapshot taken {taken_at})")
+        dump(conn, args[0] if args else 'BOM')
     except Exception as e:
         print(f"Error accessing spreadsheet: {e}")
+    finally:
+        conn.close()
 
 if __name__ == '__main__':
     main()
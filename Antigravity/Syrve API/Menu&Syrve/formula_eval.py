@@ -0,0 +1,625 @@
+"""
+formula_eval.py
+Offline evaluator for the spreadsheet formulas the generators emit.
+
+Covers exactly the subset used in the workbook: IFERROR, IF, OR, VLOOKUP,
+SUMIF, SUMIFS, SUMPRODUCT, COUNTIF, CEILING, ROUND, LEFT, arithmetic and
+comparisons, cell/range references (A2, C$2, A:G, 'Chef Job List'!F:F).
+Lookups are indexed: the first time a range is used as a VLOOKUP table or a
+SUMIF/SUMIFS/COUNTIF criteria range it is hashed once, and every later
+lookup is a dict hit instead of a column scan.
+
+The workbook is loaded from the same files upload_to_sheets sends
+(SHEET_MAP), with values typed the way USER_ENTERED would ("4.5" → 4.5,
+"33%" → 0.33). Generate with --formulas to evaluate the BOM formulas too.
+
+Usage:
+    python formula_eval.py [sheet …]        print evaluated sheets
+    python formula_eval.py --check          report YIELD ERR / error cells
+"""
+
+import math
+import re
+import sys
+import time
+from decimal import Decimal, ROUND_HALF_UP
+
+from upload_to_sheets import SHEET_MAP, col_letter, load_rows
+
+
+ERROR_CODES = {"#N/A", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#ERROR!"}
+
+
+class FormulaError(Exception):
+    """A Sheets error value (#N/A, #DIV/0!, #VALUE!, #REF!, #NAME?)."""
+
+    def __init__(self, code):
+        super().__init__(code)
+        self.code = code
+
+
+# ─── Parsing ─────────────────────────────────────────────────────────────────
+_COL = r"\$?[A-Z]{1,3}"
+_ROW = r"\$?\d+"
+_REF = rf"(?:{_COL}(?:{_ROW})?:{_COL}(?:{_ROW})?|{_COL}{_ROW})"
+TOKEN = re.compile(rf"""
+    \s*(?:
+      (?P<str>"(?:[^"]|"")*")
+    | (?P<num>\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)
+    | (?P<ref>(?:(?:'(?:[^']|'')+'|[A-Za-z_][A-Za-z0-9_]*)!)?{_REF})(?![A-Za-z0-9_(])
+    | (?P<func>[A-Za-z][A-Za-z0-9.]*)(?=\s*\()
+    | (?P<bool>TRUE|FALSE)\b
+    | (?P<op><>|<=|>=|[-+*/&=<>(),^])
+    )""", re.VERBOSE)
+
+
+def col_index(letters):
+    n = 0
+    for ch in letters.replace("$", ""):
+        n = n * 26 + ord(ch) - 64
+    return n - 1
+
+
+def tokenize(text):
+    pos, tokens = 0, []
+    text = text.rstrip()
+    while pos < len(text):
+        m = TOKEN.match(text, pos)
+        if not m:
+            raise FormulaError("#ERROR!")
+        kind = m.lastgroup
+        tokens.append((kind, m.group(kind)))
+        pos = m.end()
+    return tokens
+
+
+def parse_ref(text, sheet):
+    """'Sheet'!A$2:B$10 → ('ref', sheet, c0, r0, c1, r1); rows are 0-based, None = open."""
+    if "!" in text:
+        sheet, text = text.rsplit("!", 1)
+        if sheet.startswith("'"):
+            sheet = sheet[1:-1].replace("''", "'")
+    parts = text.split(":")
+    cells = []
+    for part in parts:
+        m = re.fullmatch(r"(\$?[A-Z]{1,3})(\$?\d+)?", part)
+        row = int(m.group(2).replace("$", "")) - 1 if m.group(2) else None
+        cells.append((col_index(m.group(1)), row))
+    (c0, r0), (c1, r1) = cells[0], cells[-1]
+    if len(parts) == 1:
+        return ("cell", sheet, c0, r0)
+    return ("range", sheet, c0, r0, c1, r1)
+
+
+class Parser:
+    """Recursive descent over the token list; precedence as in Sheets."""
+
+    LEVELS = [("=", "<>", "<", ">", "<=", ">="), ("&",), ("+", "-"), ("*", "/"), ("^",)]
+
+    def __init__(self, text, sheet):
+        self.tokens = tokenize(text)
+        self.pos = 0
+        self.sheet = sheet
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self, value=None):
+        tok = self.peek()
+        if value is not None and tok[1] != value:
+            raise FormulaError("#ERROR!")
+        self.pos += 1
+        return tok
+
+    def parse(self):
+        node = self.expr(0)
+        if self.pos != len(self.tokens):
+            raise FormulaError("#ERROR!")
+        return node
+
+    def expr(self, level):
+        if level == len(self.LEVELS):
+            return self.unary()
+        node = self.expr(level + 1)
+        while self.peek()[0] == "op" and self.peek()[1] in self.LEVELS[level]:
+            op = self.take()[1]
+            node = ("bin", op, node, self.expr(level + 1))
+        return node
+
+    def unary(self):
+        if self.peek() == ("op", "-"):
+            self.take()
+            return ("neg", self.unary())
+        if self.peek() == ("op", "+"):
+            self.take()
+            return self.unary()
+        return self.atom()
+
+    def atom(self):
+        kind, text = self.take()
+        if kind == "num":
+            return ("lit", float(text))
+        if kind == "str":
+            return ("lit", text[1:-1].replace('""', '"'))
+        if kind == "bool":
+            return ("lit", text == "TRUE")
+        if kind == "ref":
+            return parse_ref(text, self.sheet)
+        if kind == "func":
+            self.take("(")
+            args = []
+            if self.peek() != ("op", ")"):
+                args.append(self.expr(0))
+                while self.peek() == ("op", ","):
+                    self.take()
+                    args.append(self.expr(0))
+            self.take(")")
+            return ("call", text.upper(), args)
+        if (kind, text) == ("op", "("):
+            node = self.expr(0)
+            self.take(")")
+            return node
+        raise FormulaError("#ERROR!")
+
+
+# ─── Values ──────────────────────────────────────────────────────────────────
+def typed(text):
+    """A literal cell as USER_ENTERED stores it."""
+    if not isinstance(text, str):
+        return text
+    s = text.strip()
+    if s == "":
+        return ""
+    if s in ("TRUE", "FALSE"):
+        return s == "TRUE"
+    try:
+        if s.endswith("%"):
+            return float(s[:-1]) / 100
+        return float(s)
+    except ValueError:
+        return text
+
+
+def to_number(value):
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float)):
+        return float(value)
+    if value == "" or value is None:
+        return 0.0
+    raise FormulaError("#VALUE!")
+
+
+def key(value):
+    """Hash key with Sheets matching rules (case-insensitive text)."""
+    if isinstance(value, str):
+        return value.lower()
+    if isinstance(value, bool):
+        return ("bool", value)
+    return float(value)
+
+
+def compare(op, a, b):
+    if isinstance(a, str) and isinstance(b, str):
+        a, b = a.lower(), b.lower()
+    elif isinstance(a, str) != isinstance(b, str):
+        if op in ("=", "<>"):
+            equal = (a == "" and b == 0) or (b == "" and a == 0)
+            return equal if op == "=" else not equal
+        # Sheets orders numbers before text
+        a, b = (0, 1) if isinstance(b, str) else (1, 0)
+    return {"=": a == b, "<>": a != b, "<": a < b, ">": a > b,
+            "<=": a <= b, ">=": a >= b}[op]
+
+
+def broadcast(fn, *args):
+    """Apply fn element-wise when any argument is an array (list)."""
+    arrays = [a for a in args if isinstance(a, list)]
+    if not arrays:
+        return fn(*args)
+    n = len(arrays[0])
+    if any(len(a) != n for a in arrays):
+        raise FormulaError("#VALUE!")
+    return [fn(*(a[i] if isinstance(a, list) else a for a in args)) for i in range(n)]
+
+
+# ─── Workbook ────────────────────────────────────────────────────────────────
+class Workbook:
+    """
+    sheets[name] = rows as uploaded (row 0 is the header = sheet row 1).
+    value(sheet, r, c) evaluates lazily and memoizes; lookup indexes are
+    built on first use and shared by every formula that hits the range.
+    """
+
+    def __init__(self, sheets):
+        self.sheets = sheets
+        self._values = {}
+        self._active = set()
+        self._ast = {}
+        self._indexes = {}
+
+    # ── cells ──
+    def raw(self, sheet, r, c):
+        rows = self.sheets.get(sheet)
+        if rows is None:
+            raise FormulaError("#REF!")
+        if r < len(rows) and c < len(rows[r]):
+            return rows[r][c]
+        return ""
+
+    def value(self, sheet, r, c):
+        cell = (sheet, r, c)
+        if cell in self._values:
+            return self._values[cell]
+        raw = self.raw(sheet, r, c)
+        if not (isinstance(raw, str) and raw.startswith("=")):
+            result = typed(raw)
+        else:
+            if cell in self._active:
+                raise FormulaError("#REF!")   # circular dependency
+            self._active.add(cell)
+            try:
+                result = self.eval(self._parse(raw, sheet), sheet)
+                if isinstance(result, list):
+                    result = result[0] if result else ""
+            except FormulaError as e:
+                result = e
+            finally:
+                self._active.discard(cell)
+        self._values[cell] = result
+        return result
+
+    def _parse(self, formula, sheet):
+        ast = self._ast.get(formula)
+        if ast is None:
+            try:
+                ast = Parser(formula[1:], sheet).parse()
+            except FormulaError as e:
+                ast = ("error", e.code)
+            self._ast[formula] = ast
+        return ast
+
+    def cell_value(self, sheet, r, c):
+        """Evaluated cell; errors raise FormulaError."""
+        v = self.value(sheet, r, c)
+        if isinstance(v, FormulaError):
+            raise v
+        return v
+
+    # ── ranges ──
+    def bounds(self, node):
+        _, sheet, c0, r0, c1, r1 = node
+        if sheet not in self.sheets:
+            raise FormulaError("#REF!")
+        r0 = 0 if r0 is None else r0
+        r1 = len(self.sheets[sheet]) - 1 if r1 is None else r1
+        return sheet, c0, r0, c1, r1
+
+    def column(self, node, offset=0):
+        """One column of a range as a list of evaluated values."""
+        sheet, c0, r0, _, r1 = self.bounds(node)
+        return [self.value(sheet, r, c0 + offset) for r in range(r0, r1 + 1)]
+
+    def index(self, node, kind, *extra):
+        """
+        Hash index over criteria ranges, built once per (ranges, kind):
+          'first'  key → first row          (VLOOKUP; node = table)
+          'count'  key → count              (COUNTIF)
+          'rows'   key tuple → [row offset] (SUMIF/SUMIFS; node + extra = criteria ranges)
+        Sum ranges are not read here: sum_rows() evaluates only the matching
+        rows, so a cost cascade like SUMIF(A:A, C5, J:J) in I5 does not
+        depend on J5 itself.
+        """
+        ident = (kind, self.bounds(node)) + tuple(self.bounds(e) for e in extra)
+        idx = self._indexes.get(ident)
+        if idx is not None:
+            return idx
+        keys = self.column(node)
+        idx = {}
+        if kind == "first":
+            r0 = self.bounds(node)[2]
+            for i, k in enumerate(keys):
+                if not isinstance(k, FormulaError):
+                    idx.setdefault(key(k), r0 + i)
+        elif kind == "count":
+            for k in keys:
+                if not isinstance(k, FormulaError) and k != "":
+                    idx[key(k)] = idx.get(key(k), 0) + 1
+        elif kind == "rows":
+            columns = [keys] + [self.column(e) for e in extra]
+            for i in range(len(keys)):
+                ks = tuple(c[i] if i < len(c) else "" for c in columns)
+                if any(isinstance(k, FormulaError) for k in ks):
+                    continue
+                idx.setdefault(tuple(key(k) for k in ks), []).append(i)
+        self._indexes[ident] = idx
+        return idx
+
+    def sum_rows(self, sum_range, offsets):
+        """Σ of the numeric cells of `sum_range` at the given row offsets."""
+        sheet, c0, r0, _, r1 = self.bounds(sum_range)
+        total = 0.0
+        for i in offsets:
+            if r0 + i > r1:
+                continue
+            v = self.cell_value(sheet, r0 + i, c0)
+            if isinstance(v, (int, float)) and not isinstance(v, bool):
+                total += v
+        return total
+
+    # ── evaluation ──
+    def eval(self, node, sheet):
+        kind = node[0]
+        if kind == "lit":
+            return node[1]
+        if kind == "error":
+            raise FormulaError(node[1])
+        if kind == "cell":
+            _, ref_sheet, c, r = node
+            return self.cell_value(ref_sheet, r, c)
+        if kind == "range":
+            # A bare range in a scalar/array context is its first column
+            values = self.column(node)
+            for v in values:
+                if isinstance(v, FormulaError):
+                    raise v
+            return values
+        if kind == "neg":
+            return broadcast(lambda a: -to_number(a), self.eval(node[1], sheet))
+        if kind == "bin":
+            return self.binary(node[1], self.eval(node[2], sheet), self.eval(node[3], sheet))
+        if kind == "call":
+            fn = FUNCTIONS.get(node[1])
+            if fn is None:
+                raise FormulaError("#NAME?")
+            return fn(self, sheet, node[2])
+        raise FormulaError("#ERROR!")
+
+    @staticmethod
+    def binary(op, a, b):
+        if op in ("=", "<>", "<", ">", "<=", ">="):
+            return broadcast(lambda x, y: compare(op, x, y), a, b)
+        if op == "&":
+            return broadcast(lambda x, y: f"{text(x)}{text(y)}", a, b)
+
+        def arith(x, y):
+            x, y = to_number(x), to_number(y)
+            if op == "+":
+                return x + y
+            if op == "-":
+                return x - y
+            if op == "*":
+                return x * y
+            if op == "^":
+                return x ** y
+            if y == 0:
+                raise FormulaError("#DIV/0!")
+            return x / y
+        return broadcast(arith, a, b)
+
+    def evaluate(self, names=None):
+        """{sheet: rows of evaluated values}; errors come back as their code."""
+        out = {}
+        for name in names or self.sheets:
+            rows = self.sheets[name]
+            out[name] = [[display(self.value(name, r, c)) for c in range(len(row))]
+                         for r, row in enumerate(rows)]
+        return out
+
+
+def text(value):
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else repr(value)
+    return str(value)
+
+
+def display(value):
+    if isinstance(value, FormulaError):
+        return value.code
+    if isinstance(value, float):
+        value = round(value, 6)
+    return text(value)
+
+
+# ─── Functions ───────────────────────────────────────────────────────────────
+# Each takes (workbook, sheet, arg nodes) so IF/IFERROR can evaluate lazily
+def fn_iferror(wb, sheet, args):
+    try:
+        value = wb.eval(args[0], sheet)
+        if isinstance(value, FormulaError):
+            raise value
+        return value
+    except FormulaError:
+        return wb.eval(args[1], sheet) if len(args) > 1 else ""
+
+
+def truthy(value):
+    if isinstance(value, str):
+        if value.upper() in ("TRUE", "FALSE"):
+            return value.upper() == "TRUE"
+        if value == "":
+            return False
+        raise FormulaError("#VALUE!")
+    return bool(value)
+
+
+def fn_if(wb, sheet, args):
+    cond = wb.eval(args[0], sheet)
+    if isinstance(cond, list):
+        cond = cond[0] if cond else False
+    if truthy(cond):
+        return wb.eval(args[1], sheet)
+    return wb.eval(args[2], sheet) if len(args) > 2 else False
+
+
+def fn_or(wb, sheet, args):
+    result = False
+    for a in args:
+        v = wb.eval(a, sheet)
+        for item in (v if isinstance(v, list) else [v]):
+            result = result or truthy(item)
+    return result
+
+
+def fn_vlookup(wb, sheet, args):
+    lookup = wb.eval(args[0], sheet)
+    table = args[1]
+    if table[0] != "range":
+        raise FormulaError("#REF!")
+    col = int(to_number(wb.eval(args[2], sheet)))
+    exact = len(args) < 4 or not truthy(wb.eval(args[3], sheet))
+    if not exact:
+        raise FormulaError("#N/A")      # approximate match is not used by the workbook
+    ref_sheet, c0, _, c1, _ = wb.bounds(table)
+    if col < 1 or col > c1 - c0 + 1:
+        raise FormulaError("#REF!")
+    idx = wb.index(table, "first")
+
+    def one(k):
+        if isinstance(k, FormulaError):
+            raise k
+        row = idx.get(key(k))
+        if row is None:
+            raise FormulaError("#N/A")
+        return wb.cell_value(ref_sheet, row, c0 + col - 1)
+    return broadcast(one, lookup)
+
+
+def _criterion(wb, sheet, node):
+    value = wb.eval(node, sheet)
+    if isinstance(value, str) and value[:1] in "<>=" and value not in ("", "="):
+        raise FormulaError("#N/A")      # operator criteria are not used by the workbook
+    return value
+
+
+def fn_sumif(wb, sheet, args):
+    crit_range = args[0]
+    sum_range = args[2] if len(args) > 2 else args[0]
+    idx = wb.index(crit_range, "rows")
+    crit = _criterion(wb, sheet, args[1])
+    return broadcast(lambda k: wb.sum_rows(sum_range, idx.get((key(k),), ())), crit)
+
+
+def fn_sumifs(wb, sheet, args):
+    sum_range, pairs = args[0], args[1:]
+    ranges = pairs[0::2]
+    idx = wb.index(ranges[0], "rows", *ranges[1:])
+    crits = [_criterion(wb, sheet, node) for node in pairs[1::2]]
+    return broadcast(lambda *ks: wb.sum_rows(sum_range, idx.get(tuple(key(k) for k in ks), ())), *crits)
+
+
+def fn_countif(wb, sheet, args):
+    idx = wb.index(args[0], "count")
+    crit = _criterion(wb, sheet, args[1])
+    return broadcast(lambda k: float(idx.get(key(k), 0)), crit)
+
+
+def fn_sumproduct(wb, sheet, args):
+    arrays = []
+    for a in args:
+        v = wb.eval(a, sheet)
+        arrays.append(v if isinstance(v, list) else [v])
+    n = len(arrays[0])
+    if any(len(a) != n for a in arrays):
+        raise FormulaError("#VALUE!")
+    total = 0.0
+    for i in range(n):
+        product = 1.0
+        for a in arrays:
+            v = a[i]
+            if isinstance(v, FormulaError):
+                raise v
+            # non-numeric entries count as zero
+            product *= v if isinstance(v, (int, float)) and not isinstance(v, bool) else 0.0
+        total += product
+    return total
+
+
+def fn_ceiling(wb, sheet, args):
+    x = to_number(wb.eval(args[0], sheet))
+    step = to_number(wb.eval(args[1], sheet)) if len(args) > 1 else 1.0
+    if step == 0:
+        return 0.0
+    if x > 0 and step < 0:
+        raise FormulaError("#NUM!")
+    return math.ceil(round(x / step, 12)) * step
+
+
+def fn_round(wb, sheet, args):
+    x = to_number(wb.eval(args[0], sheet))
+    places = int(to_number(wb.eval(args[1], sheet))) if len(args) > 1 else 0
+    exp = Decimal(1).scaleb(-places)
+    return float(Decimal(repr(x)).quantize(exp, rounding=ROUND_HALF_UP))
+
+
+def fn_left(wb, sheet, args):
+    s = text(wb.eval(args[0], sheet))
+    n = int(to_number(wb.eval(args[1], sheet))) if len(args) > 1 else 1
+    return s[:n]
+
+
+FUNCTIONS = {
+    "IFERROR":    fn_iferror,
+    "IF":         fn_if,
+    "OR":         fn_or,
+    "VLOOKUP":    fn_vlookup,
+    "SUMIF":      fn_sumif,
+    "SUMIFS":     fn_sumifs,
+    "COUNTIF":    fn_countif,
+    "SUMPRODUCT": fn_sumproduct,
+    "CEILING":    fn_ceiling,
+    "ROUND":      fn_round,
+    "LEFT":       fn_left,
+}
+
+
+# ─── Loading / CLI ───────────────────────────────────────────────────────────
+def load_workbook(sheet_map=SHEET_MAP):
+    """Workbook of every sheet upload_to_sheets would send (missing files are skipped)."""
+    sheets = {}
+    for table_file, sheet_name in sheet_map:
+        try:
+            sheets[sheet_name] = load_rows(table_file)
+        except FileNotFoundError:
+            print(f"WARNING: {table_file} not found, [{sheet_name}] left out")
+    return Workbook(sheets)
+
+
+def check(values):
+    """(sheet, cell, value) for every YIELD ERR / OVERLOADED / error result."""
+    problems = []
+    for name, rows in values.items():
+        for r, row in enumerate(rows):
+            for c, v in enumerate(row):
+                if v in ("YIELD ERR", "OVERLOADED") or v in ERROR_CODES:
+                    problems.append((name, f"{col_letter(c)}{r + 1}", v))
+    return problems
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    wb = load_workbook()
+
+    start = time.perf_counter()
+    values = wb.evaluate()
+    elapsed = (time.perf_counter() - start) * 1000
+    cells = sum(len(row) for rows in values.values() for row in rows)
+
+    if "--check" in sys.argv:
+        problems = check(values)
+        for name, ref, v in problems:
+            print(f"  [{name}] {ref}: {v}")
+        print(f"{len(problems)} problem cells; {cells} cells evaluated in {elapsed:.1f} ms")
+        sys.exit(1 if problems else 0)
+
+    for name in args or values:
+        print(f"\n[{name}]")
+        for row in values.get(name, []):
+            print("  " + " | ".join(row))
+    print(f"\n{cells} cells evaluated in {elapsed:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
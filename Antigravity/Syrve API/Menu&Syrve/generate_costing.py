@@ -1,185 +1,194 @@
-import csv
+import sys
 import urllib.request
-import os
 import datetime
+from functools import lru_cache
+
+from bom_engine import BomIndex
+from build_manifest import BuildManifest
+from cost_rollup import (FORMULA_MODE, CostRollup, cell, load_sale_ratios,
+                         price_per_base_unit, round_half_up)
+from model import BomLine, Item, ModifierOption, read_table
+from modifier_bounds import bounds_by_schema, percentile
+from nutrition import NUTRIENTS, NutritionRollup
+from purchasing import purchasing_data
+from table_render import Table, iter_jsonl, read_jsonl_table, write_html
+from version_store import save_table
+
+# "--no-html" writes only the .jsonl data artifacts (what upload_to_sheets reads)
+HTML_VIEW = '--no-html' not in sys.argv
 
 # Versioning
 version = datetime.datetime.now().strftime("v%Y%m%d_%H%M")
 
-def save_versioned_html(filename, content):
-    base, ext = os.path.splitext(filename)
-    versioned_name = f"{base}_{version}{ext}"
-    with open(versioned_name, "w", encoding="utf-8") as f:
-        f.write(content)
-    # Also save as "latest" for easy stable access
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
-
-# Read Nomenclature
-nom = {}
-with open('Nomenclature.tsv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f, delimiter='\t')
-    for row in reader:
-        nom[row['Name'].strip()] = row['Short_Code'].strip()
+
+# Read Nomenclature (lazily, so up-to-date tables never parse it)
+@lru_cache(maxsize=None)
+def load_nomenclature():
+    nom = {}
+    nom_by_code = {}
+    for item in read_table('Nomenclature.tsv', Item):
+        nom[item.name.strip()] = item.code.strip()
+        nom_by_code[item.code.strip()] = item
+    return nom, nom_by_code
 
 def get_code(name):
+    nom, _ = load_nomenclature()
     code = nom.get(name.strip())
     if not code:
         print(f"WARNING: No Short_Code found for item '{name}'")
     return code or "MISSING_CODE"
 
-purchasing_data = [
-    # Item_Name, Purchase_Unit, Purchase_Price, Base_Unit_Ratio
-    # ── Purchased Raw Ingredients ────────────────────────────────────────────
-    ("Fresh Carrot",           "kg",          "50",  "1"),
-    ("Onion",                  "kg",          "40",  "1"),
-    ("Olive Oil EV",           "Bottle 1L",   "800", "1"),
-    ("Raw Beetroot",           "kg",          "35",  "1"),
-    ("Fresh Potato",           "kg",          "45",  "1"),
-    ("Lemon Juice",            "Bottle 1L",   "300", "1"),
-    ("Garlic",                 "kg",          "250", "1"),
-    ("Shishka Mix Spices",     "Pack 500g",   "600", "0.5"),
-    # ── Zero-Waste Broth Inputs (cost=0; these are internal trimming by-products) ──
-    ("RO Water",               "Liter",       "2",   "1"),   # nominal water cost
-    ("Root Trimmings",         "kg",          "0",   "1"),   # carrot/celery offcuts
-    ("Onion Trimmings",        "kg",          "0",   "1"),   # outer layers
-    ("Herb Stems",             "kg",          "0",   "1"),   # cilantro/parsley/dill
-    ("Mushroom Stems",         "kg",          "0",   "1"),   # champignon / lion's mane
-    ("Cabbage Cores",          "kg",          "0",   "1"),   # cauliflower/broccoli cores
-    # ── Modifiers (purchased) ────────────────────────────────────────────────
-    ("Sous-vide Chicken",      "kg",          "450", "1"),
-    ("Red Beans",              "Can 400g",    "120", "0.4"),
-    ("Sour Cream",             "Bucket 1kg",  "350", "1"),
-    ("Coconut Yogurt",         "Bucket 1kg",  "550", "1"),
-    ("Ancient Crunch",         "kg",          "800", "1"),
-    ("Greens",                 "kg",          "600", "1"),
-]
+@lru_cache(maxsize=None)
+def load_prices():
+    return price_per_base_unit(get_code)
+
+@lru_cache(maxsize=None)
+def load_bom_rows():
+    return read_table('BOM.tsv', BomLine)
+
+@lru_cache(maxsize=None)
+def cost_rollup():
+    # Cost cascade computed in Python (children before parents); see cost_rollup.py
+    _, nom_by_code = load_nomenclature()
+    return CostRollup(load_bom_rows(), nom_by_code, load_prices(), load_sale_ratios())
+
+@lru_cache(maxsize=None)
+def load_mod_schemes():
+    return read_table('Modifier_Schemes.tsv', ModifierOption)
+
+@lru_cache(maxsize=None)
+def nutrition_rollup():
+    # Nutrients pushed up the BOM from RAW/modifier values; see nutrition.py
+    _, nom_by_code = load_nomenclature()
+    return NutritionRollup(BomIndex(load_bom_rows(), nom_by_code), load_sale_ratios(),
+                           load_mod_schemes())
+
+def serving_cost(row):
+    # Cost per serving = portion_kg * price_per_kg
+    return row.portion_kg * load_prices().get(row.item, 0.0)
+
+@lru_cache(maxsize=None)
+def modifier_bounds():
+    # Cost range over every modifier combination of each schema; see modifier_bounds.py
+    return bounds_by_schema(load_mod_schemes(), serving_cost)
+
+def default_modifier_costs():
+    """dish_code → sum of default-modifier serving costs."""
+    costs = {}
+    for row in load_mod_schemes():
+        if row.default_text != "0":
+            dish = row.dish
+            costs[dish] = costs.get(dish, 0.0) + serving_cost(row)
+    return costs
 
 # Generate Purchasing_Inventory HTML
-purch_html = """<!DOCTYPE html>
-<html><head><meta charset="utf-8"></head><body><table>
-<tr>
-  <th>SKU_ID</th><th>Item_Name</th><th>Purchase_Unit</th>
-  <th>Purchase_Price</th><th>Base_Unit_Ratio</th><th>Price_per_Base_Unit</th><th>Last_Updated</th>
-</tr>
-"""
-for idx, item in enumerate(purchasing_data):
-    name, p_unit, p_price, ratio = item
-    code = get_code(name)
-    row_num = idx + 2
-    formula = f"=D{row_num}/E{row_num}"
-    purch_html += f"<tr><td>{code}</td><td>{name}</td><td>{p_unit}</td><td>{p_price}</td><td>{ratio}</td><td>{formula}</td><td>2026-03-01</td></tr>\n"
-purch_html += "</table></body></html>"
-
-save_versioned_html("Purchasing_Inventory_table.html", purch_html)
-
-# Real Yield percentages based on common culinary averages
-yield_dict = {
-    "Fresh Carrot": "0.8", # 80% after peeling/trimming
-    "Onion": "0.85",
-    "Raw Beetroot": "0.7", # 70% after baking/peeling as requested
-    "Fresh Potato": "0.75",
-    "Garlic": "0.95"
-}
-
-bom_html = """<!DOCTYPE html>
-<html><head><meta charset="utf-8"></head><body><table>
-<tr>
-  <th>Parent_Code</th><th>Parent_Name</th><th>Child_Code</th><th>Child_Name</th>
-  <th>QuantityGross</th><th>Unit</th><th>Yield_Percentage</th><th>QuantityNet</th>
-  <th>Unit_Cost</th><th>Total_Line_Cost</th>
-</tr>
-"""
-
-with open('BOM.tsv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f, delimiter='\t')
-    for idx, row in enumerate(reader):
-        row_num = idx + 2
-        child_name = row['Child_Name']
-        y_perc = yield_dict.get(child_name, "1")
-        
-        # formulas for Google Sheets (QuantityNet = Gross * Yield)
-        qnet_formula = f"=E{row_num}*G{row_num}"
-        
-        # Unit Cost Formula: (Cascade logic)
-        # If Child_ID is present as a Parent_ID, calculate its unit cost from nested ingredients.
-        # Else, lookup from Purchasing_Inventory.
-        # The sum of Total_Line_Cost for all ingredients of the SF / The sum of QuantityNet.
-        unit_formula = f'=IFERROR(IF(COUNTIF(A:A, C{row_num})>0, SUMIF(A:A, C{row_num}, J:J)/SUMIF(A:A, C{row_num}, H:H), VLOOKUP(C{row_num}, Purchasing_Inventory!A:G, 6, FALSE)), 0)'
-        
-        # Total Line Cost Formula (Gross Weight * Unit Cost)
-        total_formula = f"=E{row_num}*I{row_num}"
-        
-        bom_html += f"<tr><td>{row['Parent_Code']}</td><td>{row['Parent_Name']}</td>"
-        bom_html += f"<td>{row['Child_Code']}</td><td>{row['Child_Name']}</td>"
-        bom_html += f"<td>{row['QuantityGross']}</td><td>{row['Unit']}</td>"
-        bom_html += f"<td>{y_perc}</td><td>{qnet_formula}</td>"
-        bom_html += f"<td>{unit_formula}</td><td>{total_formula}</td></tr>\n"
-
-bom_html += "</table></body></html>"
-
-save_versioned_html("BOM_Costing_table.html", bom_html)
+PURCHASING_COLUMNS = ["SKU_ID", "Item_Name", "Purchase_Unit",
+                      "Purchase_Price", "Base_Unit_Ratio", "Price_per_Base_Unit", "Last_Updated"]
+
+def build_purchasing_inventory():
+    def rows():
+        for idx, item in enumerate(purchasing_data):
+            name, p_unit, p_price, ratio = item
+            code = get_code(name)
+            row_num = idx + 2
+            formula = f"=D{row_num}/E{row_num}" if FORMULA_MODE else cell(float(p_price) / float(ratio))
+            yield [code, name, p_unit, p_price, ratio, formula, "2026-03-01"]
+
+    return Table(PURCHASING_COLUMNS, rows())
+
+
+BOM_COSTING_COLUMNS = [
+    "Parent_Code", "Parent_Name", "Child_Code", "Child_Name",
+    "QuantityGross", "Unit", "Yield_Percentage", "QuantityNet",
+    "Unit_Cost", "Total_Line_Cost",
+]
+
+def build_bom_costing():
+    bom_rows = load_bom_rows()
+    rollup = cost_rollup()
+
+    def rows():
+        for idx, row in enumerate(bom_rows):
+            row_num = idx + 2
+            line = rollup.lines[idx]
+            y_perc = line["yield"]
+
+            if FORMULA_MODE:
+                # formulas for Google Sheets (QuantityNet = Gross * Yield)
+                qnet_formula = f"=E{row_num}*G{row_num}"
+
+                # Unit Cost Formula: (Cascade logic)
+                # If Child_ID is present as a Parent_ID, calculate its unit cost from nested ingredients.
+                # Else, lookup from Purchasing_Inventory.
+                # The sum of Total_Line_Cost for all ingredients of the SF / The sum of QuantityNet.
+                unit_formula = f'=IFERROR(IF(COUNTIF(A:A, C{row_num})>0, SUMIF(A:A, C{row_num}, J:J)/SUMIF(A:A, C{row_num}, H:H), VLOOKUP(C{row_num}, Purchasing_Inventory!A:G, 6, FALSE)), 0)'
+
+                # Total Line Cost Formula (Gross Weight * Unit Cost)
+                total_formula = f"=E{row_num}*I{row_num}"
+            else:
+                qnet_formula  = cell(line["net"])
+                unit_formula  = cell(line["unit_cost"])
+                total_formula = cell(line["line_cost"])
+
+            yield [
+                row['Parent_Code'], row['Parent_Name'], row['Child_Code'], row['Child_Name'],
+                row['QuantityGross'], row['Unit'], y_perc, qnet_formula,
+                unit_formula, total_formula,
+            ]
+
+    return Table(BOM_COSTING_COLUMNS, rows())
+
 
 # ── MODIFIER COST TABLE (v3) ─────────────────────────────────────────────────
 # Reads Modifier_Schemes.tsv (which now has Portion_Size_kg column).
 # For each modifier item calculates:
 #   Cost_per_Serving = Portion_Size_kg * Price_per_kg (from Purchasing_Inventory)
 # Then builds a Dish Cost Summary with Base + Default modifier cost.
+MODIFIER_COST_COLUMNS = [
+    "Schema_Code", "Dish_Code", "Dish_Name",
+    "Group_Code", "Group_Name", "Min", "Max",
+    "Item_Code", "Item_Name", "Default_Qty",
+    "Portion_Size_kg",
+    "Price_per_kg", "Cost_per_Serving", "Included_in_Default",
+]
+
+def build_modifier_costs():
+    mod_schemes = load_mod_schemes()
+
+    def rows():
+        for idx, row in enumerate(mod_schemes):
+            row_num = idx + 2
+            item_code  = row['Modifier_Item_Code']
+            default    = row['DefaultAmount_Item']
+
+            # Included in default dish cost? Yes if Default_Qty > 0
+            included = "Yes" if str(default) != "0" else "No"
+
+            if FORMULA_MODE:
+                # Price per kg: lookup from Purchasing_Inventory col F (Price_per_Base_Unit)
+                price_formula = (
+                    f'=IFERROR(VLOOKUP("{item_code}", Purchasing_Inventory!A:F, 6, FALSE), 0)'
+                )
+                # Cost per serving = portion_kg * price_per_kg * default_qty
+                # If portion_kg and price are in same unit (kg), this gives cost per serving
+                cost_formula = (
+                    f'=K{row_num} * L{row_num}'
+                )
+            else:
+                price_formula = cell(load_prices().get(item_code, 0.0))
+                cost_formula  = cell(serving_cost(row))
+
+            yield [
+                row['Schema_Code'], row['Target_Dish_Code'], row['Target_Dish_Name'],
+                row['Modifier_Group_Code'], row['Modifier_Group_Name'],
+                row['MinAmount_Group'], row['MaxAmount_Group'],
+                item_code, row['Modifier_Item_Name'], default,
+                row['Portion_Size_kg'],
+                price_formula, cost_formula, included,
+            ]
+
+    return Table(MODIFIER_COST_COLUMNS, rows())
 
-mod_schemes = []
-with open('Modifier_Schemes.tsv', 'r', encoding='utf-8') as f:
-    mod_schemes = list(csv.DictReader(f, delimiter='\t'))
-
-# Modifier Breakdown sheet
-mod_html = """<!DOCTYPE html>
-<html><head><meta charset="utf-8"></head><body><table>
-<tr>
-  <th>Schema_Code</th><th>Dish_Code</th><th>Dish_Name</th>
-  <th>Group_Code</th><th>Group_Name</th><th>Min</th><th>Max</th>
-  <th>Item_Code</th><th>Item_Name</th><th>Default_Qty</th>
-  <th>Portion_Size_kg</th>
-  <th>Price_per_kg</th><th>Cost_per_Serving</th><th>Included_in_Default</th>
-</tr>
-"""
-for idx, row in enumerate(mod_schemes):
-    row_num = idx + 2
-    item_code  = row['Modifier_Item_Code']
-    item_name  = row['Modifier_Item_Name']
-    default    = row['DefaultAmount_Item']
-    portion_kg = row['Portion_Size_kg']
-
-    # Price per kg: lookup from Purchasing_Inventory col F (Price_per_Base_Unit)
-    price_formula = (
-        f'=IFERROR(VLOOKUP("{item_code}", Purchasing_Inventory!A:F, 6, FALSE), 0)'
-    )
-    # Cost per serving = portion_kg * price_per_kg * default_qty
-    # If portion_kg and price are in same unit (kg), this gives cost per serving
-    cost_formula = (
-        f'=K{row_num} * L{row_num}'
-    )
-    # Included in default dish cost? Yes if Default_Qty > 0
-    included = "Yes" if str(default) != "0" else "No"
-
-    mod_html += (
-        f"<tr>"
-        f"<td>{row['Schema_Code']}</td>"
-        f"<td>{row['Target_Dish_Code']}</td>"
-        f"<td>{row['Target_Dish_Name']}</td>"
-        f"<td>{row['Modifier_Group_Code']}</td>"
-        f"<td>{row['Modifier_Group_Name']}</td>"
-        f"<td>{row['MinAmount_Group']}</td>"
-        f"<td>{row['MaxAmount_Group']}</td>"
-        f"<td>{item_code}</td>"
-        f"<td>{item_name}</td>"
-        f"<td>{default}</td>"
-        f"<td>{portion_kg}</td>"
-        f"<td>{price_formula}</td>"
-        f"<td>{cost_formula}</td>"
-        f"<td>{included}</td>"
-        f"</tr>\n"
-    )
-mod_html += "</table></body></html>"
-save_versioned_html("Modifier_Costs_table.html", mod_html)
 
 # ── DISH COST SUMMARY (v3) ───────────────────────────────────────────────────
 # One row per SALE dish with:
@@ -187,50 +196,168 @@ save_versioned_html("Modifier_Costs_table.html", mod_html)
 #   Default_Mod_Cost = sum of default-modifier serving costs
 #   Total_Default_Cost = Base + Default
 #   Suggested_Price = Total * 3 (food cost 33%)
+SUMMARY_COLUMNS = [
+    "Dish_Code", "Dish_Name",
+    "Base_BOM_Cost",
+    "Default_Modifier_Cost",
+    "Total_Default_Cost",
+    "Food_Cost_Pct_Target",
+    "Suggested_Min_Price",
+    "Min_Total_Cost",
+    "Expected_Total_Cost",
+    "Max_Total_Cost",
+]
+
+def build_dish_cost_summary():
+    dishes = [("SALE-BORSCH_BIOACTIVE", "Borsch Bio-Active (portion)")]
+    schema_of = {row.dish: row.schema for row in load_mod_schemes()}
+
+    def rows():
+        for idx, (dish_code, dish_name) in enumerate(dishes):
+            row_num = idx + 2
+            fc_pct = "33%"
+            if FORMULA_MODE:
+                # Base BOM cost: from BOM_Costing sheet — sum of Total_Line_Cost where Parent_Code=dish_code
+                base_cost = (
+                    f'=IFERROR(SUMIF(BOM_Costing!A:A, "{dish_code}", BOM_Costing!J:J), 0)'
+                )
+                # Default modifier cost: from Modifier_Costs — sum M where Dish_Code=dish_code AND Included=Yes
+                default_mod = (
+                    f'=IFERROR(SUMPRODUCT('
+                    f'(Modifier_Costs!B:B="{dish_code}")*'
+                    f'(Modifier_Costs!N:N="Yes")*'
+                    f'Modifier_Costs!M:M), 0)'
+                )
+                total = f"=C{row_num}+D{row_num}"
+                suggested = f"=ROUND(E{row_num}/0.33, 0)"
+            else:
+                base = cost_rollup().base_cost(dish_code)
+                mods = default_modifier_costs().get(dish_code, 0.0)
+                base_cost   = cell(base)
+                default_mod = cell(mods)
+                total       = cell(base + mods)
+                suggested   = cell(round_half_up((base + mods) / 0.33))
+
+            # Base cost plus the modifier range of the dish's schema (values:
+            # the combination bounds have no Sheets equivalent)
+            bounds = modifier_bounds().get(schema_of.get(dish_code))
+            if bounds and bounds.combinations:
+                extremes = [bounds.min, bounds.expected, bounds.max]
+            else:
+                extremes = [0.0, 0.0, 0.0]
+            if FORMULA_MODE:
+                totals = [f"=C{row_num}+{cell(round(v, 2))}" for v in extremes]
+            else:
+                totals = [cell(round(base + v, 2)) for v in extremes]
+
+            yield [dish_code, dish_name, base_cost, default_mod, total, fc_pct, suggested] + totals
+
+    return Table(SUMMARY_COLUMNS, rows())
+
+
+# ── MODIFIER COST BOUNDS (derived) ──────────────────────────────────────────
+# One row per modifier schema: the cost of its modifiers over every valid
+# combination (MinAmount/MaxAmount per group), computed by modifier_bounds.py
+# without listing them. Expected/percentiles weight every combination equally.
+BOUNDS_COLUMNS = [
+    "Schema_Code", "Dish_Code", "Dish_Name", "Groups", "Combinations",
+    "Min_Cost", "Expected_Cost", "Max_Cost", "Std_Dev",
+    "P10_Cost", "Median_Cost", "P90_Cost", "Default_Cost",
+]
+
+def build_modifier_bounds():
+    _, nom_by_code = load_nomenclature()
+    dishes = {}
+    for row in load_mod_schemes():
+        dishes.setdefault(row.schema, row.dish)
+    defaults = default_modifier_costs()
+
+    def rows():
+        for schema, bounds in modifier_bounds().items():
+            dish = dishes[schema]
+            item = nom_by_code.get(dish)
+            name = item.name if item else ""
+            if not bounds.combinations:
+                yield [schema, dish, name, bounds.groups, 0] + [""] * 7 + [cell(defaults.get(dish, 0.0))]
+                continue
+            yield ([schema, dish, name, bounds.groups, bounds.combinations,
+                   cell(bounds.min), cell(round(bounds.expected, 2)), cell(bounds.max),
+                   cell(round(bounds.std, 2))]
+                   + [cell(round(percentile(bounds, p), 2)) for p in (0.1, 0.5, 0.9)]
+                   + [cell(defaults.get(dish, 0.0))])
+
+    return Table(BOUNDS_COLUMNS, rows())
+
+
+# ── NUTRITION (derived) ──────────────────────────────────────────────────────
+# One row per PF / SALE item with a BOM: per portion (SALE: with default
+# modifiers; PF: one Sale_Ratio) and per 100 g, derived by nutrition.py.
+# Estimate_kcal_per100g is the hand-typed Nomenclature value, for comparison;
+# Missing_Data lists leaves without nutrition values; the totals exclude them.
+NUTRITION_COLUMNS = (
+    ["Product_Code", "Product_Name", "Portion_Size_kg"]
+    + [f"{n}_per_portion" for n in NUTRIENTS]
+    + [f"{n}_per100g" for n in NUTRIENTS]
+    + ["Estimate_kcal_per100g", "Missing_Data"]
+)
+
+def build_nutrition():
+    _, nom_by_code = load_nomenclature()
+    menu = nutrition_rollup().menu()
+
+    def rows():
+        for code, item in nom_by_code.items():
+            if code not in menu:
+                continue
+            weight, portion, per_100g, missing = menu[code]
+            per_100g = per_100g or ("",) * len(NUTRIENTS)
+            yield ([code, item.name, cell(round(weight, 3))]
+                   + [cell(round(v, 1)) for v in portion]
+                   + [cell(round(v, 1)) if v != "" else "" for v in per_100g]
+                   + [item.kcal, ", ".join(sorted(missing))])
+
+    return Table(NUTRITION_COLUMNS, rows())
+
+
+# Table name → input files it is built from (code files are tracked per generator).
+# Each table is written as <name>.jsonl (data, versioned) and <name>.html (view).
+TABLES = [
+    ("Purchasing_Inventory_table",      ["Nomenclature.tsv"],                                 build_purchasing_inventory),
+    ("BOM_Costing_table",               ["BOM.tsv", "Nomenclature.tsv", "UOM_Mapping.tsv"],   build_bom_costing),
+    ("Modifier_Costs_table",            ["Modifier_Schemes.tsv", "Nomenclature.tsv"],         build_modifier_costs),
+    ("Dish_Cost_Summary_table",         ["BOM.tsv", "Nomenclature.tsv", "UOM_Mapping.tsv",
+                                         "Modifier_Schemes.tsv"],                             build_dish_cost_summary),
+    ("Modifier_Cost_Bounds_table",      ["Modifier_Schemes.tsv", "Nomenclature.tsv"],         build_modifier_bounds),
+    ("Nutrition_table",                 ["BOM.tsv", "Nomenclature.tsv", "UOM_Mapping.tsv",
+                                         "Modifier_Schemes.tsv"],                             build_nutrition),
+]
+CODE_FILES = ["generate_costing.py", "bom_engine.py", "cost_rollup.py", "purchasing.py",
+              "modifier_bounds.py", "nutrition.py", "table_render.py", "model.py", "dataset.py"]
+
+
+def main():
+    manifest = BuildManifest("generate_costing", CODE_FILES, {"formulas": FORMULA_MODE})
+    rebuilt = []
+    for name, inputs, build in TABLES:
+        output, views = f"{name}.jsonl", [f"{name}.html"] if HTML_VIEW else []
+        if manifest.is_stale(output, inputs, views):
+            # Rows stream straight into the artifact; the views re-read it
+            save_table(output, iter_jsonl(build()), version)
+            for view in views:
+                with open(output, 'r', encoding='utf-8') as f:
+                    write_html(view, read_jsonl_table(f))
+            manifest.record(output, inputs, views)
+            rebuilt.append(name)
+    manifest.save()
+
+    if not rebuilt:
+        print("All food costing tables are up to date.")
+        return
+    print("Food Costing HTML tables generated successfully.")
+    for output in rebuilt:
+        print(f"  + {output}")
+
+
+if __name__ == '__main__':
+    main()
 
-dishes = [("SALE-BORSCH_BIOACTIVE", "Borsch Bio-Active (portion)")]
-
-summary_html = """<!DOCTYPE html>
-<html><head><meta charset="utf-8"></head><body><table>
-<tr>
-  <th>Dish_Code</th><th>Dish_Name</th>
-  <th>Base_BOM_Cost</th>
-  <th>Default_Modifier_Cost</th>
-  <th>Total_Default_Cost</th>
-  <th>Food_Cost_Pct_Target</th>
-  <th>Suggested_Min_Price</th>
-</tr>
-"""
-for idx, (dish_code, dish_name) in enumerate(dishes):
-    row_num = idx + 2
-    # Base BOM cost: from BOM_Costing sheet — sum of Total_Line_Cost where Parent_Code=dish_code
-    base_cost = (
-        f'=IFERROR(SUMIF(BOM_Costing!A:A, "{dish_code}", BOM_Costing!J:J), 0)'
-    )
-    # Default modifier cost: from Modifier_Costs — sum M where Dish_Code=dish_code AND Included=Yes
-    default_mod = (
-        f'=IFERROR(SUMPRODUCT('
-        f'(Modifier_Costs!B:B="{dish_code}")*'
-        f'(Modifier_Costs!N:N="Yes")*'
-        f'Modifier_Costs!M:M), 0)'
-    )
-    total = f"=C{row_num}+D{row_num}"
-    fc_pct = "33%"
-    suggested = f"=ROUND(E{row_num}/0.33, 0)"
-
-    summary_html += (
-        f"<tr>"
-        f"<td>{dish_code}</td><td>{dish_name}</td>"
-        f"<td>{base_cost}</td>"
-        f"<td>{default_mod}</td>"
-        f"<td>{total}</td>"
-        f"<td>{fc_pct}</td>"
-        f"<td>{suggested}</td>"
-        f"</tr>\n"
-    )
-summary_html += "</table></body></html>"
-save_versioned_html("Dish_Cost_Summary_table.html", summary_html)
-
-print("Food Costing HTML tables generated successfully.")
-print("  + Modifier_Costs_table.html")
-print("  + Dish_Cost_Summary_table.html")
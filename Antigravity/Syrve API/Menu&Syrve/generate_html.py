@@ -1,4 +1,4 @@
-import csv
+from table_render import HTML_TAIL, iter_html_table, read_tsv_table, write_chunks
 
 files = [
     ("Nomenclature", "Nomenclature.tsv"),
@@ -8,7 +8,7 @@ files = [
     ("UOM_Mapping", "UOM_Mapping.tsv")
 ]
 
-html = """<!DOCTYPE html>
+head = """<!DOCTYPE html>
 <html>
 <head>
 <meta charset="utf-8">
@@ -19,23 +19,16 @@ html = """<!DOCTYPE html>
 <body>
 """
 
-for sheet_name, f_name in files:
-    html += f"<h2>{sheet_name}</h2>\n<table id='{sheet_name}'>\n"
-    # we generated .txt, but let's read the .txt since they were renamed
-    txt_name = f_name.replace(".tsv", ".txt")
-    with open(txt_name, "r", encoding="utf-8") as f:
-        reader = csv.reader(f, delimiter='\t')
-        for i, row in enumerate(reader):
-            html += "  <tr>\n"
-            for col in row:
-                tag = "th" if i == 0 else "td"
-                html += f"    <{tag}>{col}</{tag}>\n"
-            html += "  </tr>\n"
-    html += "</table>\n<br>\n"
-
-html += "</body></html>"
-
-with open("index.html", "w", encoding="utf-8") as f:
-    f.write(html)
+# Tables are streamed straight into index.html, one row at a time
+with open("index.html", "w", encoding="utf-8") as out:
+    out.write(head)
+    for sheet_name, f_name in files:
+        out.write(f"<h2>{sheet_name}</h2>\n")
+        # we generated .txt, but let's read the .txt since they were renamed
+        txt_name = f_name.replace(".tsv", ".txt")
+        with open(txt_name, "r", encoding="utf-8") as f:
+            write_chunks(out, iter_html_table(read_tsv_table(f), sheet_name))
+        out.write("<br>\n")
+    out.write(HTML_TAIL)
 
 print("index.html generated!")
@@ -1,4 +1,4 @@
-import csv
+from table_render import read_tsv_table, write_html
 
 files = [
     ("Nomenclature", "Nomenclature.tsv"),
@@ -9,22 +9,6 @@ files = [
 ]
 
 for sheet_name, f_name in files:
-    html = """<!DOCTYPE html>
-<html>
-<head><meta charset="utf-8"></head>
-<body>
-<table>
-"""
     with open(f_name, "r", encoding="utf-8") as f:
-        reader = csv.reader(f, delimiter='\t')
-        for idx, row in enumerate(reader):
-            html += "  <tr>\n"
-            for col in row:
-                tag = "th" if idx == 0 else "td"
-                html += f"    <{tag}>{col}</{tag}>\n"
-            html += "  </tr>\n"
-    html += "</table>\n</body></html>"
-    
-    with open(f"{sheet_name}_table.html", "w", encoding="utf-8") as f:
-        f.write(html)
+        write_html(f"{sheet_name}_table.html", read_tsv_table(f))
     print(f"Generated {sheet_name}_table.html")
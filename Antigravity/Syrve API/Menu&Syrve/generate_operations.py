@@ -1,63 +1,53 @@
-import csv
+import sys
 import json
-import os
 import datetime
+from functools import lru_cache
+
+from batch_optimizer import (BATCH_PLAN_COLUMNS, batch_plan_rows, load_operations,
+                             load_storage_units, optimize)
+from bom_engine import load_bom_index
+from build_manifest import BuildManifest
+from cost_rollup import (FORMULA_MODE, CostRollup, cell, load_sale_ratios,
+                         price_per_base_unit)
+from dataset import read_tsv
+from model import BomLine, Item, read_table
+from kitchen import RESOURCE_CAPACITY, availability_minutes, operation_step
+from production_planner import (issue_packs, load_forecast, load_on_hand,
+                                net_requirements, plan_requirements)
+from scheduler import SCHEDULE_COLUMNS, plan_schedule, schedule_rows
+from table_render import Table, iter_jsonl, read_jsonl_table, write_html
+from version_store import history, save_table
+
+# "--no-html" writes only the .jsonl data artifacts (what upload_to_sheets reads)
+HTML_VIEW = '--no-html' not in sys.argv
 
 # Versioning
 version = datetime.datetime.now().strftime("v%Y%m%d_%H%M")
-generated_files = []
-
-def save_versioned_html(filename, content):
-    base, ext = os.path.splitext(filename)
-    versioned_name = f"{base}_{version}{ext}"
-    with open(versioned_name, "w", encoding="utf-8") as f:
-        f.write(content)
-    # Also save as "latest" for easy stable access
-    with open(filename, "w", encoding="utf-8") as f:
-        f.write(content)
-    generated_files.append((filename, versioned_name))
-
-nom = {}
-nom_by_name = {} # Separate dictionary for name-based lookups
-with open('Nomenclature.tsv', 'r', encoding='utf-8') as f:
-    for r in csv.DictReader(f, delimiter='\t'):
-        nom[r['Short_Code']] = r
-        nom_by_name[r['Name']] = r
-
-bom_list = []
-with open('BOM.tsv', 'r', encoding='utf-8') as f:
-    bom_list = list(csv.DictReader(f, delimiter='\t'))
-
-def explode_bom(parent_code, target_qty, results=None):
-    if results is None: results = {}
-    
-    # Get Parent's Standard yield from Nomenclature
-    # (Divide child quantity by parent yield to get 'per unit' ratio)
-    p_data = nom.get(parent_code)
-    try:
-        p_std = float(p_data['Standard_Output_Amount'])
-    except:
-        p_std = 1.0 # default for sales items/portions
-    
-    for row in bom_list:
-        if row['Parent_Code'] == parent_code:
-            child_code = row['Child_Code']
-            # child_req = (row_quantity_gross / parent_std_output) * parent_total_qty
-            try:
-                child_qty_gross = float(row['QuantityGross'])
-            except:
-                continue
-                
-            child_req_total = (child_qty_gross / p_std) * target_qty
-            
-            if child_code.startswith('PF-'):
-                results[child_code] = results.get(child_code, 0) + child_req_total
-                # Recurse
-                explode_bom(child_code, child_req_total, results)
-    return results
-
-with open('drive_links.json', 'r', encoding='utf-8') as f:
-    drive_links = json.load(f)
+
+
+# Inputs are loaded lazily, so tables that are up to date never parse them
+@lru_cache(maxsize=None)
+def load_nomenclature():
+    nom = {}
+    nom_by_name = {} # Separate dictionary for name-based lookups
+    for item in read_table('Nomenclature.tsv', Item):
+        nom[item.code] = item
+        nom_by_name[item.name] = item
+    return nom, nom_by_name
+
+@lru_cache(maxsize=None)
+def bom_index():
+    return load_bom_index()
+
+@lru_cache(maxsize=None)
+def batch_plans():
+    # Batches the kitchen makes, fitted to packs and machines (batch_optimizer.py)
+    return optimize(bom_index(), load_forecast(), load_storage_units(), load_operations())
+
+@lru_cache(maxsize=None)
+def load_drive_links():
+    with open('drive_links.json', 'r', encoding='utf-8') as f:
+        return json.load(f)
 
 photo_map = {
     "Fresh Carrot": "fresh carrot.jpg",
@@ -76,368 +66,307 @@ photo_map = {
     "Borsch Bio-Active (portion)": "borsh.jpeg"
 }
 
-doc_url = drive_links.get("Borsch.pdf", "")
+def tsv_rows(path, columns):
+    """Yield the `columns` of every row of a TSV file, one row at a time."""
+    for row in read_tsv(path):
+        yield [row[c] for c in columns]
+
 
 # 0. GROUPS
-groups_html = """<!DOCTYPE html>
-<html><head><meta charset="utf-8"></head><body><table>
-<tr>
-  <th>Group_Code</th><th>Syrve_System_ID</th><th>Group_Name</th><th>Parent_Group_Code</th><th>Description</th>
-</tr>
-"""
-with open('Groups.tsv', 'r', encoding='utf-8') as f:
-    for row in csv.DictReader(f, delimiter='\t'):
-        groups_html += (
-            f"<tr><td>{row['Group_Code']}</td><td>{row['Syrve_System_ID']}</td>"
-            f"<td>{row['Group_Name']}</td><td>{row['Parent_Group_Code']}</td>"
-            f"<td>{row['Description']}</td></tr>\n"
-        )
-groups_html += "</table></body></html>"
-save_versioned_html("Groups_table.html", groups_html)
+GROUP_COLUMNS = ["Group_Code", "Syrve_System_ID", "Group_Name", "Parent_Group_Code", "Description"]
+
+def build_groups():
+    return Table(GROUP_COLUMNS, tsv_rows('Groups.tsv', GROUP_COLUMNS))
+
 
 # 0b. PRODUCT CATEGORIES
-cat_html = """<!DOCTYPE html>
-<html><head><meta charset="utf-8"></head><body><table>
-<tr>
-  <th>Category_Code</th><th>Syrve_System_ID</th><th>Category_Name</th><th>Parent_Group_Code</th>
-</tr>
-"""
-with open('Product_Categories.tsv', 'r', encoding='utf-8') as f:
-    for row in csv.DictReader(f, delimiter='\t'):
-        cat_html += (
-            f"<tr><td>{row['Category_Code']}</td><td>{row['Syrve_System_ID']}</td>"
-            f"<td>{row['Category_Name']}</td><td>{row['Parent_Group_Code']}</td></tr>\n"
-        )
-cat_html += "</table></body></html>"
-save_versioned_html("Product_Categories_table.html", cat_html)
+CATEGORY_COLUMNS = ["Category_Code", "Syrve_System_ID", "Category_Name", "Parent_Group_Code"]
+
+def build_product_categories():
+    return Table(CATEGORY_COLUMNS, tsv_rows('Product_Categories.tsv', CATEGORY_COLUMNS))
+
 
 # 0c. MODIFIER SCHEMA REGISTRY
-schema_html = """<!DOCTYPE html>
-<html><head><meta charset="utf-8"></head><body><table>
-<tr>
-  <th>Schema_Code</th><th>Syrve_System_ID</th><th>Schema_Name</th><th>Dish_Short_Code</th>
-</tr>
-"""
-with open('Modifier_Schema_Registry.tsv', 'r', encoding='utf-8') as f:
-    for row in csv.DictReader(f, delimiter='\t'):
-        schema_html += (
-            f"<tr><td>{row['Schema_Code']}</td><td>{row['Syrve_System_ID']}</td>"
-            f"<td>{row['Schema_Name']}</td><td>{row['Dish_Short_Code']}</td></tr>\n"
-        )
-schema_html += "</table></body></html>"
-save_versioned_html("Modifier_Schema_Registry_table.html", schema_html)
+SCHEMA_COLUMNS = ["Schema_Code", "Syrve_System_ID", "Schema_Name", "Dish_Short_Code"]
+
+def build_modifier_schema_registry():
+    return Table(SCHEMA_COLUMNS, tsv_rows('Modifier_Schema_Registry.tsv', SCHEMA_COLUMNS))
+
 
 # 1. NOMENCLATURE OPERATIONAL
-nom_html = """<!DOCTYPE html>
-<html><head><meta charset="utf-8"></head><body><table>
-<tr>
-  <th>Short_Code</th><th>Syrve_System_ID</th><th>Name</th><th>Type</th><th>OrderItemType</th><th>UsageNotes</th>
-  <th>Standard_Output_Amount</th><th>Standard_Output_UOM</th><th>Syrve_Sync</th>
-  <th>measureUnit</th><th>groupId</th><th>productCategoryId</th><th>modifierSchemaId</th>
-  <th>kcal_per100g</th><th>protein_per100g</th><th>fat_per100g</th><th>carbs_per100g</th>
-  <th>Photo_URL</th><th>Instruction_URL</th>
-</tr>
-"""
-for scode, data in nom.items():
-    name = data['Name']
-    p_file = photo_map.get(name)
-    p_url = drive_links.get(p_file, "") if p_file else ""
-    i_url = doc_url if "Borsch" in name or "SF" in name else ""
-
-    std_uom       = data.get('Standard_Output_UOM', '')
-    syrve_sync    = data.get('Syrve_Sync', 'Yes')
-    measure_unit  = data.get('measureUnit', '')
-    group_id      = data.get('groupId', '')
-    cat_id        = data.get('productCategoryId', '')
-    schema_id     = data.get('modifierSchemaId', '')
-    kcal          = data.get('kcal_per100g', '')
-    prot          = data.get('protein_per100g', '')
-    fat           = data.get('fat_per100g', '')
-    carbs         = data.get('carbs_per100g', '')
-
-    nom_html += (
-        f"<tr>"
-        f"<td>{data['Short_Code']}</td><td>{data['Syrve_System_ID']}</td><td>{name}</td>"
-        f"<td>{data['Type']}</td><td>{data['OrderItemType']}</td><td>{data['UsageNotes']}</td>"
-        f"<td>{data['Standard_Output_Amount']}</td><td>{std_uom}</td><td>{syrve_sync}</td>"
-        f"<td>{measure_unit}</td><td>{group_id}</td><td>{cat_id}</td><td>{schema_id}</td>"
-        f"<td>{kcal}</td><td>{prot}</td><td>{fat}</td><td>{carbs}</td>"
-        f"<td>{p_url}</td><td>{i_url}</td>"
-        f"</tr>\n"
-    )
-nom_html += "</table></body></html>"
-
-save_versioned_html("Nomenclature_Operational_table.html", nom_html)
+NOMENCLATURE_COLUMNS = [
+    "Short_Code", "Syrve_System_ID", "Name", "Type", "OrderItemType", "UsageNotes",
+    "Standard_Output_Amount", "Standard_Output_UOM", "Syrve_Sync",
+    "measureUnit", "groupId", "productCategoryId", "modifierSchemaId",
+    "kcal_per100g", "protein_per100g", "fat_per100g", "carbs_per100g",
+    "Photo_URL", "Instruction_URL",
+]
+
+def build_nomenclature():
+    nom, _ = load_nomenclature()
+    drive_links = load_drive_links()
+    doc_url = drive_links.get("Borsch.pdf", "")
+
+    def rows():
+        for data in nom.values():
+            name = data['Name']
+            p_file = photo_map.get(name)
+            p_url = drive_links.get(p_file, "") if p_file else ""
+            i_url = doc_url if "Borsch" in name or "SF" in name else ""
+            yield [
+                data['Short_Code'], data['Syrve_System_ID'], name,
+                data['Type'], data['OrderItemType'], data['UsageNotes'],
+                data['Standard_Output_Amount'], data.get('Standard_Output_UOM', ''),
+                data.get('Syrve_Sync', 'Yes'),
+                data.get('measureUnit', ''), data.get('groupId', ''),
+                data.get('productCategoryId', ''), data.get('modifierSchemaId', ''),
+                data.get('kcal_per100g', ''), data.get('protein_per100g', ''),
+                data.get('fat_per100g', ''), data.get('carbs_per100g', ''),
+                p_url, i_url,
+            ]
+
+    return Table(NOMENCLATURE_COLUMNS, rows())
+
 
 # 2. PRODUCTION FLOW OPERATIONAL
-flow_html = """<!DOCTYPE html>
-<html><head><meta charset="utf-8"></head><body><table>
-<tr>
-  <th>Product_Code</th><th>Product_Name</th><th>Operation</th><th>Equipment_ID</th>
-  <th>Temperature</th><th>Duration_Min</th><th>Is_Bottleneck</th><th>Notes</th>
-  <th>Staff_Role</th><th>Instruction_Step</th><th>Parallel_Task_Possible</th>
-</tr>
-"""
-with open('Production_Flow.tsv', 'r', encoding='utf-8') as f:
-    reader = csv.DictReader(f, delimiter='\t')
-    for row in reader:
-        op = row['Operation']
-        role = "Prep Cook"
-        step = ""
-        parallel = "Yes"
-        
-        if op == "Baking":
-            role = "Prep Cook"
-            step = "Bake at 180°C until soft through"
-            parallel = "Yes"
-        elif op == "Roasting Trimmings":
-            role = "Prep Cook"
-            step = "Spread trimmings on GN tray; roast 200°C 20-30 min until caramelised (Maillard)"
-            parallel = "Yes"
-        elif op == "Sauteing":
-            role = "Chef"
-            step = "Saute vegetables with continuous stirring"
-            parallel = "No"
-        elif op == "Simmering":
-            role = "Prep Cook"
-            step = "Cover roasted veg with cold RO water; bring to boil, reduce to bare simmer 60-90 min"
-            parallel = "Yes"
-        elif op == "Straining":
-            role = "Prep Cook"
-            step = "Strain through fine sieve/cheesecloth; solids to compost (Zero-Waste principle)"
-            parallel = "Yes"
-        elif op == "Boiling Potato":
-            role = "Prep Cook"
-            step = "Boil borsch base until potatoes are tender"
-            parallel = "Yes"
-        elif op == "Cooling":
-            role = "Packager"
-            step = "Rapid blast chill to 3°C"
-            parallel = "Yes"
-        elif op == "Vacuuming":
-            role = "Packager"
-            step = "Vacuum seal (broth: 5L bags; borsch base: 1L bags)"
-            parallel = "No"
-            
-        flow_html += f"<tr><td>{row['Product_Code']}</td><td>{row['Product_Name']}</td><td>{op}</td>"
-        flow_html += f"<td>{row['Equipment_ID']}</td><td>{row['Temperature']}</td><td>{row['Duration_Min']}</td>"
-        flow_html += f"<td>{row['Is_Bottleneck']}</td><td>{row['Notes']}</td>"
-        flow_html += f"<td>{role}</td><td>{step}</td><td>{parallel}</td></tr>\n"
-flow_html += "</table></body></html>"
-
-save_versioned_html("Production_Flow_Operational_table.html", flow_html)
+FLOW_COLUMNS = [
+    "Product_Code", "Product_Name", "Operation", "Equipment_ID",
+    "Temperature", "Duration_Min", "Is_Bottleneck", "Notes",
+    "Staff_Role", "Instruction_Step", "Parallel_Task_Possible",
+]
+
+def build_production_flow():
+    def rows():
+        for row in tsv_rows('Production_Flow.tsv', FLOW_COLUMNS[:8]):
+            role, step, parallel = operation_step(row[2])
+            yield row + [role, step, parallel]
+
+    return Table(FLOW_COLUMNS, rows())
+
 
 # 3. RESOURCE CAPACITY
-cap_html = """<!DOCTYPE html>
-<html><head><meta charset="utf-8"></head><body><table>
-<tr><th>Equipment_ID</th><th>Equipment_Name</th><th>Unit_Capacity</th><th>Daily_Availability_Min</th></tr>
-<tr><td>L-1-K-EL-CON-OVEN-83</td><td>Convection Oven Unit 20</td><td>10 GN 1/1 Trays</td><td>480</td></tr>
-<tr><td>L-2-S-INDCT-BRN-2-6</td><td>Induction Burner Unit 65</td><td>15 Liters</td><td>480</td></tr>
-<tr><td>L-1-K-GAS-RNG-570-32</td><td>Gas Range Unit 32</td><td>50 Liters</td><td>480</td></tr>
-<tr><td>L-1-K-BL-FRZ-790-66</td><td>Blast Chiller Unit 66</td><td>20 kg</td><td>600</td></tr>
-<tr><td>L-1-K-VAC-500-67</td><td>Vacuum Sealer Unit 67</td><td>1 Bag / Minute</td><td>480</td></tr>
-</table></body></html>
-"""
-save_versioned_html("Resource_Capacity_table.html", cap_html)
+CAPACITY_COLUMNS = ["Equipment_ID", "Equipment_Name", "Unit_Capacity", "Daily_Availability_Min"]
+
+def build_resource_capacity():
+    return Table(CAPACITY_COLUMNS, RESOURCE_CAPACITY)
+
 
 # 4. BOM Operational Costing Table
-bom_html = """<!DOCTYPE html>
-<html><head><meta charset="utf-8"></head><body><table>
-<tr>
-  <th>Parent_Code</th><th>Parent_Name</th><th>Child_Code</th><th>Child_Name</th>
-  <th>QuantityGross</th><th>Unit</th><th>Yield_Percentage</th><th>QuantityNet</th>
-  <th>Unit_Cost</th><th>Total_Line_Cost</th><th>Batch_Validation</th><th>Cost_per_Sales_Unit</th>
-</tr>
-"""
-yield_dict = {
-    "Fresh Carrot": "0.8", "Onion": "0.85", "Raw Beetroot": "0.7",
-    "Fresh Potato": "0.75", "Garlic": "0.95", "Processing Loss": "1"
-}
+BOM_COLUMNS = [
+    "Parent_Code", "Parent_Name", "Child_Code", "Child_Name",
+    "QuantityGross", "Unit", "Yield_Percentage", "QuantityNet",
+    "Unit_Cost", "Total_Line_Cost", "Batch_Validation", "Cost_per_Sales_Unit",
+]
+
+def build_bom():
+    nom, nom_by_name = load_nomenclature()
+    bom_rows = read_table('BOM.tsv', BomLine)
+
+    # Cost cascade + batch validation computed in Python; see cost_rollup.py
+    prices = price_per_base_unit(lambda name: nom_by_name[name].code if name in nom_by_name else 'MISSING_CODE')
+    rollup = CostRollup(bom_rows, nom, prices, load_sale_ratios())
+
+    def rows():
+        for idx, row in enumerate(bom_rows):
+            row_num = idx + 2
+            line = rollup.lines[idx]
+            y_perc = line["yield"]
+
+            if FORMULA_MODE:
+                qnet_formula = f"=E{row_num}*G{row_num}"
+                unit_formula = f'=IFERROR(IF(COUNTIF(A:A, C{row_num})>0, SUMIF(A:A, C{row_num}, J:J)/SUMIF(A:A, C{row_num}, H:H), VLOOKUP(C{row_num}, Purchasing_Inventory!A:G, 6, FALSE)), 0)'
+                total_formula = f"=E{row_num}*I{row_num}"
+                # Batch_Validation:
+                # For PF/RAW items: check if ROUND(SUMIF(QuantityNet), 2) == Standard_Output_Amount
+                # For SALE/Compound items: check via UOM_Mapping (QuantityNet / Sale_Ratio == Standard_Output_Amount)
+                valid_formula = (
+                    f'=IF(OR(LEFT(A{row_num},5)="SALE-", VLOOKUP(A{row_num}, Nomenclature!A:G, 4, FALSE)="Compound"), '
+                    f'IF(IFERROR(ROUND(SUMIF(A:A, A{row_num}, H:H) / VLOOKUP(A{row_num}, UOM_Mapping!A:G, 7, FALSE), 2), -1) '
+                    f'= VLOOKUP(A{row_num}, Nomenclature!A:G, 7, FALSE), "OK", "YIELD ERR"), '
+                    f'IF(ROUND(SUMIF(A:A, A{row_num}, H:H), 2) = VLOOKUP(A{row_num}, Nomenclature!A:G, 7, FALSE), "OK", "YIELD ERR"))'
+                )
+                cost_per_unit = f'=(SUMIF(A:A, A{row_num}, J:J) / SUMIF(A:A, A{row_num}, H:H)) * IFERROR(VLOOKUP(A{row_num}, UOM_Mapping!A:G, 7, FALSE), 1)'
+            else:
+                qnet_formula  = cell(line["net"])
+                unit_formula  = cell(line["unit_cost"])
+                total_formula = cell(line["line_cost"])
+                valid_formula = line["batch_validation"]
+                cost_per_unit = cell(line["cost_per_sales_unit"])
+
+            yield [
+                row['Parent_Code'], row['Parent_Name'], row['Child_Code'], row['Child_Name'],
+                row['QuantityGross'], row['Unit'], y_perc, qnet_formula,
+                unit_formula, total_formula, valid_formula, cost_per_unit,
+            ]
+
+    return Table(BOM_COLUMNS, rows())
 
-with open('BOM.tsv', 'r', encoding='utf-8') as f:
-    reader = list(csv.DictReader(f, delimiter='\t'))
-    for idx, row in enumerate(reader):
-        row_num = idx + 2
-        child_name = row['Child_Name']
-        y_perc = yield_dict.get(child_name, "1")
-        
-        qnet_formula = f"=E{row_num}*G{row_num}"
-        unit_formula = f'=IFERROR(IF(COUNTIF(A:A, C{row_num})>0, SUMIF(A:A, C{row_num}, J:J)/SUMIF(A:A, C{row_num}, H:H), VLOOKUP(C{row_num}, Purchasing_Inventory!A:G, 6, FALSE)), 0)'
-        total_formula = f"=E{row_num}*I{row_num}"
-        # Batch_Validation:
-        # For PF/RAW items: check if ROUND(SUMIF(QuantityNet), 2) == Standard_Output_Amount
-        # For SALE/Compound items: check via UOM_Mapping (QuantityNet / Sale_Ratio == Standard_Output_Amount)
-        parent_code = row['Parent_Code']
-        valid_formula = (
-            f'=IF(OR(LEFT(A{row_num},5)="SALE-", VLOOKUP(A{row_num}, Nomenclature!A:G, 4, FALSE)="Compound"), '
-            f'IF(IFERROR(ROUND(SUMIF(A:A, A{row_num}, H:H) / VLOOKUP(A{row_num}, UOM_Mapping!A:G, 7, FALSE), 2), -1) '
-            f'= VLOOKUP(A{row_num}, Nomenclature!A:G, 7, FALSE), "OK", "YIELD ERR"), '
-            f'IF(ROUND(SUMIF(A:A, A{row_num}, H:H), 2) = VLOOKUP(A{row_num}, Nomenclature!A:G, 7, FALSE), "OK", "YIELD ERR"))'
-        )
-        cost_per_unit = f'=(SUMIF(A:A, A{row_num}, J:J) / SUMIF(A:A, A{row_num}, H:H)) * IFERROR(VLOOKUP(A{row_num}, UOM_Mapping!A:G, 7, FALSE), 1)'
-
-        bom_html += f"<tr><td>{row['Parent_Code']}</td><td>{row['Parent_Name']}</td>"
-        bom_html += f"<td>{row['Child_Code']}</td><td>{row['Child_Name']}</td>"
-        bom_html += f"<td>{row['QuantityGross']}</td><td>{row['Unit']}</td>"
-        bom_html += f"<td>{y_perc}</td><td>{qnet_formula}</td>"
-        bom_html += f"<td>{unit_formula}</td><td>{total_formula}</td>"
-        bom_html += f"<td>{valid_formula}</td><td>{cost_per_unit}</td></tr>\n"
-
-bom_html += "</table></body></html>"
-save_versioned_html("BOM_Operational_table.html", bom_html)
 
 # 5. DAILY PRODUCTION PLAN
-plan_html = """<!DOCTYPE html>
-<html><head><meta charset="utf-8"></head><body><table>
-<tr><th>Product_Code</th><th>Product_Name</th><th>Target_Quantity</th><th>Calculated_Batches</th><th>Total_Quantity_to_Produce</th></tr>
-"""
+# PF rows carry the kitchen's batches from batch_optimizer.py as values (packs
+# and machine capacity); --formulas and the SALE / blank input rows keep the
+# CEILING(target / Sale_Ratio / Standard_Output) formulas.
+PLAN_COLUMNS = ["Product_Code", "Product_Name", "Target_Quantity", "Calculated_Batches", "Total_Quantity_to_Produce"]
+
+def build_daily_plan():
+    # Forecast for the whole menu (Sales_Forecast.tsv); PF totals from one BOM sweep
+    forecast = load_forecast()
+    pf_totals, raw_totals = plan_requirements(bom_index(), forecast)
+    plans = {} if FORMULA_MODE else batch_plans()
+
+    # Collect all items to plan (SALE forecast + exploded PFs)
+    items_to_plan = [(code, qty) for code, qty in forecast.items() if code not in pf_totals]
+    for code, qty in pf_totals.items():
+        # Optimised plan: demand of parents already rounded up to whole packs
+        items_to_plan.append((code, plans[code].required if code in plans else qty))
+
+    # Add extra empty rows for user input
+    for _ in range(5):
+        items_to_plan.append(("", ""))
+
+    def rows():
+        for i, (p_code, p_qty) in enumerate(items_to_plan):
+            row_num = i + 2
+            # Fix ID Formula: Pull Name from Nomenclature (based on Code match)
+            name_formula = f'=IFERROR(VLOOKUP(A{row_num}, Nomenclature!A:C, 3, FALSE), "")'
+            # FIXED: Wrap SUMIF divisor with IFERROR to prevent #DIV/0! when PF has no BOM rows
+            # (e.g. PF-VEGETABLE_BROTH has no child ingredients defined)
+            batches = (
+                f'=IF(A{row_num}="", 0, '
+                f'IFERROR('
+                f'CEILING('
+                f'C{row_num} / IFERROR(VLOOKUP(A{row_num}, UOM_Mapping!A:G, 7, FALSE), 1) '
+                f'/ IFERROR(VLOOKUP(A{row_num}, Nomenclature!A:G, 7, FALSE), 1), '
+                f'1), 0))'
+            )
+            total_qty = f'=IF(A{row_num}="", 0, D{row_num} * IFERROR(VLOOKUP(A{row_num}, Nomenclature!A:G, 7, FALSE), 1))'
+            if p_code in plans:
+                batches, total_qty = plans[p_code].batches, cell(plans[p_code].produced)
+            yield [p_code, name_formula, cell(p_qty), batches, total_qty]
+
+    return Table(PLAN_COLUMNS, rows())
 
-# Starting item: 100 Portions of Borsch
-start_code = nom_by_name['Borsch Bio-Active (portion)']['Short_Code']
-start_portions = 100
-exploded = explode_bom(start_code, start_portions)
-
-# Collect all items to plan (SALE + exploded PFs)
-items_to_plan = [(start_code, start_portions)]
-for code, qty in exploded.items():
-    items_to_plan.append((code, qty))
-
-# Add extra empty rows for user input
-for _ in range(5):
-    items_to_plan.append(("", ""))
-
-for i, (p_code, p_qty) in enumerate(items_to_plan):
-    row_num = i + 2
-    # Fix ID Formula: Pull Name from Nomenclature (based on Code match)
-    name_formula = f'=IFERROR(VLOOKUP(A{row_num}, Nomenclature!A:C, 3, FALSE), "")'
-    # FIXED: Wrap SUMIF divisor with IFERROR to prevent #DIV/0! when PF has no BOM rows
-    # (e.g. PF-VEGETABLE_BROTH has no child ingredients defined)
-    batches = (
-        f'=IF(A{row_num}="", 0, '
-        f'IFERROR('
-        f'CEILING('
-        f'C{row_num} / IFERROR(VLOOKUP(A{row_num}, UOM_Mapping!A:G, 7, FALSE), 1) '
-        f'/ IFERROR(VLOOKUP(A{row_num}, Nomenclature!A:G, 7, FALSE), 1), '
-        f'1), 0))'
-    )
-    total_qty = f'=IF(A{row_num}="", 0, D{row_num} * IFERROR(VLOOKUP(A{row_num}, Nomenclature!A:G, 7, FALSE), 1))'
-    
-    plan_html += f"<tr><td>{p_code}</td><td>{name_formula}</td><td>{p_qty}</td><td>{batches}</td><td>{total_qty}</td></tr>\n"
-
-plan_html += "</table></body></html>"
-
-save_versioned_html("Daily_Production_Plan_table.html", plan_html)
 
 # 6. RESOURCE LOAD REPORT
 # Reads from Chef_Job_List via SUMIFS: sums Duration_Total_Min per Equipment_ID
-load_html = """<!DOCTYPE html>
-<html><head><meta charset="utf-8"></head><body><table>
-<tr><th>Equipment_ID</th><th>Equipment_Name</th><th>Total_Load_Min</th><th>Availability_Min</th><th>Status</th></tr>
-"""
-equipment_list = [
-    ("L-1-K-EL-CON-OVEN-83", "Convection Oven Unit 20"),
-    ("L-1-K-GAS-RNG-570-32", "Gas Range Unit 32"),
-    ("L-1-K-BL-FRZ-790-66", "Blast Chiller Unit 66"),
-    ("L-1-K-VAC-500-67", "Vacuum Sealer Unit 67")
-]
-for idx, (e_id, e_name) in enumerate(equipment_list):
-    row_num = idx + 2
-    # Sum Duration_Total_Min from Chef_Job_List where Equipment_ID matches
-    total_load = f"=IFERROR(SUMIFS('Chef Job List'!F:F, 'Chef Job List'!G:G, A{row_num}), 0)"
-    avail = f'=IFERROR(VLOOKUP(A{row_num}, Resource_Capacity!A:D, 4, FALSE), "Check ID mapping")'
-    status = f'=IF(C{row_num} > D{row_num}, "OVERLOADED", "OK")'
-    load_html += f"<tr><td>{e_id}</td><td>{e_name}</td><td>{total_load}</td><td>{avail}</td><td>{status}</td></tr>\n"
-load_html += "</table></body></html>"
+LOAD_COLUMNS = ["Equipment_ID", "Equipment_Name", "Total_Load_Min", "Availability_Min", "Status"]
+
+def build_resource_load():
+    equipment_list = [
+        ("L-1-K-EL-CON-OVEN-83", "Convection Oven Unit 20"),
+        ("L-1-K-GAS-RNG-570-32", "Gas Range Unit 32"),
+        ("L-1-K-BL-FRZ-790-66", "Blast Chiller Unit 66"),
+        ("L-1-K-VAC-500-67", "Vacuum Sealer Unit 67")
+    ]
+
+    def rows():
+        for idx, (e_id, e_name) in enumerate(equipment_list):
+            row_num = idx + 2
+            # Sum Duration_Total_Min from Chef_Job_List where Equipment_ID matches
+            total_load = f"=IFERROR(SUMIFS('Chef Job List'!F:F, 'Chef Job List'!G:G, A{row_num}), 0)"
+            avail = f'=IFERROR(VLOOKUP(A{row_num}, Resource_Capacity!A:D, 4, FALSE), "Check ID mapping")'
+            status = f'=IF(C{row_num} > D{row_num}, "OVERLOADED", "OK")'
+            yield [e_id, e_name, total_load, avail, status]
+
+    return Table(LOAD_COLUMNS, rows())
 
-save_versioned_html("Resource_Load_Report_table.html", load_html)
 
 # 7. CHEF JOB LIST
 # One row per operation from Production_Flow.tsv
 # Duration_Total_Min = VLOOKUP(Product_Code, Daily_Production_Plan, 4, 0) * Duration_Min
 # This avoids FILTER+MMULT #REF! errors — formulas are simple cell references.
-chef_html = """<!DOCTYPE html>
-<html><head><meta charset="utf-8"></head><body><table>
-<tr><th>Staff_Role</th><th>Product_Code</th><th>Product_Name</th><th>Operation</th><th>Duration_Min</th><th>Duration_Total_Min</th><th>Equipment_ID</th></tr>
-"""
+CHEF_COLUMNS = ["Staff_Role", "Product_Code", "Product_Name", "Operation", "Duration_Min", "Duration_Total_Min", "Equipment_ID"]
 
-# Role mapping from generate_operations Production_Flow Operational section
-role_map = {
-    "Baking":             "Prep Cook",
-    "Roasting Trimmings": "Prep Cook",
-    "Sauteing":           "Chef",
-    "Simmering":          "Prep Cook",
-    "Straining":          "Prep Cook",
-    "Boiling Potato":     "Prep Cook",
-    "Cooling":            "Packager",
-    "Vacuuming":          "Packager",
-}
+def build_chef_job_list():
+    def rows():
+        flow = tsv_rows('Production_Flow.tsv', ["Product_Code", "Product_Name", "Operation",
+                                                "Duration_Min", "Equipment_ID"])
+        for idx, (p_code, p_name, operation, dur_min, equip_id) in enumerate(flow):
+            row_num = idx + 2  # row 2 = first data row in Sheets (row 1 = header)
+            # Role mapping shared with the Production_Flow Operational table
+            staff_role = operation_step(operation)[0]
+
+            # Duration_Total_Min = Calculated_Batches (from Daily_Production_Plan col D) × Duration_Min (col E)
+            # VLOOKUP(Product_Code, Daily_Production_Plan!A:D, 4) gives Calculated_Batches
+            dur_total = (
+                f'=IFERROR('
+                f'VLOOKUP(B{row_num}, Daily_Production_Plan!A:D, 4, FALSE)'
+                f' * E{row_num}, 0)'
+            )
+            yield [staff_role, p_code, p_name, operation, dur_min, dur_total, equip_id]
+
+    return Table(CHEF_COLUMNS, rows())
 
-with open('Production_Flow.tsv', 'r', encoding='utf-8') as f:
-    pf_rows = list(csv.DictReader(f, delimiter='\t'))
-
-for idx, row in enumerate(pf_rows):
-    row_num = idx + 2  # row 2 = first data row in Sheets (row 1 = header)
-    p_code = row['Product_Code']
-    p_name = row['Product_Name']
-    operation = row['Operation']
-    equip_id = row['Equipment_ID']
-    dur_min = row['Duration_Min']
-    staff_role = role_map.get(operation, "Prep Cook")
-
-    # Duration_Total_Min = Calculated_Batches (from Daily_Production_Plan col D) × Duration_Min (col E)
-    # VLOOKUP(Product_Code, Daily_Production_Plan!A:D, 4) gives Calculated_Batches
-    dur_total = (
-        f'=IFERROR('
-        f'VLOOKUP(B{row_num}, Daily_Production_Plan!A:D, 4, FALSE)'
-        f' * E{row_num}, 0)'
-    )
-
-    chef_html += (
-        f'<tr>'
-        f'<td>{staff_role}</td>'
-        f'<td>{p_code}</td>'
-        f'<td>{p_name}</td>'
-        f'<td>{operation}</td>'
-        f'<td>{dur_min}</td>'
-        f'<td>{dur_total}</td>'
-        f'<td>{equip_id}</td>'
-        f'</tr>\n'
-    )
-chef_html += "</table></body></html>"
-
-save_versioned_html("Chef_Job_List_table.html", chef_html)
 
 # 8. WAREHOUSE REQUEST
-wh_html = """<!DOCTYPE html>
-<html><head><meta charset="utf-8"></head><body><table>
-<tr><th>Item_Code</th><th>Item_Name</th><th>Total_Required</th><th>Base_Unit</th><th>Packs_to_Issue</th></tr>
-"""
-ingredients = [
-    # Purchased ingredients (issued from warehouse)
-    (nom_by_name["Raw Beetroot"]["Short_Code"],   "Raw Beetroot"),
-    (nom_by_name["Fresh Carrot"]["Short_Code"],   "Fresh Carrot"),
-    (nom_by_name["Onion"]["Short_Code"],          "Onion"),
-    (nom_by_name["Olive Oil EV"]["Short_Code"],   "Olive Oil EV"),
-    (nom_by_name["Fresh Potato"]["Short_Code"],   "Fresh Potato"),
-    (nom_by_name["Garlic"]["Short_Code"],         "Garlic"),
-    (nom_by_name["Lemon Juice"]["Short_Code"],    "Lemon Juice"),
-    (nom_by_name["Shishka Mix Spices"]["Short_Code"], "Shishka Mix Spices"),
-    # Broth: only RO Water is 'purchased'; trimmings are internal waste (zero cost)
-    (nom_by_name["RO Water"]["Short_Code"],       "RO Water"),
+# Every purchased item (BOM leaf) the forecast needs, exploded through all
+# BOM levels, netted against Stock_On_Hand.tsv and rounded up to storage packs.
+# The old one-level SUMPRODUCT(SUMIFS(BOM…)) formula missed RAW under nested
+# PFs, so this table is always written as values.
+WAREHOUSE_COLUMNS = [
+    "Item_Code", "Item_Name", "Total_Required", "On_Hand", "Net_Required",
+    "Base_Unit", "Storage_Unit", "Pack_Size", "Packs_to_Issue", "Issue_Qty",
 ]
-for idx, (i_id, i_name) in enumerate(ingredients):
-    row_num = idx + 2
-    # Again, use 0-defaulted batches for clean multiplication
-    total_req = f"=SUMPRODUCT(SUMIFS(BOM!E:E, BOM!C:C, A{row_num}, BOM!A:A, Daily_Production_Plan!A$2:A$100), Daily_Production_Plan!D$2:D$100)"
-    unit = f'=IFERROR(VLOOKUP(A{row_num}, Purchasing_Inventory!A:G, 3, FALSE), "Check ID mapping")'
-    packs = f"=IFERROR(CEILING(C{row_num} / VLOOKUP(A{row_num}, Purchasing_Inventory!A:G, 5, FALSE), 1), 0)"
-    wh_html += f"<tr><td>{i_id}</td><td>{i_name}</td><td>{total_req}</td><td>{unit}</td><td>{packs}</td></tr>\n"
-wh_html += "</table></body></html>"
-
-save_versioned_html("Warehouse_Request_table.html", wh_html)
-
-# 9. INDEX HTML
-index_content = f"""<!DOCTYPE html>
+
+def build_warehouse_request():
+    index, storage = bom_index(), load_storage_units()
+    on_hand = load_on_hand()
+    gross, net = net_requirements(index, load_forecast(), on_hand)
+
+    def rows():
+        for code, qty in gross.items():
+            if code in index.children or qty <= 0:
+                continue                        # made in the kitchen / LOSS lines
+            base_unit, storage_unit, pack = storage.get(code, ("", "", None))
+            packs = issue_packs(net[code], pack)
+            yield [code, index.nom.get(code, {}).get('Name', ''), cell(qty),
+                   cell(on_hand.get(code, 0)), cell(net[code]), base_unit, storage_unit,
+                   cell(pack or ""), packs, cell(float(packs * (pack or 1)))]
+
+    return Table(WAREHOUSE_COLUMNS, rows())
+
+
+# 9. PRODUCTION SCHEDULE
+# Chef Job List sequenced by the finite-capacity scheduler (see scheduler.py)
+def build_production_schedule():
+    placed, _ = plan_schedule(bom_index(), batch_plans())
+    return Table(SCHEDULE_COLUMNS, schedule_rows(placed, availability_minutes()))
+
+# 10. BATCH PLAN
+# Batch counts/sizes fitted to storage packs and machine capacity (see batch_optimizer.py)
+def build_batch_plan():
+    index, operations = bom_index(), load_operations()
+    return Table(BATCH_PLAN_COLUMNS, batch_plan_rows(index, batch_plans(), operations, load_sale_ratios()))
+
+
+# Table name → input files it is built from (code files are tracked per generator).
+# Each table is written as <name>.jsonl (data, versioned) and <name>.html (view).
+TABLES = [
+    ("Groups_table",                           ["Groups.tsv"],                      build_groups),
+    ("Product_Categories_table",               ["Product_Categories.tsv"],          build_product_categories),
+    ("Modifier_Schema_Registry_table",         ["Modifier_Schema_Registry.tsv"],    build_modifier_schema_registry),
+    ("Nomenclature_Operational_table",         ["Nomenclature.tsv", "drive_links.json"], build_nomenclature),
+    ("Production_Flow_Operational_table",      ["Production_Flow.tsv"],             build_production_flow),
+    ("Resource_Capacity_table",                [],                                  build_resource_capacity),
+    ("BOM_Operational_table",                  ["BOM.tsv", "Nomenclature.tsv", "UOM_Mapping.tsv"], build_bom),
+    ("Daily_Production_Plan_table",            ["Sales_Forecast.tsv", "BOM.tsv", "Nomenclature.tsv",
+                                                "UOM_Mapping.tsv", "Production_Flow.tsv"], build_daily_plan),
+    ("Resource_Load_Report_table",             [],                                  build_resource_load),
+    ("Chef_Job_List_table",                    ["Production_Flow.tsv"],             build_chef_job_list),
+    ("Warehouse_Request_table",                ["Sales_Forecast.tsv", "BOM.tsv", "Nomenclature.tsv",
+                                                "UOM_Mapping.tsv", "Stock_On_Hand.tsv"], build_warehouse_request),
+    ("Production_Schedule_table",              ["Production_Flow.tsv", "Sales_Forecast.tsv", "BOM.tsv",
+                                                "Nomenclature.tsv", "UOM_Mapping.tsv"], build_production_schedule),
+    ("Batch_Plan_table",                       ["Sales_Forecast.tsv", "BOM.tsv", "Nomenclature.tsv",
+                                                "UOM_Mapping.tsv", "Production_Flow.tsv"], build_batch_plan),
+]
+CODE_FILES = ["generate_operations.py", "bom_engine.py", "cost_rollup.py",
+              "production_planner.py", "purchasing.py", "table_render.py",
+              "kitchen.py", "scheduler.py", "batch_optimizer.py", "model.py", "dataset.py"]
+
+
+def write_index():
+    index_content = f"""<!DOCTYPE html>
 <html><head><meta charset="utf-8"><title>Syrve Tables Index - {version}</title>
 <style>
     body {{ font-family: sans-serif; padding: 20px; }}
@@ -450,13 +379,45 @@ index_content = f"""<!DOCTYPE html>
 <body>
 <h1>Syrve API - Generated Tables ({version})</h1>
 <p>Последняя версия выделена жирным шрифтом. Все файлы доступны по прямым ссылкам ниже.</p>
+<p class="versioned">Старые версии: <code>python version_store.py restore &lt;table&gt; &lt;version&gt;</code></p>
 <ul>
 """
-for latest, versioned in generated_files:
-    index_content += f'<li><a class="latest" href="{latest}">{latest} (Latest)</a> | <a class="versioned" href="{versioned}">{versioned}</a></li>\n'
-index_content += "</ul></body></html>"
-
-with open("index.html", "w", encoding="utf-8") as f:
-    f.write(index_content)
-
-print(f"Generated Corrected Operational Tables with version {version}")
+    for name, _, _ in TABLES:
+        latest = f"{name}.html" if HTML_VIEW else f"{name}.jsonl"
+        # Only distinct contents are listed; identical re-runs add no version
+        versions = ", ".join(e["version"] for e in reversed(history(f"{name}.jsonl")))
+        index_content += f'<li><a class="latest" href="{latest}">{latest} (Latest)</a> | <span class="versioned">{versions}</span></li>\n'
+    index_content += "</ul></body></html>"
+
+    with open("index.html", "w", encoding="utf-8") as f:
+        f.write(index_content)
+
+
+def main():
+    manifest = BuildManifest("generate_operations", CODE_FILES, {"formulas": FORMULA_MODE})
+    rebuilt = []
+    for name, inputs, build in TABLES:
+        output, views = f"{name}.jsonl", [f"{name}.html"] if HTML_VIEW else []
+        if manifest.is_stale(output, inputs, views):
+            # Rows stream straight into the artifact; the views re-read it
+            save_table(output, iter_jsonl(build()), version)
+            for view in views:
+                with open(output, 'r', encoding='utf-8') as f:
+                    write_html(view, read_jsonl_table(f))
+            manifest.record(output, inputs, views)
+            rebuilt.append(name)
+    manifest.save()
+
+    if not rebuilt:
+        print("All operational tables are up to date.")
+        return
+    # 11. INDEX HTML
+    write_index()
+    print(f"Generated Corrected Operational Tables with version {version}: "
+          f"{len(rebuilt)}/{len(TABLES)} rebuilt")
+    for output in rebuilt:
+        print(f"  + {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+kitchen.py
+Kitchen operations reference data — what each Production_Flow operation
+needs (staff role, instruction, whether the cook is free while it runs),
+the equipment capacity and the staffing of a shift. Shared by
+generate_operations.py and scheduler.py.
+"""
+
+# Operation → (Staff_Role, Instruction_Step, Parallel_Task_Possible)
+OPERATION_STEPS = {
+    "Baking":             ("Prep Cook", "Bake at 180°C until soft through", "Yes"),
+    "Roasting Trimmings": ("Prep Cook", "Spread trimmings on GN tray; roast 200°C 20-30 min until caramelised (Maillard)", "Yes"),
+    "Sauteing":           ("Chef",      "Saute vegetables with continuous stirring", "No"),
+    "Simmering":          ("Prep Cook", "Cover roasted veg with cold RO water; bring to boil, reduce to bare simmer 60-90 min", "Yes"),
+    "Straining":          ("Prep Cook", "Strain through fine sieve/cheesecloth; solids to compost (Zero-Waste principle)", "Yes"),
+    "Boiling Potato":     ("Prep Cook", "Boil borsch base until potatoes are tender", "Yes"),
+    "Cooling":            ("Packager",  "Rapid blast chill to 3°C", "Yes"),
+    "Vacuuming":          ("Packager",  "Vacuum seal (broth: 5L bags; borsch base: 1L bags)", "No"),
+}
+DEFAULT_STEP = ("Prep Cook", "", "Yes")
+
+# Equipment_ID, Equipment_Name, Unit_Capacity, Daily_Availability_Min
+RESOURCE_CAPACITY = [
+    ("L-1-K-EL-CON-OVEN-83", "Convection Oven Unit 20", "10 GN 1/1 Trays", "480"),
+    ("L-2-S-INDCT-BRN-2-6",  "Induction Burner Unit 65", "15 Liters",      "480"),
+    ("L-1-K-GAS-RNG-570-32", "Gas Range Unit 32",        "50 Liters",      "480"),
+    ("L-1-K-BL-FRZ-790-66",  "Blast Chiller Unit 66",    "20 kg",          "600"),
+    ("L-1-K-VAC-500-67",     "Vacuum Sealer Unit 67",    "1 Bag / Minute", "480"),
+]
+
+# Largest batch one machine takes per run: (qty, unit). Units are the
+# product's base unit (kg or l; 1 l of soup ≈ 1 kg) or GN_TRAY, which is
+# converted with the product's own "GN 1/1" Storage_Ratio (else GN_TRAY_KG).
+GN_TRAY    = "GN 1/1"
+GN_TRAY_KG = 3.0
+BATCH_CAPACITY = {
+    "L-1-K-EL-CON-OVEN-83": (10, GN_TRAY),
+    "L-2-S-INDCT-BRN-2-6":  (15, "l"),
+    "L-1-K-GAS-RNG-570-32": (50, "l"),
+    "L-1-K-BL-FRZ-790-66":  (20, "kg"),
+}
+
+# Operations done by hand (no machine to book)
+MANUAL_EQUIPMENT = "MANUAL"
+
+# Staff on one production shift: Staff_Role → headcount
+SHIFT_STAFF = {
+    "Chef":      1,
+    "Prep Cook": 2,
+    "Packager":  1,
+}
+SHIFT_START = "06:00"
+
+
+def operation_step(operation):
+    return OPERATION_STEPS.get(operation, DEFAULT_STEP)
+
+
+def availability_minutes():
+    """{Equipment_ID: Daily_Availability_Min}."""
+    return {e_id: int(avail) for e_id, _, _, avail in RESOURCE_CAPACITY}
@@ -0,0 +1,334 @@
+"""
+model.py
+Compact typed in-memory model of the catalog TSVs shared by the generators:
+Nomenclature, BOM, UOM_Mapping, Modifier_Schemes and Production_Flow.
+
+Each row is a __slots__ record (no per-row dict) whose numeric columns are
+parsed once into typed attributes; the original cell text is kept alongside
+for tables that echo it. Equal cell strings share one object, so the codes,
+names and units repeated on every BOM line are stored once. Files are
+cached per process through dataset.cached().
+
+Records also answer record['Column'] / record.get('Column', default) with
+the TSV text, so code written against csv.DictReader rows reads them as is.
+
+Model indexes the tables once: items by code and by name, BOM children-of
+and where-used, UOM by product, modifier options by schema and by dish,
+operations by product.
+
+Usage:  python model.py [bom_lines]     (load-time / memory check vs. DictReader)
+"""
+
+import csv
+import gc
+import io
+import sys
+import time
+import tracemalloc
+
+from dataset import cached
+
+
+def to_float(value, default=None):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def to_int(value, default=0):
+    number = to_float(value)
+    return default if number is None else int(number)
+
+
+# ─── Records ────────────────────────────────────────────────────────────────
+class Record:
+    """
+    Base row type. COLUMNS lists the TSV columns in constructor order;
+    TEXT maps each column to the attribute holding its cell text.
+    """
+    __slots__ = ()
+    COLUMNS = ()
+    TEXT = {}
+
+    def __getitem__(self, column):
+        return getattr(self, self.TEXT[column])
+
+    def get(self, column, default=None):
+        attr = self.TEXT.get(column)
+        return default if attr is None else getattr(self, attr)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(repr(self[c]) for c in self.COLUMNS[:3])}, …)"
+
+
+class Item(Record):
+    __slots__ = ('code', 'sys_id', 'name', 'type', 'order_item_type', 'notes',
+                 'std_output_text', 'std_output', 'std_uom', 'syrve_sync', 'measure_unit',
+                 'group', 'category', 'schema', 'kcal', 'protein', 'fat', 'carbs', 'yield_text')
+    COLUMNS = ('Short_Code', 'Syrve_System_ID', 'Name', 'Type', 'OrderItemType', 'UsageNotes',
+               'Standard_Output_Amount', 'Standard_Output_UOM', 'Syrve_Sync', 'measureUnit',
+               'groupId', 'productCategoryId', 'modifierSchemaId',
+               'kcal_per100g', 'protein_per100g', 'fat_per100g', 'carbs_per100g', 'Yield')
+    TEXT = {'Short_Code': 'code', 'Syrve_System_ID': 'sys_id', 'Name': 'name', 'Type': 'type',
+            'OrderItemType': 'order_item_type', 'UsageNotes': 'notes',
+            'Standard_Output_Amount': 'std_output_text', 'Standard_Output_UOM': 'std_uom',
+            'Syrve_Sync': 'syrve_sync', 'measureUnit': 'measure_unit', 'groupId': 'group',
+            'productCategoryId': 'category', 'modifierSchemaId': 'schema',
+            'kcal_per100g': 'kcal', 'protein_per100g': 'protein', 'fat_per100g': 'fat',
+            'carbs_per100g': 'carbs', 'Yield': 'yield_text'}
+
+    def __init__(self, code, sys_id, name, type_, order_item_type, notes, std_output,
+                 std_uom, syrve_sync, measure_unit, group, category, schema,
+                 kcal, protein, fat, carbs, yield_text):
+        self.code = code
+        self.sys_id = sys_id
+        self.name = name
+        self.type = type_
+        self.order_item_type = order_item_type
+        self.notes = notes
+        self.std_output_text = std_output
+        self.std_output = to_float(std_output)
+        self.std_uom = std_uom
+        self.syrve_sync = syrve_sync
+        self.measure_unit = measure_unit
+        self.group = group
+        self.category = category
+        self.schema = schema
+        self.kcal, self.protein, self.fat, self.carbs = kcal, protein, fat, carbs
+        self.yield_text = yield_text               # net / gross after trim; '' = 1
+
+    @property
+    def nutrition(self):
+        """(kcal, protein, fat, carbs) per 100 g as floats; None where not filled in."""
+        return tuple(to_float(v) for v in (self.kcal, self.protein, self.fat, self.carbs))
+
+
+class BomLine(Record):
+    __slots__ = ('parent', 'parent_name', 'child', 'child_name', 'qty_text', 'qty', 'unit')
+    COLUMNS = ('Parent_Code', 'Parent_Name', 'Child_Code', 'Child_Name', 'QuantityGross', 'Unit')
+    TEXT = {'Parent_Code': 'parent', 'Parent_Name': 'parent_name', 'Child_Code': 'child',
+            'Child_Name': 'child_name', 'QuantityGross': 'qty_text', 'Unit': 'unit'}
+
+    def __init__(self, parent, parent_name, child, child_name, qty, unit):
+        self.parent = parent
+        self.parent_name = parent_name
+        self.child = child
+        self.child_name = child_name
+        self.qty_text = qty
+        self.qty = to_float(qty)                  # None: not a number, line is ignored
+        self.unit = unit
+
+
+class Uom(Record):
+    __slots__ = ('code', 'name', 'base', 'storage', 'storage_ratio_text', 'storage_ratio',
+                 'sale', 'sale_ratio_text', 'sale_ratio')
+    COLUMNS = ('Product_Code', 'Product_Name', 'Base_UOM', 'Storage_UOM', 'Storage_Ratio',
+               'Sale_UOM', 'Sale_Ratio')
+    TEXT = {'Product_Code': 'code', 'Product_Name': 'name', 'Base_UOM': 'base',
+            'Storage_UOM': 'storage', 'Storage_Ratio': 'storage_ratio_text',
+            'Sale_UOM': 'sale', 'Sale_Ratio': 'sale_ratio_text'}
+
+    def __init__(self, code, name, base, storage, storage_ratio, sale, sale_ratio):
+        self.code = code
+        self.name = name
+        self.base = base
+        self.storage = storage
+        self.storage_ratio_text = storage_ratio
+        self.storage_ratio = to_float(storage_ratio)
+        self.sale = sale
+        self.sale_ratio_text = sale_ratio
+        self.sale_ratio = to_float(sale_ratio)
+
+
+class ModifierOption(Record):
+    __slots__ = ('schema', 'dish', 'dish_name', 'group', 'group_name', 'min_text', 'max_text',
+                 'item', 'item_name', 'default_text', 'portion_text',
+                 'min_amount', 'max_amount', 'default_amount', 'portion_kg')
+    COLUMNS = ('Schema_Code', 'Target_Dish_Code', 'Target_Dish_Name', 'Modifier_Group_Code',
+               'Modifier_Group_Name', 'MinAmount_Group', 'MaxAmount_Group', 'Modifier_Item_Code',
+               'Modifier_Item_Name', 'DefaultAmount_Item', 'Portion_Size_kg')
+    TEXT = {'Schema_Code': 'schema', 'Target_Dish_Code': 'dish', 'Target_Dish_Name': 'dish_name',
+            'Modifier_Group_Code': 'group', 'Modifier_Group_Name': 'group_name',
+            'MinAmount_Group': 'min_text', 'MaxAmount_Group': 'max_text',
+            'Modifier_Item_Code': 'item', 'Modifier_Item_Name': 'item_name',
+            'DefaultAmount_Item': 'default_text', 'Portion_Size_kg': 'portion_text'}
+
+    def __init__(self, schema, dish, dish_name, group, group_name, min_amount, max_amount,
+                 item, item_name, default_amount, portion_kg):
+        self.schema = schema
+        self.dish = dish
+        self.dish_name = dish_name
+        self.group = group
+        self.group_name = group_name
+        self.min_text = min_amount
+        self.max_text = max_amount
+        self.item = item
+        self.item_name = item_name
+        self.default_text = default_amount
+        self.portion_text = portion_kg
+        self.min_amount = to_int(min_amount)
+        self.max_amount = to_int(max_amount)
+        self.default_amount = to_int(default_amount)
+        self.portion_kg = to_float(portion_kg, 0.0)
+
+
+class FlowStep(Record):
+    __slots__ = ('product', 'product_name', 'operation', 'equipment', 'temperature',
+                 'duration_text', 'duration', 'bottleneck', 'notes')
+    COLUMNS = ('Product_Code', 'Product_Name', 'Operation', 'Equipment_ID', 'Temperature',
+               'Duration_Min', 'Is_Bottleneck', 'Notes')
+    TEXT = {'Product_Code': 'product', 'Product_Name': 'product_name', 'Operation': 'operation',
+            'Equipment_ID': 'equipment', 'Temperature': 'temperature',
+            'Duration_Min': 'duration_text', 'Is_Bottleneck': 'bottleneck', 'Notes': 'notes'}
+
+    def __init__(self, product, product_name, operation, equipment, temperature, duration,
+                 bottleneck, notes):
+        self.product = product
+        self.product_name = product_name
+        self.operation = operation
+        self.equipment = equipment
+        self.temperature = temperature
+        self.duration_text = duration
+        self.duration = to_float(duration, 0.0)    # minutes per batch
+        self.bottleneck = bottleneck
+        self.notes = notes
+
+
+# ─── Loading ────────────────────────────────────────────────────────────────
+def parse_records(cls, f):
+    """Records of `cls` from an open TSV; columns are matched by header name, missing ones are ''."""
+    text = f.read()
+    if '"' in text:
+        rows = csv.reader(io.StringIO(text), delimiter='\t')    # quoted cells: full csv rules
+    else:                                                       # plain TSV: ~2× faster
+        rows = (line.removesuffix('\r').split('\t') for line in text.split('\n'))
+    header = next(rows, [])
+    position = {name: i for i, name in enumerate(header)}
+    picks = [position.get(c) for c in cls.COLUMNS]
+    in_order = picks == list(range(len(cls.COLUMNS)))
+    # One str object per distinct cell value (codes, names and units repeat on every line)
+    strings = {}
+    same = strings.setdefault
+    records = []
+    # Records hold only strings and numbers, so no reference cycles: skip the
+    # cyclic GC passes that bulk allocation would otherwise trigger
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for row in rows:
+            if len(row) == 1 and not row[0]:
+                continue
+            if not in_order or len(row) != len(picks):
+                row = [row[i] if i is not None and i < len(row) else '' for i in picks]
+            records.append(cls(*map(same, row, row)))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return records
+
+
+# One parser per record type, so dataset.cached() keeps one entry per (file, type)
+PARSERS = {cls: (lambda f, cls=cls: parse_records(cls, f))
+           for cls in (Item, BomLine, Uom, ModifierOption, FlowStep)}
+
+
+def read_table(path, cls):
+    """[cls record, …] of a TSV, cached per process; FileNotFoundError if it is missing."""
+    return cached(path, PARSERS[cls])
+
+
+class Model:
+    """
+    items / bom / uom / modifiers / flow   every record, in file order
+    by_code, by_name                       Item by Short_Code / Name
+    children[parent], where_used[child]    BomLine lists
+    uom_by_code                            Uom by Product_Code
+    options_by_schema, options_by_dish     ModifierOption lists
+    steps_by_product                       FlowStep lists, in operation order
+    """
+
+    def __init__(self, items, bom, uom, modifiers, flow):
+        self.items, self.bom, self.uom, self.modifiers, self.flow = items, bom, uom, modifiers, flow
+        self.by_code = {i.code: i for i in items}
+        self.by_name = {i.name: i for i in items}
+        self.children, self.where_used = {}, {}
+        for line in bom:
+            self.children.setdefault(line.parent, []).append(line)
+            self.where_used.setdefault(line.child, []).append(line)
+        self.uom_by_code = {u.code: u for u in uom}
+        self.options_by_schema, self.options_by_dish = {}, {}
+        for option in modifiers:
+            self.options_by_schema.setdefault(option.schema, []).append(option)
+            self.options_by_dish.setdefault(option.dish, []).append(option)
+        self.steps_by_product = {}
+        for step in flow:
+            self.steps_by_product.setdefault(step.product, []).append(step)
+
+    def item(self, key):
+        """Item by short code or by name."""
+        found = self.by_code.get(key) or self.by_name.get(key)
+        if found is None:
+            raise KeyError(f"Unknown item: {key}")
+        return found
+
+
+def load_model(nom_path='Nomenclature.tsv', bom_path='BOM.tsv', uom_path='UOM_Mapping.tsv',
+               modifiers_path='Modifier_Schemes.tsv', flow_path='Production_Flow.tsv'):
+    return Model(read_table(nom_path, Item), read_table(bom_path, BomLine),
+                 read_table(uom_path, Uom), read_table(modifiers_path, ModifierOption),
+                 read_table(flow_path, FlowStep))
+
+
+# ─── Size check ─────────────────────────────────────────────────────────────
+def synthetic_bom(path, lines):
+    """A BOM.tsv with `lines` rows over a few thousand distinct codes."""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        w = csv.writer(f, delimiter='\t', lineterminator='\n')
+        w.writerow(BomLine.COLUMNS)
+        for n in range(lines):
+            parent, child = n // 8, 2000 + n % 3000
+            w.writerow([f"PF-ITEM_{parent}", f"SF Item {parent}", f"RAW-ITEM_{child}",
+                        f"Raw Item {child}", f"{(n % 97) / 10 + 0.1:.3f}", "kg"])
+
+
+def measure(load):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = load()
+    seconds = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # second timing without tracemalloc overhead
+    start = time.perf_counter()
+    load()
+    return result, min(seconds, time.perf_counter() - start), size
+
+
+def main():
+    import os
+    import tempfile
+
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'BOM.tsv')
+        synthetic_bom(path, lines)
+
+        def dict_rows():
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                return list(csv.DictReader(f, delimiter='\t'))
+
+        def records():
+            with open(path, 'r', encoding='utf-8', newline='') as f:
+                return parse_records(BomLine, f)
+
+        _, dict_s, dict_b = measure(dict_rows)
+        _, rec_s, rec_b = measure(records)
+    print(f"{lines:,} BOM lines")
+    print(f"  csv.DictReader dicts   {dict_s * 1000:8.0f} ms  {dict_b / 2**20:7.1f} MiB")
+    print(f"  model.BomLine records  {rec_s * 1000:8.0f} ms  {rec_b / 2**20:7.1f} MiB  "
+          f"({rec_s / dict_s:.0%} of the time, {rec_b / dict_b:.0%} of the memory)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+"""
+modifier_bounds.py
+Cost of a dish's modifiers over every combination a guest may order, not
+only the default set.
+
+A combination picks, in every group of the dish's schema, between
+MinAmount_Group and MaxAmount_Group items in total (each item up to
+ITEM_MAX_AMOUNT times, or its DefaultAmount_Item if that is larger).
+Listing the combinations explodes with the number of groups, so each group
+is reduced by dynamic programming over "amount chosen so far" — a
+knapsack on the amount, O(items × MaxAmount_Group) — keeping per amount
+the number of selections, the sum and sum of squares of their cost and the
+cheapest and dearest one. Groups are independent, so for the schema
+
+    combinations = Π n_g        min = Σ min_g        max = Σ max_g
+    expected     = Σ mean_g     variance = Σ var_g
+
+all exact, with every valid combination equally likely. The distribution
+is the convolution of the groups' cost distributions on a grid of GRID
+steps between min and max, re-centred on the exact mean, so its
+percentiles are exact to within a few grid steps. A schema with 12 groups
+of 8 items takes milliseconds.
+
+Usage:  python modifier_bounds.py                       (schemas of Modifier_Schemes.tsv)
+        python modifier_bounds.py --synthetic G I       (G groups of I items, timing)
+"""
+
+import math
+import random
+import sys
+import time
+from collections import namedtuple
+
+from model import ModifierOption, read_table
+
+ITEM_MAX_AMOUNT = 1
+GRID = 100
+
+# distribution: [(cost, probability), …] by cost; None when no combination is valid
+Bounds = namedtuple('Bounds', 'groups combinations min expected max std distribution')
+# items: [(serving cost, max amount), …]
+Group = namedtuple('Group', 'code min_amount max_amount items')
+
+
+def _group_moments(group):
+    """(count, cost sum, cost² sum, min, max) over the group's valid selections."""
+    states = {0: (1, 0.0, 0.0, 0.0, 0.0)}     # amount → (n, Σcost, Σcost², min, max)
+    for cost, upper in group.items:
+        grown = {}
+        for amount, (n, s, q, lo, hi) in states.items():
+            for a in range(min(upper, group.max_amount - amount) + 1):
+                c = a * cost
+                new = (n, s + n * c, q + 2 * c * s + n * c * c, lo + c, hi + c)
+                old = grown.get(amount + a)
+                grown[amount + a] = new if old is None else (
+                    old[0] + new[0], old[1] + new[1], old[2] + new[2],
+                    min(old[3], new[3]), max(old[4], new[4]))
+        states = grown
+    valid = [states[k] for k in range(group.min_amount, group.max_amount + 1) if k in states]
+    if not valid:
+        return 0, 0.0, 0.0, None, None
+    return (sum(v[0] for v in valid), sum(v[1] for v in valid), sum(v[2] for v in valid),
+            min(v[3] for v in valid), max(v[4] for v in valid))
+
+
+def _group_distribution(group, step):
+    """{grid step: count} of the group's valid selections."""
+    states = {0: {0: 1}}                        # amount → {cost in steps: count}
+    for cost, upper in group.items:
+        grown = {}
+        for amount, dist in states.items():
+            for a in range(min(upper, group.max_amount - amount) + 1):
+                shift = round(a * cost / step)
+                target = grown.setdefault(amount + a, {})
+                for b, n in dist.items():
+                    target[b + shift] = target.get(b + shift, 0) + n
+        states = grown
+    total = {}
+    for k in range(group.min_amount, group.max_amount + 1):
+        for b, n in states.get(k, {}).items():
+            total[b] = total.get(b, 0) + n
+    return total
+
+
+def _convolve(a, b):
+    out = {}
+    for i, x in a.items():
+        for j, y in b.items():
+            out[i + j] = out.get(i + j, 0) + x * y
+    return out
+
+
+def schema_bounds(groups, grid=GRID):
+    """Bounds over every valid combination of `groups` (Group tuples)."""
+    moments = [_group_moments(g) for g in groups]
+    combinations = math.prod(m[0] for m in moments)
+    if not combinations:
+        return Bounds(len(groups), 0, None, None, None, None, None)
+    expected = sum(s / n for n, s, _, _, _ in moments)
+    variance = sum(max(q / n - (s / n) ** 2, 0.0) for n, s, q, _, _ in moments)
+    low, high = sum(m[3] for m in moments), sum(m[4] for m in moments)
+
+    if high - low < 1e-9:
+        distribution = [(low, 1.0)]
+    else:
+        step = (high - low) / grid
+        dist = {0: 1}
+        for g in groups:
+            dist = _convolve(dist, _group_distribution(g, step))
+        # Rounding every item to the grid shifts the whole distribution a
+        # little; re-centre it on the exact expected cost
+        shift = expected - sum(b * n for b, n in dist.items()) * step / combinations
+        distribution = [(b * step + shift, n / combinations) for b, n in sorted(dist.items())]
+    return Bounds(len(groups), combinations, low, expected, high, math.sqrt(variance), distribution)
+
+
+def percentile(bounds, p):
+    """Cost at or below which a share `p` (0–1) of the combinations fall."""
+    if not bounds.distribution:
+        return None
+    seen = 0.0
+    for cost, share in bounds.distribution:
+        seen += share
+        if seen >= p - 1e-12:
+            return min(max(cost, bounds.min), bounds.max)
+    return bounds.max
+
+
+def schema_groups(options, serving_cost):
+    """{schema: [Group, …]} from Modifier_Schemes records; serving_cost(option) → cost of one."""
+    schemas = {}
+    for option in options:
+        groups = schemas.setdefault(option.schema, {})
+        group = groups.get(option.group)
+        if group is None:
+            group = groups[option.group] = Group(option.group, option.min_amount,
+                                                 option.max_amount, [])
+        group.items.append((serving_cost(option), max(ITEM_MAX_AMOUNT, option.default_amount)))
+    return {schema: list(groups.values()) for schema, groups in schemas.items()}
+
+
+def bounds_by_schema(options, serving_cost, grid=GRID):
+    """{schema: Bounds} of every schema in `options`."""
+    return {schema: schema_bounds(groups, grid)
+            for schema, groups in schema_groups(options, serving_cost).items()}
+
+
+# ─── CLI ────────────────────────────────────────────────────────────────────
+def print_bounds(name, b, seconds):
+    if not b.combinations:
+        print(f"{name}: no valid combination")
+        return
+    print(f"{name}: {b.groups} groups, {b.combinations:,} combinations in {seconds * 1000:.1f} ms")
+    print(f"  min {b.min:.2f}  expected {b.expected:.2f} ± {b.std:.2f}  max {b.max:.2f}  "
+          f"(P10 {percentile(b, 0.1):.2f}, median {percentile(b, 0.5):.2f}, "
+          f"P90 {percentile(b, 0.9):.2f})")
+
+
+def main():
+    if '--synthetic' in sys.argv:
+        i = sys.argv.index('--synthetic')
+        n_groups, n_items = int(sys.argv[i + 1]), int(sys.argv[i + 2])
+        rnd = random.Random(1)
+        groups = [Group(f"G{g}", rnd.randint(0, 1), rnd.randint(1, n_items),
+                        [(round(rnd.uniform(1, 40), 2), rnd.choice([1, 1, 2])) for _ in range(n_items)])
+                  for g in range(n_groups)]
+        start = time.perf_counter()
+        b = schema_bounds(groups)
+        print_bounds(f"synthetic {n_groups}×{n_items}", b, time.perf_counter() - start)
+        return
+
+    from generate_costing import serving_cost
+    options = read_table('Modifier_Schemes.tsv', ModifierOption)
+    for schema, groups in schema_groups(options, serving_cost).items():
+        start = time.perf_counter()
+        b = schema_bounds(groups)
+        print_bounds(schema, b, time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    main()
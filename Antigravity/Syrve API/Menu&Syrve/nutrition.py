@@ -0,0 +1,136 @@
+"""
+nutrition.py
+Nutrition of every PF and SALE item, derived from its BOM instead of typed
+in by hand.
+
+Measured values live only on the BOM leaves — purchased items and
+modifiers, Nomenclature kcal/protein/fat/carbs_per100g (per 100 ml for
+items measured in l; 1 l is taken as 1 kg, as in the batch planner). For
+one unit of a made item's output
+
+    N[item] = Σ_leaf  R[item, leaf] · yield(leaf) · n[leaf]
+
+where R is the BOM requirement matrix: BomIndex.unit_requirements(), the
+gross quantity of every leaf in one unit of the item over all BOM paths.
+The whole menu is the one product R · (yield ∘ n), evaluated sparse, one
+row per item, and cached per item. Trim waste (yield) is not eaten, so only
+the net part of a leaf counts; Processing Loss lines (evaporation, water
+taken up) change the weight of the output, not its nutrients.
+
+A SALE portion is one unit of the dish plus its default modifiers
+(DefaultAmount_Item × Portion_Size_kg); it weighs the net weight of its
+ingredients plus those modifiers. A PF portion is one Sale_Ratio of its
+base unit. Leaves without values are reported as missing, not counted as 0.
+
+Usage:  python nutrition.py
+"""
+
+from bom_engine import load_bom_index
+from cost_rollup import load_sale_ratios, yield_for
+from model import ModifierOption, read_table
+
+NUTRIENTS = ('kcal', 'protein', 'fat', 'carbs')
+NON_FOOD_TYPES = {'service'}            # Processing Loss and other accounting lines
+
+
+class NutritionRollup:
+    """
+    leaf[code]      nutrients of 1 kg (or l) gross of a leaf, yield applied
+    defaults[dish]  [(modifier_code, kg), …] served by default with a dish
+    """
+
+    def __init__(self, index, sale_ratios, modifiers):
+        # index: bom_engine.BomIndex; modifiers: model.ModifierOption records
+        self.index = index
+        self.nom = index.nom
+        self.sale_ratios = sale_ratios
+        self.leaf = {}
+        for code, item in self.nom.items():
+            values = item.nutrition
+            if code not in index.children and None not in values:
+                net = float(yield_for(item))
+                self.leaf[code] = tuple(v * 10 * net for v in values)
+        self.defaults = {}
+        for option in modifiers:
+            if option.default_amount and option.portion_kg:
+                self.defaults.setdefault(option.dish, []).append(
+                    (option.item, option.default_amount * option.portion_kg))
+        self._per_unit = {}
+
+    def is_food(self, code):
+        item = self.nom.get(code)
+        return item is None or item.type not in NON_FOOD_TYPES
+
+    def per_unit(self, code):
+        """(nutrients, missing leaf codes) of one unit of `code` (kg, l or portion); cached."""
+        if code not in self._per_unit:
+            if code not in self.index.children:
+                values = self.leaf.get(code)
+                missing = frozenset() if values or not self.is_food(code) else frozenset([code])
+                self._per_unit[code] = (values or (0.0,) * len(NUTRIENTS), missing)
+            else:
+                totals, missing = [0.0] * len(NUTRIENTS), set()
+                for leaf, qty in self.index.unit_requirements(code).items():
+                    if leaf in self.index.children:
+                        continue                    # made item: counted through its leaves
+                    values = self.leaf.get(leaf)
+                    if values is None:
+                        if self.is_food(leaf):
+                            missing.add(leaf)
+                        continue
+                    for k, v in enumerate(values):
+                        totals[k] += qty * v
+                self._per_unit[code] = (tuple(totals), frozenset(missing))
+        return self._per_unit[code]
+
+    def net_weight(self, code):
+        """kg of food in one unit of `code`: its direct ingredients, net of trim."""
+        weight = 0.0
+        for child, qty in self.index.children.get(code, ()):
+            if self.is_food(child):
+                weight += qty * float(yield_for(self.nom.get(child)))
+        return weight
+
+    def portion(self, code):
+        """(weight kg, nutrients, missing) of one portion of a PF or SALE item."""
+        nutrients, missing = self.per_unit(code)
+        if code.startswith("SALE-"):
+            weight, nutrients, missing = self.net_weight(code), list(nutrients), set(missing)
+            for modifier, kg in self.defaults.get(code, ()):
+                values, mod_missing = self.per_unit(modifier)
+                weight += kg
+                missing |= mod_missing
+                for k, v in enumerate(values):
+                    nutrients[k] += kg * v
+            return weight, tuple(nutrients), frozenset(missing)
+        ratio = self.sale_ratios.get(code) or 1.0
+        return ratio, tuple(v * ratio for v in nutrients), missing
+
+    def menu(self):
+        """{code: (weight kg, per portion, per 100 g, missing)} of every item with a BOM."""
+        result = {}
+        for code in self.index.order:
+            if code not in self.index.children:
+                continue
+            weight, nutrients, missing = self.portion(code)
+            per_100g = tuple(v / weight / 10 for v in nutrients) if weight else None
+            result[code] = (weight, nutrients, per_100g, missing)
+        return result
+
+
+def load_nutrition():
+    return NutritionRollup(load_bom_index(), load_sale_ratios(),
+                           read_table('Modifier_Schemes.tsv', ModifierOption))
+
+
+def main():
+    rollup = load_nutrition()
+    print(f"{'Item':<28} {'Portion':>8}  " + "  ".join(f"{n:>8}" for n in NUTRIENTS) + "   per 100 g")
+    for code, (weight, portion, per_100g, missing) in rollup.menu().items():
+        per_100 = " ".join(f"{v:.1f}" for v in per_100g) if per_100g else "-"
+        line = f"{code:<28} {weight:>6.3f}kg  " + "  ".join(f"{v:>8.1f}" for v in portion)
+        print(f"{line}   {per_100}" + (f"  (missing: {', '.join(sorted(missing))})" if missing else ""))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+"""
+pipeline.py
+Runs the whole Menu&Syrve pipeline in one process, as a DAG:
+
+    generate_tsvs → cleanup_nomenclature → validate_catalog ┬→ generate_costing    ┐
+                                                            └→ generate_operations ┴→ upload_to_sheets
+    upload_drive ╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌╌┘ (order only: drive_links.json)
+
+upload_drive starts at once, alongside the TSV and costing stages, but
+generate_operations waits for it: Nomenclature_Operational_table reads the
+drive_links.json it rewrites, so the table and its manifest always see the
+finished file. That wait is for ordering only: when the Drive upload fails,
+generate_operations still runs, on the links the last upload left behind.
+With --no-upload there is nothing to wait for.
+
+A stage starts as soon as all of its dependencies have finished, on its own
+thread, so independent stages (costing and operations, the Drive upload)
+overlap. Every stage reads its TSVs through dataset.py's cache, so each file
+is parsed once per run, not once per script. validate_catalog stops the
+generators and uploads when the catalog has errors.
+
+Stages that declare inputs and outputs are cached: a manifest per stage
+(.build/pipeline.<stage>.json, see build_manifest.py) records the hashes of
+their inputs, code and outputs, and the stage is skipped while none of them
+changed. Uploads always run (they diff against the remote side themselves).
+A failed stage skips the stages that depend on it (through deps, not
+after); the others still run.
+Each stage's output is printed as one block when it finishes, followed by a
+timing summary.
+
+Usage:  python pipeline.py [--no-upload] [--force] [--no-html] [--formulas] [--full]
+"""
+
+import glob
+import sys
+import threading
+import time
+import traceback
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from io import StringIO
+
+import dataset
+from build_manifest import BuildManifest
+
+NO_UPLOAD = '--no-upload' in sys.argv
+
+# run:     callable doing the work
+# deps:    stage names that must finish first; if one fails this stage is skipped
+# cache:   callable → (inputs, outputs, code_files) for cached stages, else None
+# after:   stage names that must finish first, whether they succeed or not
+Stage = namedtuple('Stage', 'name run deps cache after', defaults=[()])
+
+
+# ─── Stages ─────────────────────────────────────────────────────────────────
+def run_generate_tsvs():
+    from generate_tsvs import generate
+    generate()
+
+
+def cache_generate_tsvs():
+    from catalog_store import CATALOG_DIR, TSV_FILES
+    return (sorted(glob.glob(f"{CATALOG_DIR}/*.yaml")), TSV_FILES,
+            ["generate_tsvs.py", "catalog_store.py"])
+
+
+def run_cleanup():
+    from cleanup_nomenclature import cleanup_nomenclature
+    cleanup_nomenclature()
+
+
+def cache_cleanup():
+    # Idempotent in-place rewrite: the input is also the output
+    return ["Nomenclature.tsv"], ["Nomenclature.tsv"], ["cleanup_nomenclature.py"]
+
+
+def run_validate():
+    from validate_catalog import REPORT_FILE, check
+    result = check(REPORT_FILE)
+    if not result['ok']:
+        raise RuntimeError(f"{result['errors']} catalog error(s); see {REPORT_FILE}")
+
+
+def cache_validate():
+    from validate_catalog import INPUTS, REPORT_FILE
+    return list(INPUTS), [REPORT_FILE], ["validate_catalog.py", "model.py", "bom_engine.py",
+                                         "cost_rollup.py", "kitchen.py"]
+
+
+def generator_cache(module):
+    """Cache spec of a table generator, from its TABLES and CODE_FILES."""
+    def spec():
+        gen = __import__(module)
+        inputs = sorted({p for _, files, _ in gen.TABLES for p in files})
+        outputs = [f"{name}.jsonl" for name, _, _ in gen.TABLES]
+        if gen.HTML_VIEW:
+            outputs += [f"{name}.html" for name, _, _ in gen.TABLES]
+        return inputs, outputs, gen.CODE_FILES
+    return spec
+
+
+def run_module(module):
+    def run():
+        __import__(module).main()
+    return run
+
+
+STAGES = [
+    Stage('generate_tsvs',        run_generate_tsvs,                  [],                cache_generate_tsvs),
+    Stage('cleanup_nomenclature', run_cleanup,                        ['generate_tsvs'], cache_cleanup),
+    Stage('validate_catalog',     run_validate,                       ['cleanup_nomenclature'],
+          cache_validate),
+    Stage('generate_costing',     run_module('generate_costing'),     ['validate_catalog'],
+          generator_cache('generate_costing')),
+    Stage('generate_operations',  run_module('generate_operations'),  ['validate_catalog'],
+          generator_cache('generate_operations'), after=['upload_drive']),
+    Stage('upload_to_sheets',     run_module('upload_to_sheets'),
+          ['generate_costing', 'generate_operations'], None),
+    Stage('upload_drive',         run_module('upload_drive'),         [],                None),
+]
+UPLOAD_STAGES = {'upload_to_sheets', 'upload_drive'}
+
+
+# ─── Output capture ─────────────────────────────────────────────────────────
+class StageOutput:
+    """sys.stdout stand-in: a thread running a stage writes into its own buffer."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def write(self, text):
+        return (getattr(self.local, 'buffer', None) or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+
+# ─── Runner ─────────────────────────────────────────────────────────────────
+def stage_manifest(stage):
+    inputs, outputs, code = stage.cache()
+    options = {'argv': sorted(a for a in sys.argv[1:] if a.startswith('--'))}
+    return BuildManifest(f"pipeline.{stage.name}", code, options), inputs, outputs
+
+
+def execute(stage, out):
+    """(status, seconds, captured output) of one stage; status is 'ran', 'cached' or 'failed'."""
+    out.local.buffer = buffer = StringIO()
+    start = time.perf_counter()
+    try:
+        if stage.cache:
+            manifest, inputs, outputs = stage_manifest(stage)
+            if not manifest.is_stale(outputs[0], inputs, outputs[1:]):
+                return 'cached', time.perf_counter() - start, buffer.getvalue()
+        stage.run()
+        if stage.cache:
+            # Fresh manifest: inputs may have been rewritten by the stage itself
+            manifest, inputs, outputs = stage_manifest(stage)
+            manifest.record(outputs[0], inputs, outputs[1:])
+            manifest.save()
+        status = 'ran'
+    except BaseException:                      # SystemExit from a script counts as a failure too
+        traceback.print_exc(file=buffer)
+        status = 'failed'
+    finally:
+        out.local.buffer = None
+    return status, time.perf_counter() - start, buffer.getvalue()
+
+
+def run(stages):
+    """Run `stages` respecting their deps and after lists; returns {name: (status, seconds)}."""
+    names = {s.name for s in stages}
+    pending = {s.name: s for s in stages}
+    results, running = {}, {}
+    out, real_stdout = StageOutput(sys.stdout), sys.stdout
+    sys.stdout = out
+    try:
+        with ThreadPoolExecutor(max_workers=len(stages)) as pool:
+            while pending or running:
+                for name, stage in list(pending.items()):
+                    deps = [d for d in stage.deps if d in names]
+                    after = [d for d in stage.after if d in names]
+                    if any(results.get(d, ('',))[0] in ('failed', 'skipped') for d in deps):
+                        results[name] = ('skipped', 0.0)
+                        del pending[name]
+                    elif all(d in results for d in deps + after):
+                        running[pool.submit(execute, stage, out)] = name
+                        del pending[name]
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    status, seconds, text = future.result()
+                    results[name] = (status, seconds)
+                    real_stdout.write(f"── {name} ({status}, {seconds:.2f} s) " + "─" * 20 + "\n")
+                    if text:
+                        real_stdout.write(text if text.endswith("\n") else text + "\n")
+    finally:
+        sys.stdout = real_stdout
+    return results
+
+
+def main():
+    stages = [s for s in STAGES if not (NO_UPLOAD and s.name in UPLOAD_STAGES)]
+    start = time.perf_counter()
+    results = run(stages)
+    wall = time.perf_counter() - start
+
+    print(f"\n{'Stage':<24} {'Status':<8} {'Time':>8}")
+    for stage in stages:
+        status, seconds = results[stage.name]
+        print(f"{stage.name:<24} {status:<8} {seconds:>7.2f}s")
+    busy = sum(seconds for _, seconds in results.values())
+    print(f"{'total':<24} {'':<8} {wall:>7.2f}s  (stage time {busy:.2f}s; "
+          f"TSVs parsed {dataset.stats['parsed']}×, reused {dataset.stats['hits']}×)")
+    if any(status in ('failed', 'skipped') for status, _ in results.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
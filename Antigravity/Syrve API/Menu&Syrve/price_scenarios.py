@@ -0,0 +1,247 @@
+"""
+price_scenarios.py
+What-if food costing: every PF and SALE item re-costed under many purchase
+price scenarios at once (supplier shocks, seasonal swings, FX moves), with
+each dish's food cost % against the 33% target.
+
+Costs are linear in the purchase prices, so a scenario is just a vector of
+price multipliers and the rollup of cost_rollup.py can be run on whole
+scenario columns instead of single prices:
+
+    cost[item, s] = Σ_line  gross · cost[child, s] / net[child]     (made child)
+                  + Σ_line  gross · price[leaf] · m[s, leaf]        (purchased)
+
+children first, as CostRollup does; a SALE item also carries its default
+modifiers (Portion_Size_kg of each). Walking the BOM lines rather than the
+flattened requirement matrix keeps the work at lines × scenarios, and a
+column no scenario moves stays a single number, so only moved prices cost
+time. Thousands of scenarios over the menu take about a second.
+
+The menu price a dish's food cost % is taken against is the one the Dish
+Cost Summary suggests today: current total cost / 0.33, rounded.
+
+Scenario file (TSV): a Scenario column, then one column per purchased item
+(Short_Code or Item_Name of purchasing.py) holding its price multiplier,
+e.g. 1.25 for +25%; missing columns and empty cells are 1.
+
+Usage:  python price_scenarios.py SCENARIOS.tsv [--out REPORT.tsv]
+        python price_scenarios.py --random N [--volatility 0.15] [--seed 1] [--out REPORT.tsv]
+"""
+
+import csv
+import math
+import random
+import sys
+import time
+
+from bom_engine import BomIndex
+from cost_rollup import load_sale_ratios, price_per_base_unit, round_half_up, yield_for
+from model import BomLine, Item, ModifierOption, read_table
+
+FOOD_COST_TARGET = 0.33
+VOLATILITY = 0.15
+MADE_PREFIXES = ("PF-", "SALE-")
+
+
+class PriceScenarios:
+    """
+    leaves          priced codes, in column order of the multiplier matrix
+    prices[j]       current price per base unit of leaves[j]
+    order           made items, children first
+    lines[item]     [(made child, gross / its net) or (leaf column, gross · price), …]
+                    making up the cost of one batch (SALE: one portion with
+                    its default modifiers)
+    per_sales_unit  {item: factor} from batch cost to cost per Sale_UOM
+    menu_price      {SALE item: price its food cost % is taken against}
+    """
+
+    def __init__(self, bom_lines, nom, prices, sale_ratios, modifiers):
+        self.nom = nom
+        self.leaves = sorted(prices)
+        self.prices = [prices[code] for code in self.leaves]
+        column = {code: j for j, code in enumerate(self.leaves)}
+
+        rows_by_parent = {}
+        for line in bom_lines:
+            rows_by_parent.setdefault(line.parent, []).append(line)
+
+        # Same walk as CostRollup: a child with BOM lines is costed per net unit
+        self.order, self.lines, net = [], {}, {}
+        for parent in reversed(BomIndex(bom_lines, nom).order):
+            if parent not in rows_by_parent:
+                continue
+            terms, net_sum = [], 0.0
+            for line in rows_by_parent[parent]:
+                gross = line.qty or 0.0
+                net_sum += gross * float(yield_for(nom.get(line.child)))
+                if line.child in self.lines:
+                    if net[line.child] and gross:
+                        terms.append((line.child, gross / net[line.child]))
+                elif line.child in column and gross:
+                    terms.append((column[line.child], gross * prices[line.child]))
+            self.order.append(parent)
+            self.lines[parent], net[parent] = terms, net_sum
+
+        for option in modifiers:
+            if option.default_text != "0" and option.dish in self.lines and option.item in column:
+                self.lines[option.dish].append(
+                    (column[option.item], (option.portion_kg or 0.0) * prices[option.item]))
+
+        self.per_sales_unit = {}
+        for code in self.order:
+            if code.startswith("SALE-"):
+                self.per_sales_unit[code] = 1.0
+            elif code.startswith(MADE_PREFIXES) and net[code]:
+                ratio = sale_ratios.get(code)
+                self.per_sales_unit[code] = (ratio if ratio is not None else 1) / net[code]
+        self.current = {code: values[0] for code, values in self.run({}).items()}
+        self.menu_price = {code: round_half_up(self.current[code] / FOOD_COST_TARGET)
+                           for code in self.per_sales_unit if code.startswith("SALE-")}
+
+    def cost(self, code):
+        """Cost per sales unit of `code` at current prices."""
+        return self.current[code]
+
+    def column_of(self, key):
+        """Matrix column of a purchased item given by Short_Code or Item_Name; None if unknown."""
+        if key in self.leaves:
+            return self.leaves.index(key)
+        for code, item in self.nom.items():
+            if item.name == key and code in self.leaves:
+                return self.leaves.index(code)
+        return None
+
+    def run(self, multipliers):
+        """
+        {item: [cost per sales unit in scenario s, …]} for every PF and SALE item.
+        multipliers: {leaf column: [multiplier in scenario s, …]}; columns not
+        given stay at 1 in every scenario.
+        """
+        n = len(next(iter(multipliers.values()))) if multipliers else 1
+        batch = {}                  # item → float (same in every scenario) or [cost, …]
+        for code in self.order:
+            fixed, acc = 0.0, None
+            for source, w in self.lines[code]:
+                values = batch[source] if source in batch else multipliers.get(source)
+                if values is None:                  # purchased, not moved: w is its cost
+                    fixed += w
+                elif isinstance(values, float):
+                    fixed += w * values
+                elif acc is None:
+                    acc = [w * v for v in values]
+                else:
+                    acc = [a + w * v for a, v in zip(acc, values)]
+            batch[code] = fixed if acc is None else [a + fixed for a in acc]
+
+        costs = {}
+        for code, scale in self.per_sales_unit.items():
+            values = batch[code]
+            costs[code] = ([values * scale] * n if isinstance(values, float)
+                           else [v * scale for v in values])
+        return costs
+
+    def food_cost_pct(self, costs):
+        """{SALE item: [food cost share of its menu price in scenario s, …]}."""
+        return {code: [c / self.menu_price[code] for c in costs[code]]
+                for code in self.menu_price if self.menu_price[code]}
+
+
+def load_scenarios_engine(modifiers_path='Modifier_Schemes.tsv'):
+    nom = {item.code: item for item in read_table('Nomenclature.tsv', Item)}
+    by_name = {item.name.strip(): code for code, item in nom.items()}
+    prices = price_per_base_unit(lambda name: by_name.get(name.strip(), "MISSING_CODE"))
+    return PriceScenarios(read_table('BOM.tsv', BomLine), nom, prices, load_sale_ratios(),
+                          read_table(modifiers_path, ModifierOption))
+
+
+# ─── Scenario matrices ──────────────────────────────────────────────────────
+def read_scenarios(path, engine):
+    """(names, {column: [multiplier, …]}) from a scenario TSV."""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        rows = list(csv.reader(f, delimiter='\t'))
+    header, rows = rows[0], [r for r in rows[1:] if any(r)]
+    names = [r[0] for r in rows]
+    multipliers = {}
+    for k, key in enumerate(header[1:], start=1):
+        j = engine.column_of(key.strip())
+        if j is None:
+            print(f"WARNING: '{key}' is not a purchased item; column ignored")
+            continue
+        multipliers[j] = [float(r[k]) if k < len(r) and r[k].strip() else 1.0 for r in rows]
+    return names, multipliers
+
+
+def random_scenarios(engine, n, volatility=VOLATILITY, seed=1):
+    """
+    (names, multipliers): a shared FX-like move (log-normal, σ = volatility / 2)
+    times an independent move per item (uniform, standard deviation = volatility).
+    """
+    rnd = random.Random(seed)
+    common = [math.exp(rnd.gauss(0, volatility / 2)) for _ in range(n)]
+    low, span = 1 - math.sqrt(3) * volatility, 2 * math.sqrt(3) * volatility
+    draw = rnd.random
+    multipliers = {j: [c * (low + span * draw()) for c in common]
+                   for j, price in enumerate(engine.prices) if price}
+    return [f"R{s + 1:05d}" for s in range(n)], multipliers
+
+
+# ─── CLI ────────────────────────────────────────────────────────────────────
+def option(name, default, parse=str):
+    return parse(sys.argv[sys.argv.index(name) + 1]) if name in sys.argv else default
+
+
+def quantile(values, p):
+    ordered = sorted(values)
+    return ordered[min(int(p * len(ordered)), len(ordered) - 1)]
+
+
+def write_report(path, names, costs, pct):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, delimiter='\t', lineterminator='\n')
+        writer.writerow(["Scenario"] + list(costs) + [f"{code}_Food_Cost_Pct" for code in pct])
+        for s, name in enumerate(names):
+            writer.writerow([name] + [f"{costs[c][s]:.4f}" for c in costs]
+                            + [f"{pct[c][s]:.4f}" for c in pct])
+
+
+def main():
+    engine = load_scenarios_engine()
+    if '--random' in sys.argv:
+        names, multipliers = random_scenarios(engine, option('--random', 1000, int),
+                                              option('--volatility', VOLATILITY, float),
+                                              option('--seed', 1, int))
+    elif len(sys.argv) > 1 and not sys.argv[1].startswith('--'):
+        names, multipliers = read_scenarios(sys.argv[1], engine)
+    else:
+        sys.exit(__doc__.split("Usage:")[1].rstrip())
+    if not names:
+        sys.exit("No scenarios.")
+
+    start = time.perf_counter()
+    costs = engine.run(multipliers)
+    pct = engine.food_cost_pct(costs)
+    seconds = time.perf_counter() - start
+    print(f"{len(names):,} scenarios × {len(multipliers)} moved prices, "
+          f"{len(costs)} PF/SALE items re-costed in {seconds:.3f} s\n")
+
+    print(f"{'Item':<28} {'Now':>9} {'P5':>9} {'Mean':>9} {'P95':>9}")
+    for code, values in costs.items():
+        print(f"{code:<28} {engine.cost(code):>9.2f} {quantile(values, 0.05):>9.2f} "
+              f"{sum(values) / len(values):>9.2f} {quantile(values, 0.95):>9.2f}")
+
+    print(f"\n{'Dish':<28} {'Menu price':>10} {'FC% now':>8} {'P5':>7} {'Mean':>7} {'P95':>7} "
+          f"{'Over ' + format(FOOD_COST_TARGET, '.0%'):>9}")
+    for code, values in pct.items():
+        over = sum(1 for v in values if v > FOOD_COST_TARGET) / len(values)
+        now = engine.cost(code) / engine.menu_price[code]
+        print(f"{code:<28} {engine.menu_price[code]:>10.0f} {now:>8.1%} {quantile(values, 0.05):>7.1%} "
+              f"{sum(values) / len(values):>7.1%} {quantile(values, 0.95):>7.1%} {over:>9.0%}")
+
+    out = option('--out', None)
+    if out:
+        write_report(out, names, costs, pct)
+        print(f"\nPer-scenario costs written to {out}")
+
+
+if __name__ == '__main__':
+    main()
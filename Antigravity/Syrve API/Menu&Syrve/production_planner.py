@@ -0,0 +1,148 @@
+"""
+production_planner.py
+Whole-menu production planner. Takes a sales forecast for any number of
+SALE dishes (Sales_Forecast.tsv) and computes total PF and RAW requirements
+in a single layered topological sweep over the BOM adjacency index: each
+BOM edge is visited once per plan, however many dishes are forecast.
+
+net_requirements() runs the same sweep as MRP netting: stock on hand
+(Stock_On_Hand.tsv) is taken off each code's gross demand before the
+remainder is exploded, so a PF already in the fridge also cuts the RAW
+it would have used. BOM QuantityGross already includes trim loss, so the
+RAW totals are what has to leave the warehouse.
+
+Usage:  python production_planner.py [Sales_Forecast.tsv]
+"""
+
+import math
+import sys
+import time
+
+from bom_engine import load_bom_index
+from dataset import read_tsv
+from model import to_float
+
+FORECAST_FILE    = 'Sales_Forecast.tsv'
+ON_HAND_FILE     = 'Stock_On_Hand.tsv'
+DEFAULT_FORECAST = {'SALE-BORSCH_BIOACTIVE': 100}
+
+
+def load_forecast(path=FORECAST_FILE):
+    """{Product_Code: Forecast_Qty}; falls back to DEFAULT_FORECAST if the file is missing."""
+    try:
+        rows = read_tsv(path)
+    except FileNotFoundError:
+        return dict(DEFAULT_FORECAST)
+
+    forecast = {}
+    for row in rows:
+        code = row['Product_Code'].strip()
+        qty = to_float(row['Forecast_Qty'])
+        if not code or not qty:
+            continue
+        if qty.is_integer():
+            qty = int(qty)
+        forecast[code] = forecast.get(code, 0) + qty
+    return forecast
+
+
+def load_on_hand(path=ON_HAND_FILE):
+    """{Product_Code: On_Hand_Qty} in base units; empty if the file is missing."""
+    try:
+        rows = read_tsv(path)
+    except FileNotFoundError:
+        return {}
+
+    on_hand = {}
+    for row in rows:
+        code = row['Product_Code'].strip()
+        qty = to_float(row['On_Hand_Qty'])
+        if code and qty:
+            on_hand[code] = on_hand.get(code, 0) + qty
+    return on_hand
+
+
+def plan_totals(index, forecast, produce=None):
+    """
+    Gross quantity to produce/issue per code = forecast + dependent demand.
+    The index order lists parents before children, so by the time a code is
+    reached its demand is final and can be pushed down to its children.
+    `produce(code, qty)` may return the quantity actually made (e.g. rounded
+    up to whole batches); children are then exploded from that amount.
+    """
+    totals = dict(forecast)
+    for code in index.order:
+        qty = totals.get(code)
+        if not qty:
+            continue
+        if produce is not None:
+            qty = produce(code, qty)
+        for child, ratio in index.children.get(code, ()):
+            totals[child] = totals.get(child, 0) + ratio * qty
+    return totals
+
+
+def plan_requirements(index, forecast):
+    """(pf_totals, raw_totals) for the forecast, both in topological order."""
+    totals = plan_totals(index, forecast)
+    pf  = {c: totals[c] for c in index.order if c.startswith('PF-') and totals.get(c)}
+    raw = {c: totals[c] for c in index.order if c.startswith('RAW-') and totals.get(c)}
+    return pf, raw
+
+
+def net_requirements(index, forecast, on_hand):
+    """
+    (gross, net) per code, in topological order. net = gross − on hand
+    (never below 0) and only the net quantity is exploded to the children.
+    """
+    net = {}
+
+    def shortfall(code, qty):
+        net[code] = max(qty - on_hand.get(code, 0), 0)
+        return net[code]
+
+    totals = plan_totals(index, forecast, shortfall)
+    gross = {c: totals[c] for c in index.order if totals.get(c)}
+    return gross, net
+
+
+def issue_packs(qty, pack):
+    """Whole storage packs to issue for `qty` base units (0 when nothing is short)."""
+    if qty <= 0:
+        return 0
+    return math.ceil(round(qty / (pack or 1), 9))
+
+
+def batch_counts(index, quantities, sale_ratios):
+    """
+    Calculated_Batches of the daily plan for each code:
+    CEILING(qty / Sale_Ratio / Standard_Output_Amount), both defaulting to 1.
+    """
+    batches = {}
+    for code, qty in quantities.items():
+        ratio = sale_ratios.get(code) or 1
+        batches[code] = math.ceil(round(qty / ratio / index.std_output(code), 9))
+    return batches
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else FORECAST_FILE
+    index = load_bom_index()
+    forecast = load_forecast(path)
+
+    start = time.perf_counter()
+    pf, raw = plan_requirements(index, forecast)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"Forecast: {len(forecast)} dishes, {sum(forecast.values())} portions")
+    print("\nPF to produce:")
+    for code, qty in pf.items():
+        print(f"  {code:<28} {qty:>10.3f}")
+    print("\nRAW to issue:")
+    for code, qty in raw.items():
+        print(f"  {code:<28} {qty:>10.3f}")
+    print(f"\nPlanned in {elapsed:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
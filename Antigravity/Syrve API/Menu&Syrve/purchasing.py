@@ -0,0 +1,32 @@
+"""
+purchasing.py
+Purchase prices for every bought (or zero-cost by-product) item, shared by
+generate_costing.py and cost_rollup.py.
+"""
+
+purchasing_data = [
+    # Item_Name, Purchase_Unit, Purchase_Price, Base_Unit_Ratio
+    # ── Purchased Raw Ingredients ────────────────────────────────────────────
+    ("Fresh Carrot",           "kg",          "50",  "1"),
+    ("Onion",                  "kg",          "40",  "1"),
+    ("Olive Oil EV",           "Bottle 1L",   "800", "1"),
+    ("Raw Beetroot",           "kg",          "35",  "1"),
+    ("Fresh Potato",           "kg",          "45",  "1"),
+    ("Lemon Juice",            "Bottle 1L",   "300", "1"),
+    ("Garlic",                 "kg",          "250", "1"),
+    ("Shishka Mix Spices",     "Pack 500g",   "600", "0.5"),
+    # ── Zero-Waste Broth Inputs (cost=0; these are internal trimming by-products) ──
+    ("RO Water",               "Liter",       "2",   "1"),   # nominal water cost
+    ("Root Trimmings",         "kg",          "0",   "1"),   # carrot/celery offcuts
+    ("Onion Trimmings",        "kg",          "0",   "1"),   # outer layers
+    ("Herb Stems",             "kg",          "0",   "1"),   # cilantro/parsley/dill
+    ("Mushroom Stems",         "kg",          "0",   "1"),   # champignon / lion's mane
+    ("Cabbage Cores",          "kg",          "0",   "1"),   # cauliflower/broccoli cores
+    # ── Modifiers (purchased) ────────────────────────────────────────────────
+    ("Sous-vide Chicken",      "kg",          "450", "1"),
+    ("Red Beans",              "Can 400g",    "120", "0.4"),
+    ("Sour Cream",             "Bucket 1kg",  "350", "1"),
+    ("Coconut Yogurt",         "Bucket 1kg",  "550", "1"),
+    ("Ancient Crunch",         "kg",          "800", "1"),
+    ("Greens",                 "kg",          "600", "1"),
+]
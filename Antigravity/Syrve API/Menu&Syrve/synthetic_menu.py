@@ -0,0 +1,228 @@
+"""
+synthetic_menu.py
+Synthetic catalog of any size, for benchmarking the pipeline (see
+benchmark.py) on menus far larger than the real one.
+
+make_menu() writes a complete working directory: catalog/*.yaml in the
+same schema as the real catalog (catalog_store.SCHEMA), plus the inputs
+that do not come from the catalog — Sales_Forecast.tsv, Stock_On_Hand.tsv,
+drive_links.json and Purchasing.tsv (a price per bought item, installed
+into purchasing.purchasing_data by the benchmark, since the real price list
+lives in code). The shape of the menu is set by MenuSpec:
+
+    items       total SKUs (RAW + PF + SALE + modifiers)
+    depth       PF levels; level 0 is made from RAW only, level k also
+                from level k-1 PFs
+    fanout      ingredients per BOM
+    mod_groups  modifier groups per SALE dish (items per group: mod_items)
+    steps       production operations per PF item
+
+The output is deterministic for a given spec and seed, and passes
+validate_catalog cleanly. RAW items keep the default yield of 1.
+
+Usage:  python synthetic_menu.py OUT_DIR [--items N] [--depth D] [--fanout F]
+                                 [--mod-groups G] [--mod-items I] [--steps S] [--seed N]
+"""
+
+import csv
+import json
+import os
+import random
+import sys
+from collections import namedtuple
+
+import yaml
+
+from catalog_store import LOSS_ITEM
+from kitchen import OPERATION_STEPS, RESOURCE_CAPACITY
+
+MenuSpec = namedtuple('MenuSpec', 'items depth fanout mod_groups mod_items steps seed')
+DEFAULT_SPEC = MenuSpec(items=300, depth=3, fanout=6, mod_groups=2, mod_items=4, steps=3, seed=1)
+
+# Share of the SKUs per kind; the rest are RAW ingredients
+PF_SHARE, SALE_SHARE, MOD_SHARE = 0.25, 0.15, 0.10
+
+Dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+GROUPS = {
+    'groups': [
+        {'code': 'GRP-INGREDIENTS', 'name': 'Raw Ingredients'},
+        {'code': 'GRP-SF', 'name': 'Semi-Finished'},
+        {'code': 'GRP-MODIFIERS', 'name': 'Modifiers & Add-ons'},
+        {'code': 'GRP-SALE', 'name': 'Sale Menu'},
+    ],
+    'categories': [
+        {'code': 'CAT-VEGETABLES', 'name': 'Vegetables & Roots', 'group': 'GRP-INGREDIENTS'},
+        {'code': 'CAT-SF', 'name': 'Semi-Finished', 'group': 'GRP-SF'},
+        {'code': 'CAT-TOPPINGS', 'name': 'Toppings', 'group': 'GRP-MODIFIERS'},
+        {'code': 'CAT-DISHES', 'name': 'Dishes', 'group': 'GRP-SALE'},
+    ],
+}
+STORAGE = [('Bag 25kg', 25), ('Box 5kg', 5), ('GN 1/1', 3), ('Pack 500g', 0.5)]
+EQUIPMENT = [e_id for e_id, _, _, _ in RESOURCE_CAPACITY] + ['MANUAL']
+
+
+def counts(spec):
+    """(raw, pf, sale, mod) SKU counts; every kind gets at least a few."""
+    pf = max(spec.depth, int(spec.items * PF_SHARE))
+    sale = max(1, int(spec.items * SALE_SHARE))
+    mod = max(spec.mod_groups + spec.mod_items, int(spec.items * MOD_SHARE))
+    raw = max(spec.fanout, spec.items - pf - sale - mod - 1)     # 1 = Processing Loss
+    return raw, pf, sale, mod
+
+
+def build_catalog(spec):
+    """{filename: document} of the catalog YAML files, plus the forecast, stock and prices."""
+    rnd = random.Random(spec.seed)
+    n_raw, n_pf, n_sale, n_mod = counts(spec)
+
+    raw = [f"Ingredient {i}" for i in range(n_raw)]
+    pf_levels = [[] for _ in range(spec.depth)]
+    for i in range(n_pf):
+        pf_levels[i * spec.depth // n_pf].append(f"SF Base {i}")
+    n_groups = max(spec.mod_groups, n_mod // (spec.mod_items + 1))
+    mod_groups = [f"Options {i}" for i in range(n_groups)]
+    mods = [f"Topping {i}" for i in range(max(spec.mod_items, n_mod - n_groups))]
+    dishes = [f"Dish {i}" for i in range(n_sale)]
+
+    items = []
+    for name in raw:
+        storage, ratio = rnd.choice(STORAGE)
+        items.append({'name': name, 'prefix': 'RAW', 'type': 'good', 'order_item_type': 'Product',
+                      'measure_unit': 'kg', 'group': 'GRP-INGREDIENTS', 'category': 'CAT-VEGETABLES',
+                      'nutrition': {'kcal': rnd.randint(0, 400), 'protein': rnd.randint(0, 20),
+                                    'fat': rnd.randint(0, 30), 'carbs': rnd.randint(0, 60)},
+                      'uom': {'base': 'kg', 'storage': storage, 'storage_ratio': ratio,
+                              'sale': 'kg', 'sale_ratio': 1}})
+    for level in pf_levels:
+        for name in level:
+            items.append({'name': name, 'prefix': 'PF', 'type': 'dish', 'group': 'GRP-SF',
+                          'category': 'CAT-SF', 'output': {'amount': 10, 'uom': 'kg'},
+                          'uom': {'base': 'kg', 'storage': 'GN 1/1', 'storage_ratio': 3,
+                                  'sale': 'kg', 'sale_ratio': 1}})
+    for name in mods:
+        portion = rnd.choice([0.005, 0.02, 0.03, 0.05, 0.08])
+        items.append({'name': name, 'prefix': 'MOD', 'type': 'modifier', 'group': 'GRP-MODIFIERS',
+                      'category': 'CAT-TOPPINGS',
+                      'nutrition': {'kcal': rnd.randint(20, 500), 'protein': rnd.randint(0, 25),
+                                    'fat': rnd.randint(0, 20), 'carbs': rnd.randint(0, 50)},
+                      'uom': {'base': 'kg', 'storage': 'Bucket 1kg', 'storage_ratio': 1,
+                              'sale': 'portion', 'sale_ratio': portion},
+                      'portion_kg': portion})
+    for name in mod_groups:
+        items.append({'name': name, 'prefix': 'MOD', 'type': 'modifier_group'})
+    for name in dishes:
+        items.append({'name': name, 'prefix': 'SALE', 'type': 'dish', 'group': 'GRP-SALE',
+                      'category': 'CAT-DISHES', 'output': {'amount': 1, 'uom': 'portion'},
+                      'uom': {'base': 'portion', 'storage': 'Bowl', 'storage_ratio': 1,
+                              'sale': 'portion', 'sale_ratio': 1}})
+    items.append({'name': LOSS_ITEM, 'prefix': 'LOSS', 'type': 'service', 'sys_id': 'LOSS-001',
+                  'syrve_sync': False})
+
+    def ingredients(names, qty):
+        return [[n, round(rnd.uniform(0.1, 1.0) * qty, 3), 'kg']
+                for n in rnd.sample(names, min(spec.fanout, len(names)))]
+
+    boms = []
+    for depth, level in enumerate(pf_levels):
+        for name in level:
+            lower = pf_levels[depth - 1] if depth else []
+            lines = [[n, round(rnd.uniform(0.5, 2.0), 3), 'kg']
+                     for n in rnd.sample(lower, min(spec.fanout // 2, len(lower)))]
+            lines += [[n, round(rnd.uniform(0.2, 2.0), 3), 'kg']
+                      for n in rnd.sample(raw, min(spec.fanout - len(lines), len(raw)))]
+            boms.append({'parent': name, 'ingredients': lines})
+    pfs = [name for level in pf_levels for name in level]
+    for name in dishes:
+        boms.append({'parent': name, 'ingredients': ingredients(pfs, 0.3)})
+    boms.reverse()                                  # parents before the items they use
+
+    schemas, schemes = [], []
+    for i, name in enumerate(dishes):
+        code = f"SCH-DISH_{i}"
+        schemas.append({'code': code, 'name': f"{name} Add-ons", 'dish': f"SALE-DISH_{i}"})
+        groups = rnd.sample(mod_groups, min(spec.mod_groups, len(mod_groups)))
+        scheme_items = []
+        for g, group in enumerate(groups):
+            for j, mod in enumerate(rnd.sample(mods, spec.mod_items)):
+                scheme_items.append({'group': group, 'item': mod,
+                                     'default': 1 if g == 0 and j == 0 else 0})
+        schemes.append({'schema': code, 'dish': name,
+                        'groups': [{'group': g, 'min': 1 if k == 0 else 0, 'max': spec.mod_items}
+                                   for k, g in enumerate(groups)],
+                        'items': scheme_items})
+
+    operations = list(OPERATION_STEPS)
+    flow = []
+    for name in pfs:
+        steps = []
+        for _ in range(spec.steps):
+            steps.append([rnd.choice(operations), rnd.choice(EQUIPMENT), rnd.choice([None, 3, 100, 180]),
+                          rnd.choice([5, 10, 15, 30, 45, 60]), rnd.random() < 0.2, ""])
+        flow.append({'product': name, 'steps': steps})
+
+    catalog = {
+        'groups.yaml':          dict(GROUPS, schemas=schemas),
+        'items.yaml':           {'items': items},
+        'bom.yaml':             {'boms': boms},
+        'modifiers.yaml':       {'modifier_schemes': schemes},
+        'production_flow.yaml': {'production_flow': flow},
+    }
+    forecast = [(f"SALE-DISH_{i}", name, rnd.randint(5, 120)) for i, name in enumerate(dishes)]
+    on_hand = [(f"RAW-INGREDIENT_{i}", name, rnd.randint(0, 20)) for i, name in enumerate(raw)
+               if rnd.random() < 0.3]
+    prices = [(name, 'kg', str(rnd.randint(0, 900)), '1') for name in raw + mods]
+    return catalog, forecast, on_hand, prices
+
+
+def write_tsv(path, header, rows):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        w = csv.writer(f, delimiter='\t', lineterminator='\n')
+        w.writerow(header)
+        w.writerows(rows)
+
+
+def make_menu(out_dir, spec=DEFAULT_SPEC):
+    """Write the synthetic working directory; returns {kind: count} of what it holds."""
+    catalog, forecast, on_hand, prices = build_catalog(spec)
+    os.makedirs(os.path.join(out_dir, 'catalog'), exist_ok=True)
+    for filename, doc in catalog.items():
+        with open(os.path.join(out_dir, 'catalog', filename), 'w', encoding='utf-8') as f:
+            yaml.dump(doc, f, Dumper=Dumper, allow_unicode=True, sort_keys=False, width=120)
+    write_tsv(os.path.join(out_dir, 'Sales_Forecast.tsv'),
+              ["Product_Code", "Product_Name", "Forecast_Qty"], forecast)
+    write_tsv(os.path.join(out_dir, 'Stock_On_Hand.tsv'),
+              ["Product_Code", "Product_Name", "On_Hand_Qty"], on_hand)
+    write_tsv(os.path.join(out_dir, 'Purchasing.tsv'),
+              ["Item_Name", "Purchase_Unit", "Purchase_Price", "Base_Unit_Ratio"], prices)
+    with open(os.path.join(out_dir, 'drive_links.json'), 'w', encoding='utf-8') as f:
+        json.dump({}, f)
+
+    return {
+        'items':        len(catalog['items.yaml']['items']),
+        'bom_lines':    sum(len(b['ingredients']) for b in catalog['bom.yaml']['boms']),
+        'modifier_rows': sum(len(s['items']) for s in catalog['modifiers.yaml']['modifier_schemes']),
+        'flow_steps':   sum(len(p['steps']) for p in catalog['production_flow.yaml']['production_flow']),
+    }
+
+
+def parse_spec(argv, spec=DEFAULT_SPEC):
+    """MenuSpec from --items/--depth/--fanout/--mod-groups/--mod-items/--steps/--seed options."""
+    values = spec._asdict()
+    for field in MenuSpec._fields:
+        flag = '--' + field.replace('_', '-')
+        if flag in argv:
+            values[field] = int(argv[argv.index(flag) + 1])
+    return MenuSpec(**values)
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1].startswith('--'):
+        sys.exit(__doc__.split('Usage:')[1].strip())
+    spec = parse_spec(sys.argv)
+    stats = make_menu(sys.argv[1], spec)
+    print(f"Synthetic menu in {sys.argv[1]}: " + ", ".join(f"{v} {k}" for k, v in stats.items()))
+
+
+if __name__ == '__main__':
+    main()
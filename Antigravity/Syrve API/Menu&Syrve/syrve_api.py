@@ -0,0 +1,237 @@
+"""
+syrve_api.py
+asyncio runtime for the Syrve Cloud API client (syrve_client.py is generated
+from docs.json on top of it by syrve_codegen.py).
+
+  • ConnectionPool keeps up to POOL_SIZE HTTP/1.1 keep-alive connections to
+    the API host open and reuses them, so a run pays the TLS handshake once
+    per connection instead of once per call. Plain asyncio streams — no
+    third-party HTTP library needed.
+  • SyrveSession caches the /api/1/access_token session key, renews it
+    shortly before its 1-hour lifetime ends and once more on a 401.
+  • Every call holds a semaphore for its "Restriction group" from the spec,
+    so one busy group (e.g. Orders: receiving) cannot exhaust the
+    per-group limits Syrve enforces.
+  • by_id lookups whose id list is longer than BATCH_SIZE are split into
+    chunks that run concurrently (within the group limit); their result
+    lists are concatenated.
+
+The API login is read from $SYRVE_API_LOGIN or syrve_cred.json
+({"apiLogin": "..."}, git-ignored).
+"""
+
+import asyncio
+import json
+import os
+import ssl
+import time
+import urllib.parse
+
+BASE_URL    = 'https://api-eu.syrve.live'
+CRED_FILE   = 'syrve_cred.json'
+TOKEN_PATH  = '/api/1/access_token'
+
+POOL_SIZE         = 8      # keep-alive connections per host
+REQUEST_TIMEOUT   = 30     # seconds, per request
+TOKEN_TTL         = 3600   # Syrve: "The standard token lifetime is 1 hour"
+TOKEN_MARGIN      = 300    # renew this many seconds before expiry
+GROUP_LIMIT       = 4      # concurrent calls per restriction group
+GROUP_LIMITS      = {}     # per-group overrides, e.g. {"Orders: creating": 2}
+BATCH_SIZE        = 100    # ids per request for batched by_id lookups
+
+
+class SyrveError(Exception):
+    """Non-2xx answer from Syrve; carries the ErrorResponse fields."""
+
+    def __init__(self, status, path, body):
+        self.status = status
+        self.path = path
+        self.body = body if isinstance(body, dict) else {}
+        text = self.body.get('errorDescription') or (body if isinstance(body, str) else '')
+        super().__init__(f"{path}: HTTP {status} {text}".rstrip())
+
+
+def load_api_login(path=CRED_FILE):
+    login = os.environ.get('SYRVE_API_LOGIN')
+    if login:
+        return login
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)['apiLogin']
+
+
+def compact(body):
+    """Drop None values, so optional parameters that were not given are not sent."""
+    return {k: v for k, v in body.items() if v is not None}
+
+
+# ─── HTTP/1.1 connection pool ───────────────────────────────────────────────
+class ConnectionPool:
+    def __init__(self, base_url, size=POOL_SIZE, timeout=REQUEST_TIMEOUT):
+        url = urllib.parse.urlsplit(base_url)
+        self.host = url.hostname
+        self.port = url.port or (443 if url.scheme == 'https' else 80)
+        self.ssl = ssl.create_default_context() if url.scheme == 'https' else None
+        self.timeout = timeout
+        self.opened = 0                       # connections opened so far (for stats)
+        self._idle = []
+        self._slots = asyncio.Semaphore(size)
+
+    async def request(self, method, path, body=None, headers=None):
+        """(status, response bytes). A stale idle connection is retried once on a fresh one."""
+        async with self._slots:
+            for attempt in range(2):
+                reused = bool(self._idle)
+                conn = self._idle.pop() if reused else await self._open()
+                try:
+                    status, keep_alive, data = await asyncio.wait_for(
+                        self._exchange(conn, method, path, body, headers or {}), self.timeout)
+                except (ConnectionError, asyncio.IncompleteReadError) as e:
+                    conn[1].close()
+                    if reused and attempt == 0:
+                        continue
+                    raise ConnectionError(f"{method} {path}: {e}") from e
+                except BaseException:
+                    conn[1].close()
+                    raise
+                if keep_alive:
+                    self._idle.append(conn)
+                else:
+                    conn[1].close()
+                return status, data
+
+    async def _open(self):
+        self.opened += 1
+        return await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+    async def _exchange(self, conn, method, path, body, headers):
+        reader, writer = conn
+        head = [f"{method} {path} HTTP/1.1", f"Host: {self.host}", "Connection: keep-alive",
+                "Accept: application/json", f"Content-Length: {len(body or b'')}"]
+        if body is not None:
+            head.append("Content-Type: application/json")
+        head += [f"{k}: {v}" for k, v in headers.items()]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode('latin-1') + (body or b''))
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed by server")
+        status = int(status_line.split()[1])
+        fields = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            fields[name.strip().lower()] = value.strip()
+
+        keep_alive = fields.get('connection', '').lower() != 'close'
+        if fields.get('transfer-encoding', '').lower() == 'chunked':
+            data = await self._read_chunked(reader)
+        elif 'content-length' in fields:
+            data = await reader.readexactly(int(fields['content-length']))
+        else:
+            data, keep_alive = await reader.read(), False
+        return status, keep_alive, data
+
+    @staticmethod
+    async def _read_chunked(reader):
+        parts = []
+        while True:
+            size = int((await reader.readline()).split(b';')[0], 16)
+            if size == 0:
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass                      # trailers
+                return b''.join(parts)
+            parts.append(await reader.readexactly(size))
+            await reader.readexactly(2)       # CRLF after each chunk
+
+    async def close(self):
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+
+# ─── Session: token, restriction groups, batching ───────────────────────────
+class SyrveSession:
+    def __init__(self, api_login=None, base_url=BASE_URL, pool_size=POOL_SIZE,
+                 group_limits=None, batch_size=BATCH_SIZE):
+        self.api_login = api_login if api_login is not None else load_api_login()
+        self.pool = ConnectionPool(base_url, pool_size)
+        self.batch_size = batch_size
+        self.group_limits = {**GROUP_LIMITS, **(group_limits or {})}
+        self.calls = 0                        # HTTP requests sent, token requests included
+        self._groups = {}
+        self._token = None
+        self._token_expires = 0.0
+        self._token_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def close(self):
+        await self.pool.close()
+
+    def _group(self, name):
+        if name not in self._groups:
+            self._groups[name] = asyncio.Semaphore(self.group_limits.get(name, GROUP_LIMIT))
+        return self._groups[name]
+
+    async def token(self):
+        """Cached session key; one caller renews it while the others wait."""
+        async with self._token_lock:
+            if self._token is None or time.monotonic() >= self._token_expires:
+                status, data = await self._send('POST', TOKEN_PATH, {'apiLogin': self.api_login})
+                if status != 200:
+                    raise SyrveError(status, TOKEN_PATH, data)
+                self._token = data['token']
+                self._token_expires = time.monotonic() + TOKEN_TTL - TOKEN_MARGIN
+            return self._token
+
+    def _expire(self, token):
+        if self._token == token:
+            self._token = None
+
+    async def _send(self, method, path, body, headers=None):
+        payload = None if body is None else json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.calls += 1
+        status, raw = await self.pool.request(method, path, payload, headers)
+        try:
+            data = json.loads(raw) if raw else {}
+        except ValueError:
+            data = raw.decode('utf-8', 'replace')
+        return status, data
+
+    async def call(self, path, body=None, group=None, method='POST', batch=None):
+        """
+        Authorized request → parsed JSON. `batch` = ((id_field, …), result_field)
+        marks a by_id lookup: the id list that is set (the spec allows only one)
+        is split into BATCH_SIZE chunks.
+        """
+        if batch and body:
+            id_fields, result_field = batch
+            ids_field = next((f for f in id_fields if body.get(f)), None)
+            ids = body.get(ids_field) or []
+            if len(ids) > self.batch_size:
+                chunks = [ids[i:i + self.batch_size] for i in range(0, len(ids), self.batch_size)]
+                parts = await asyncio.gather(*(
+                    self.call(path, {**body, ids_field: chunk}, group, method) for chunk in chunks))
+                merged = dict(parts[0])
+                merged[result_field] = [item for part in parts for item in part.get(result_field) or []]
+                return merged
+
+        async with self._group(group):
+            for attempt in range(2):
+                token = await self.token()
+                status, data = await self._send(method, path, body,
+                                                {'Authorization': f'Bearer {token}'})
+                if status == 401 and attempt == 0:
+                    self._expire(token)       # revoked or expired early: renew and retry once
+                    continue
+                break
+        if not 200 <= status < 300:
+            raise SyrveError(status, path, data)
+        return data
@@ -0,0 +1,917 @@
+"""
+syrve_client.py
+Typed asyncio client for the Syrve Cloud API.
+
+GENERATED by syrve_codegen.py from docs.json (127 operations) — do not edit;
+change the spec or the generator and re-run it. Transport, token caching,
+restriction-group limits and by_id batching live in syrve_api.py.
+
+Usage:
+    async with SyrveClient() as api:
+        orgs = await api.organizations(return_additional_info=False)
+"""
+
+from syrve_api import SyrveSession, compact
+
+
+# path → (method, restriction group)
+ENDPOINTS = {
+    '/api/1/regions': ('POST', 'Data: geo'),
+    '/api/1/cities': ('POST', 'Data: geo'),
+    '/api/1/streets/by_city': ('POST', 'Data: geo'),
+    '/api/1/streets/by_id': ('POST', 'Data: geo'),
+    '/api/1/reserve/available_organizations': ('POST', 'Orders: preparing'),
+    '/api/1/reserve/available_terminal_groups': ('POST', 'Orders: preparing'),
+    '/api/1/reserve/available_restaurant_sections': ('POST', 'Orders: preparing'),
+    '/api/1/reserve/restaurant_sections_workload': ('POST', 'Data: dictionaries'),
+    '/api/1/reserve/create': ('POST', 'Orders: creating'),
+    '/api/1/reserve/status_by_id': ('POST', 'Orders: receiving'),
+    '/api/1/reserve/add_items': ('POST', 'Orders: changing'),
+    '/api/1/reserve/cancel': ('POST', 'Order status: changing'),
+    '/api/1/reserve/add_payments': ('POST', 'Order payments: changing'),
+    '/api/1/reserve/change_tables': ('POST', None),
+    '/api/1/reserve/change_items': ('POST', None),
+    '/api/1/reserve/change_estimated_start_time': ('POST', None),
+    '/api/1/deliveries/create': ('POST', 'Orders: creating'),
+    '/api/1/deliveries/change_external_data': ('POST', 'Orders: changing'),
+    '/api/1/deliveries/update_order_problem': ('POST', 'Order status: changing'),
+    '/api/1/deliveries/update_order_delivery_status': ('POST', 'Order status: changing'),
+    '/api/1/deliveries/add_items': ('POST', 'Orders: changing'),
+    '/api/1/deliveries/close': ('POST', 'Order status: changing'),
+    '/api/1/deliveries/cancel': ('POST', 'Order status: changing'),
+    '/api/1/deliveries/change_complete_before': ('POST', 'Orders: changing'),
+    '/api/1/deliveries/change_delivery_point': ('POST', 'Orders: changing'),
+    '/api/1/deliveries/change_service_type': ('POST', 'Orders: changing'),
+    '/api/1/deliveries/change_payments': ('POST', 'Order payments: changing'),
+    '/api/1/deliveries/change_comment': ('POST', 'Orders: changing'),
+    '/api/1/deliveries/print_delivery_bill': ('POST', 'Orders: changing'),
+    '/api/1/deliveries/confirm': ('POST', 'Order status: changing'),
+    '/api/1/deliveries/cancel_confirmation': ('POST', 'Order status: changing'),
+    '/api/1/deliveries/change_operator': ('POST', 'Orders: changing'),
+    '/api/1/deliveries/add_payments': ('POST', 'Order payments: changing'),
+    '/api/1/deliveries/change_driver_info': ('POST', 'Order driver: changing'),
+    '/api/1/deliveries/update_tracking_link': ('POST', None),
+    '/api/1/order/print_bill': ('POST', None),
+    '/api/1/deliveries/by_id': ('POST', 'Orders: receiving'),
+    '/api/1/deliveries/by_delivery_date_and_status': ('POST', 'Orders: receiving'),
+    '/api/1/deliveries/by_revision': ('POST', 'Orders: receiving'),
+    '/api/1/deliveries/by_delivery_date_and_phone': ('POST', 'Orders: receiving'),
+    '/api/1/deliveries/by_delivery_date_and_source_key_and_filter': ('POST', 'Orders: receiving'),
+    '/api/1/deliveries/history/by_delivery_date_and_phone': ('POST', 'Orders: receiving'),
+    '/api/1/delivery_restrictions': ('POST', 'Data: dictionaries'),
+    '/api/1/delivery_restrictions/allowed': ('POST', 'Orders: preparing'),
+    '/api/1/organizations': ('POST', 'Data: dictionaries'),
+    '/api/1/cancel_causes': ('POST', 'Data: dictionaries'),
+    '/api/1/deliveries/order_types': ('POST', 'Data: dictionaries'),
+    '/api/1/discounts': ('POST', 'Data: dictionaries'),
+    '/api/1/payment_types': ('POST', 'Data: dictionaries'),
+    '/api/1/removal_types': ('POST', 'Data: dictionaries'),
+    '/api/1/tips_types': ('POST', 'Data: dictionaries'),
+    '/api/1/deliveries/drafts/by_id': ('POST', 'Drafts: receiving'),
+    '/api/1/deliveries/drafts/by_filter': ('POST', 'Drafts: receiving'),
+    '/api/1/deliveries/drafts/create': ('POST', 'Drafts: creating'),
+    '/api/1/deliveries/drafts/save': ('POST', 'Drafts: creating'),
+    '/api/1/deliveries/drafts/commit': ('POST', 'Drafts: changing'),
+    '/api/1/deliveries/drafts/delete': ('POST', 'Drafts: changing'),
+    '/api/1/deliveries/drafts/lock': ('POST', 'Drafts: changing'),
+    '/api/1/deliveries/drafts/unlock': ('POST', 'Drafts: changing'),
+    '/api/1/employees/couriers/locations/by_time_offset': ('POST', 'Drivers: location'),
+    '/api/1/employees/couriers': ('POST', 'Drivers: dictionaries'),
+    '/api/1/employees/couriers/by_role': ('POST', 'Drivers: dictionaries'),
+    '/api/1/employees/couriers/active_location/by_terminal': ('POST', 'Drivers: location'),
+    '/api/1/employees/couriers/active_location': ('POST', 'Drivers: location'),
+    '/api/1/employees/info': ('POST', 'Employees: dictionaries'),
+    '/api/1/employees/shift/clockin': ('POST', 'Employees: shifts'),
+    '/api/1/employees/shift/clockout': ('POST', 'Employees: shifts'),
+    '/api/1/employees/shift/is_open': ('POST', 'Employees: shifts'),
+    '/api/1/employees/shifts/by_courier': ('POST', 'Employees: shifts'),
+    '/api/1/marketing_sources': ('POST', 'Data: dictionaries'),
+    '/api/1/nomenclature': ('POST', 'Data: menu'),
+    '/api/2/menu': ('POST', 'Data: menu'),
+    '/api/2/menu/by_id': ('POST', 'Data: menu'),
+    '/api/1/stop_lists': ('POST', 'Data: stoplists'),
+    '/api/1/stop_lists/check': ('POST', 'Orders: creating'),
+    '/api/1/stop_lists/add': ('POST', 'Data: changing stoplists'),
+    '/api/1/stop_lists/remove': ('POST', 'Data: changing stoplists'),
+    '/api/1/stop_lists/clear': ('POST', 'Data: changing stoplists'),
+    '/api/1/notifications/send': ('POST', 'Notifications'),
+    '/api/1/commands/status': ('POST', 'Commands'),
+    '/api/1/order/create': ('POST', 'Orders: creating'),
+    '/api/1/order/by_id': ('POST', 'Orders: receiving'),
+    '/api/1/order/by_table': ('POST', 'Orders: receiving'),
+    '/api/1/order/add_items': ('POST', 'Orders: changing'),
+    '/api/1/order/close': ('POST', 'Order status: changing'),
+    '/api/1/order/cancel': ('POST', None),
+    '/api/1/order/change_payments': ('POST', 'Order payments: changing'),
+    '/api/1/order/change_external_data': ('POST', 'Orders: changing'),
+    '/api/1/order/init_by_table': ('POST', 'Orders: loading data'),
+    '/api/1/order/init_by_posOrder': ('POST', 'Orders: loading data'),
+    '/api/1/order/add_customer': ('POST', 'Orders: changing'),
+    '/api/1/order/add_payments': ('POST', 'Order payments: changing'),
+    '/api/1/organizations/settings': ('POST', 'Organizations: settings'),
+    '/api/1/terminal_groups': ('POST', 'Data: dictionaries'),
+    '/api/1/terminal_groups/is_alive': ('POST', 'POS: availability'),
+    '/api/1/terminal_groups/awake': ('POST', 'Organizations: settings'),
+    '/api/1/webhooks/settings': ('POST', 'Organizations: settings'),
+    '/api/1/webhooks/update_settings': ('POST', 'Organizations: settings'),
+    '/api/1/loyalty/syrve/customer/info': ('POST', 'Guests: info'),
+    '/api/1/loyalty/syrve/calculate': ('POST', 'Loyalty: order calculate'),
+    '/api/1/combo': ('POST', 'Data: menu'),
+    '/api/1/combo/calculate': ('POST', 'Loyalty: order calculate'),
+    '/api/1/loyalty/syrve/manual_condition': ('POST', 'Loyalty: dictionaries'),
+    '/api/1/loyalty/syrve/customer_category': ('POST', 'Loyalty: dictionaries'),
+    '/api/1/loyalty/syrve/customer/create_or_update': ('POST', 'Guests: creating'),
+    '/api/1/loyalty/syrve/delete_customers': ('POST', None),
+    '/api/1/loyalty/syrve/restore_customers': ('POST', None),
+    '/api/1/loyalty/syrve/customer_category/add': ('POST', 'Guests: changing'),
+    '/api/1/loyalty/syrve/customer_category/remove': ('POST', 'Guests: changing'),
+    '/api/1/loyalty/syrve/check_sms_sending_possibility': ('POST', None),
+    '/api/1/loyalty/syrve/message/send_sms': ('POST', 'Loyalty: messages'),
+    '/api/1/loyalty/syrve/check_sms_status': ('POST', None),
+    '/api/1/loyalty/syrve/message/send_email': ('POST', 'Loyalty: messages'),
+    '/api/1/loyalty/syrve/program': ('POST', 'Loyalty: dictionaries'),
+    '/api/1/loyalty/syrve/customer/program/add': ('POST', 'Guests: changing'),
+    '/api/1/loyalty/syrve/customer/card/add': ('POST', 'Guests: changing'),
+    '/api/1/loyalty/syrve/customer/card/remove': ('POST', 'Guests: changing'),
+    '/api/1/loyalty/syrve/customer/wallet/hold': ('POST', 'Loyalty: wallets'),
+    '/api/1/loyalty/syrve/customer/wallet/cancel_hold': ('POST', 'Loyalty: wallets'),
+    '/api/1/loyalty/syrve/customer/wallet/topup': ('POST', 'Loyalty: wallets'),
+    '/api/1/loyalty/syrve/customer/wallet/chargeoff': ('POST', 'Loyalty: wallets'),
+    '/api/1/loyalty/syrve/get_counters': ('POST', None),
+    '/api/1/loyalty/syrve/coupons/info': ('POST', 'Loyalty: coupons'),
+    '/api/1/loyalty/syrve/coupons/series': ('POST', 'Loyalty: coupons'),
+    '/api/1/loyalty/syrve/coupons/by_series': ('POST', 'Loyalty: coupons'),
+    '/api/1/loyalty/syrve/customer/transactions/by_revision': ('POST', 'Guests: transactions'),
+    '/api/1/loyalty/syrve/customer/transactions/by_date': ('POST', 'Guests: transactions'),
+}
+
+
+class SyrveClient(SyrveSession):
+
+    async def regions(self, *, organization_ids: list[str]) -> dict:
+        """Regions.
+        POST /api/1/regions · Data: geo → RegionsResponse
+        """
+        return await self.call('/api/1/regions', compact({'organizationIds': organization_ids}), group='Data: geo')
+
+    async def cities(self, *, organization_ids: list[str], include_deleted: bool | None = None) -> dict:
+        """Cities.
+        POST /api/1/cities · Data: geo → CitiesResponse
+        """
+        return await self.call('/api/1/cities', compact({'organizationIds': organization_ids, 'includeDeleted': include_deleted}), group='Data: geo')
+
+    async def streets_by_city(self, *, organization_id: str, city_id: str, include_deleted: bool | None = None) -> dict:
+        """Streets by city.
+        POST /api/1/streets/by_city · Data: geo → StreetsResponse
+        """
+        return await self.call('/api/1/streets/by_city', compact({'organizationId': organization_id, 'cityId': city_id, 'includeDeleted': include_deleted}), group='Data: geo')
+
+    async def streets_by_id(self, *, organization_id: str, ids: list[str] | None = None, classifier_ids: list[str] | None = None) -> dict:
+        """Streets by id or by classifierId.
+        POST /api/1/streets/by_id · Data: geo → StreetsByIdResponse
+        """
+        return await self.call('/api/1/streets/by_id', compact({'organizationId': organization_id, 'ids': ids, 'classifierIds': classifier_ids}), group='Data: geo', batch=(('ids', 'classifierIds'), 'streets'))
+
+    async def reserve_available_organizations(self, *, organization_ids: list[str] | None = None, return_additional_info: bool | None = None, include_disabled: bool | None = None, return_external_data: list[str] | None = None) -> dict:
+        """Returns all organizations of current account (determined by Authorization request header) for which banquet/reserve booking are available.
+        POST /api/1/reserve/available_organizations · Orders: preparing → GetOrganizationsResponse
+        """
+        return await self.call('/api/1/reserve/available_organizations', compact({'organizationIds': organization_ids, 'returnAdditionalInfo': return_additional_info, 'includeDisabled': include_disabled, 'returnExternalData': return_external_data}), group='Orders: preparing')
+
+    async def reserve_available_terminal_groups(self, *, organization_ids: list[str]) -> dict:
+        """Returns all terminal groups of specified organizations, for which banquet/reserve booking are available.
+        POST /api/1/reserve/available_terminal_groups · Orders: preparing → TerminalGroupsResponse
+        """
+        return await self.call('/api/1/reserve/available_terminal_groups', compact({'organizationIds': organization_ids}), group='Orders: preparing')
+
+    async def reserve_available_restaurant_sections(self, *, terminal_group_ids: list[str], return_schema: bool | None = None, revision: int | None = None) -> dict:
+        """Returns all restaurant sections of specified terminal groups, for which banquet/reserve booking are available.
+        POST /api/1/reserve/available_restaurant_sections · Orders: preparing → GetRestaurantSectionsResponse
+        """
+        return await self.call('/api/1/reserve/available_restaurant_sections', compact({'terminalGroupIds': terminal_group_ids, 'returnSchema': return_schema, 'revision': revision}), group='Orders: preparing')
+
+    async def reserve_restaurant_sections_workload(self, *, restaurant_section_ids: list[str], date_from: str, date_to: str | None = None) -> dict:
+        """Returns all banquets/reserves for passed restaurant sections.
+        POST /api/1/reserve/restaurant_sections_workload · Data: dictionaries → GetRestaurantSectionsWorkloadResponse
+        """
+        return await self.call('/api/1/reserve/restaurant_sections_workload', compact({'restaurantSectionIds': restaurant_section_ids, 'dateFrom': date_from, 'dateTo': date_to}), group='Data: dictionaries')
+
+    async def reserve_create(self, *, organization_id: str, customer: dict, phone: str, duration_in_minutes: int, should_remind: bool, table_ids: list[str], estimated_start_time: str, terminal_group_id: str | None = None, id: str | None = None, external_number: str | None = None, order: dict | None = None, guests_count: int | None = None, comment: str | None = None, transport_to_front_timeout: int | None = None, guests: dict | None = None, event_type: str | None = None, create_reserve_settings: dict | None = None) -> dict:
+        """Create banquet/reserve.
+        POST /api/1/reserve/create · Orders: creating → ReserveResponse
+        """
+        return await self.call('/api/1/reserve/create', compact({'organizationId': organization_id, 'customer': customer, 'phone': phone, 'durationInMinutes': duration_in_minutes, 'shouldRemind': should_remind, 'tableIds': table_ids, 'estimatedStartTime': estimated_start_time, 'terminalGroupId': terminal_group_id, 'id': id, 'externalNumber': external_number, 'order': order, 'guestsCount': guests_count, 'comment': comment, 'transportToFrontTimeout': transport_to_front_timeout, 'guests': guests, 'eventType': event_type, 'createReserveSettings': create_reserve_settings}), group='Orders: creating')
+
+    async def reserve_status_by_id(self, *, organization_id: str, reserve_ids: list[str], source_keys: list[str] | None = None) -> dict:
+        """Retrieve banquets/reserves statuses by IDs.
+        POST /api/1/reserve/status_by_id · Orders: receiving → ReservesResponse
+        """
+        return await self.call('/api/1/reserve/status_by_id', compact({'organizationId': organization_id, 'reserveIds': reserve_ids, 'sourceKeys': source_keys}), group='Orders: receiving', batch=(('reserveIds',), 'reserves'))
+
+    async def reserve_add_items(self, *, reserve_id: str, organization_id: str, items: list[dict], combos: list[dict] | None = None) -> dict:
+        """Add order items.
+        POST /api/1/reserve/add_items · Orders: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/reserve/add_items', compact({'reserveId': reserve_id, 'organizationId': organization_id, 'items': items, 'combos': combos}), group='Orders: changing')
+
+    async def reserve_cancel(self, *, organization_id: str, reserve_id: str, cancel_reason: dict) -> dict:
+        """Cancel reservation due to some reason.
+        POST /api/1/reserve/cancel · Order status: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/reserve/cancel', compact({'organizationId': organization_id, 'reserveId': reserve_id, 'cancelReason': cancel_reason}), group='Order status: changing')
+
+    async def reserve_add_payments(self, *, reserve_id: str, organization_id: str, payments: list[dict]) -> dict:
+        """Add order payments.
+        POST /api/1/reserve/add_payments · Order payments: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/reserve/add_payments', compact({'reserveId': reserve_id, 'organizationId': organization_id, 'payments': payments}), group='Order payments: changing')
+
+    async def reserve_change_tables(self, *, organization_id: str, reserve_id: str, table_ids: list[str]) -> dict:
+        """Change reserve/banquet tables.
+        POST /api/1/reserve/change_tables → CorrelationIdResponse
+        """
+        return await self.call('/api/1/reserve/change_tables', compact({'organizationId': organization_id, 'reserveId': reserve_id, 'tableIds': table_ids}), group=None)
+
+    async def reserve_change_items(self, *, organization_id: str, reserve_id: str, items: list[dict] | None = None, combos: list[dict] | None = None) -> dict:
+        """Change order items.
+        POST /api/1/reserve/change_items → CorrelationIdResponse
+        """
+        return await self.call('/api/1/reserve/change_items', compact({'organizationId': organization_id, 'reserveId': reserve_id, 'items': items, 'combos': combos}), group=None)
+
+    async def reserve_change_estimated_start_time(self, *, organization_id: str, reserve_id: str, new_estimated_start_time: str) -> dict:
+        """Change reserve/banquet estimated start time.
+        POST /api/1/reserve/change_estimated_start_time → CorrelationIdResponse
+        """
+        return await self.call('/api/1/reserve/change_estimated_start_time', compact({'organizationId': organization_id, 'reserveId': reserve_id, 'newEstimatedStartTime': new_estimated_start_time}), group=None)
+
+    async def deliveries_create(self, *, organization_id: str, order: dict, terminal_group_id: str | None = None, create_order_settings: dict | None = None) -> dict:
+        """Create delivery.
+        POST /api/1/deliveries/create · Orders: creating → OrderResponse
+        """
+        return await self.call('/api/1/deliveries/create', compact({'organizationId': organization_id, 'order': order, 'terminalGroupId': terminal_group_id, 'createOrderSettings': create_order_settings}), group='Orders: creating')
+
+    async def deliveries_change_external_data(self, *, organization_id: str, order_id: str, external_data: list[dict]) -> dict:
+        """Change delivery external data.
+        POST /api/1/deliveries/change_external_data · Orders: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/change_external_data', compact({'organizationId': organization_id, 'orderId': order_id, 'externalData': external_data}), group='Orders: changing')
+
+    async def deliveries_update_order_problem(self, *, organization_id: str, order_id: str, has_problem: bool, problem: str) -> dict:
+        """Update order problem.
+        POST /api/1/deliveries/update_order_problem · Order status: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/update_order_problem', compact({'organizationId': organization_id, 'orderId': order_id, 'hasProblem': has_problem, 'problem': problem}), group='Order status: changing')
+
+    async def deliveries_update_order_delivery_status(self, *, organization_id: str, order_id: str, delivery_status: dict, delivery_date: str | None = None) -> dict:
+        """Update delivery status.
+        POST /api/1/deliveries/update_order_delivery_status · Order status: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/update_order_delivery_status', compact({'organizationId': organization_id, 'orderId': order_id, 'deliveryStatus': delivery_status, 'deliveryDate': delivery_date}), group='Order status: changing')
+
+    async def deliveries_add_items(self, *, order_id: str, organization_id: str, items: list[dict], combos: list[dict] | None = None) -> dict:
+        """Add order items.
+        POST /api/1/deliveries/add_items · Orders: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/add_items', compact({'orderId': order_id, 'organizationId': organization_id, 'items': items, 'combos': combos}), group='Orders: changing')
+
+    async def deliveries_close(self, *, organization_id: str, order_id: str, delivery_date: str | None = None) -> dict:
+        """Close order.
+        POST /api/1/deliveries/close · Order status: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/close', compact({'organizationId': organization_id, 'orderId': order_id, 'deliveryDate': delivery_date}), group='Order status: changing')
+
+    async def deliveries_cancel(self, *, organization_id: str, order_id: str, moved_order_id: str | None = None, cancel_cause_id: str | None = None, cancel_comment: str | None = None, removal_type_id: str | None = None, removal_comment: str | None = None, user_id_for_writeoff: str | None = None) -> dict:
+        """Cancel delivery order.
+        POST /api/1/deliveries/cancel · Order status: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/cancel', compact({'organizationId': organization_id, 'orderId': order_id, 'movedOrderId': moved_order_id, 'cancelCauseId': cancel_cause_id, 'cancelComment': cancel_comment, 'removalTypeId': removal_type_id, 'removalComment': removal_comment, 'userIdForWriteoff': user_id_for_writeoff}), group='Order status: changing')
+
+    async def deliveries_change_complete_before(self, *, organization_id: str, order_id: str, new_complete_before: str) -> dict:
+        """Change time when client wants the order to be delivered.
+        POST /api/1/deliveries/change_complete_before · Orders: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/change_complete_before', compact({'organizationId': organization_id, 'orderId': order_id, 'newCompleteBefore': new_complete_before}), group='Orders: changing')
+
+    async def deliveries_change_delivery_point(self, *, organization_id: str, order_id: str, new_delivery_point: dict) -> dict:
+        """Change order's delivery point information.
+        POST /api/1/deliveries/change_delivery_point · Orders: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/change_delivery_point', compact({'organizationId': organization_id, 'orderId': order_id, 'newDeliveryPoint': new_delivery_point}), group='Orders: changing')
+
+    async def deliveries_change_service_type(self, *, new_service_type: str, organization_id: str, order_id: str) -> dict:
+        """Change order's delivery type.
+        POST /api/1/deliveries/change_service_type · Orders: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/change_service_type', compact({'newServiceType': new_service_type, 'organizationId': organization_id, 'orderId': order_id}), group='Orders: changing')
+
+    async def deliveries_change_payments(self, *, organization_id: str, order_id: str, payments: list[dict], tips: list[dict] | None = None) -> dict:
+        """Change order's payments.
+        POST /api/1/deliveries/change_payments · Order payments: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/change_payments', compact({'organizationId': organization_id, 'orderId': order_id, 'payments': payments, 'tips': tips}), group='Order payments: changing')
+
+    async def deliveries_change_comment(self, *, organization_id: str, order_id: str, comment: str) -> dict:
+        """Change delivery comment.
+        POST /api/1/deliveries/change_comment · Orders: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/change_comment', compact({'organizationId': organization_id, 'orderId': order_id, 'comment': comment}), group='Orders: changing')
+
+    async def deliveries_print_delivery_bill(self, *, organization_id: str, order_id: str) -> dict:
+        """Print delivery bill.
+        POST /api/1/deliveries/print_delivery_bill · Orders: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/print_delivery_bill', compact({'organizationId': organization_id, 'orderId': order_id}), group='Orders: changing')
+
+    async def deliveries_confirm(self, *, organization_id: str, order_id: str) -> dict:
+        """Confirm delivery.
+        POST /api/1/deliveries/confirm · Order status: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/confirm', compact({'organizationId': organization_id, 'orderId': order_id}), group='Order status: changing')
+
+    async def deliveries_cancel_confirmation(self, *, organization_id: str, order_id: str) -> dict:
+        """Cancel delivery confirmation.
+        POST /api/1/deliveries/cancel_confirmation · Order status: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/cancel_confirmation', compact({'organizationId': organization_id, 'orderId': order_id}), group='Order status: changing')
+
+    async def deliveries_change_operator(self, *, organization_id: str, order_id: str, operator_id: str) -> dict:
+        """Assign/change the order operator.
+        POST /api/1/deliveries/change_operator · Orders: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/change_operator', compact({'organizationId': organization_id, 'orderId': order_id, 'operatorId': operator_id}), group='Orders: changing')
+
+    async def deliveries_add_payments(self, *, order_id: str, organization_id: str, payments: list[dict], tips: list[dict] | None = None) -> dict:
+        """Add order payments.
+        POST /api/1/deliveries/add_payments · Order payments: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/add_payments', compact({'orderId': order_id, 'organizationId': organization_id, 'payments': payments, 'tips': tips}), group='Order payments: changing')
+
+    async def deliveries_change_driver_info(self, *, organization_id: str, order_id: str, driver_id: str | None = None, estimated_time: str | None = None) -> dict:
+        """Change driver info.
+        POST /api/1/deliveries/change_driver_info · Order driver: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/change_driver_info', compact({'organizationId': organization_id, 'orderId': order_id, 'driverId': driver_id, 'estimatedTime': estimated_time}), group='Order driver: changing')
+
+    async def deliveries_update_tracking_link(self, *, organization_id: str, order_id: str, tracking_link: str | None = None) -> dict:
+        """Update tracking link of an order.
+        POST /api/1/deliveries/update_tracking_link
+        """
+        return await self.call('/api/1/deliveries/update_tracking_link', compact({'organizationId': organization_id, 'orderId': order_id, 'trackingLink': tracking_link}), group=None)
+
+    async def order_print_bill(self, *, organization_id: str, order_id: str) -> dict:
+        """Print bill.
+        POST /api/1/order/print_bill → CorrelationIdResponse
+        """
+        return await self.call('/api/1/order/print_bill', compact({'organizationId': organization_id, 'orderId': order_id}), group=None)
+
+    async def deliveries_by_id(self, *, organization_id: str, order_ids: list[str] | None = None, source_keys: list[str] | None = None, pos_order_ids: list[str] | None = None, return_external_data_keys: list[str] | None = None, return_locked_by_user: bool | None = None) -> dict:
+        """Retrieve orders by IDs.
+        POST /api/1/deliveries/by_id · Orders: receiving → OrdersResponse
+        """
+        return await self.call('/api/1/deliveries/by_id', compact({'organizationId': organization_id, 'orderIds': order_ids, 'sourceKeys': source_keys, 'posOrderIds': pos_order_ids, 'returnExternalDataKeys': return_external_data_keys, 'returnLockedByUser': return_locked_by_user}), group='Orders: receiving', batch=(('orderIds', 'posOrderIds'), 'orders'))
+
+    async def deliveries_by_delivery_date_and_status(self, *, organization_ids: list[str], delivery_date_from: str, delivery_date_to: str | None = None, statuses: list[dict] | None = None, source_keys: list[str] | None = None, courier_ids: list[str] | None = None) -> dict:
+        """Retrieve list of orders by statuses and dates.
+        POST /api/1/deliveries/by_delivery_date_and_status · Orders: receiving → OrdersWithRevisionResponse
+        """
+        return await self.call('/api/1/deliveries/by_delivery_date_and_status', compact({'organizationIds': organization_ids, 'deliveryDateFrom': delivery_date_from, 'deliveryDateTo': delivery_date_to, 'statuses': statuses, 'sourceKeys': source_keys, 'courierIds': courier_ids}), group='Orders: receiving')
+
+    async def deliveries_by_revision(self, *, start_revision: int, organization_ids: list[str], source_keys: list[str] | None = None) -> dict:
+        """Retrieve list of orders changed from the time revision was passed.
+        POST /api/1/deliveries/by_revision · Orders: receiving → OrdersWithRevisionResponse
+        """
+        return await self.call('/api/1/deliveries/by_revision', compact({'startRevision': start_revision, 'organizationIds': organization_ids, 'sourceKeys': source_keys}), group='Orders: receiving')
+
+    async def deliveries_by_delivery_date_and_phone(self, *, phone: str, organization_ids: list[str], delivery_date_from: str | None = None, delivery_date_to: str | None = None, start_revision: int | None = None, source_keys: list[str] | None = None, rows_count: int | None = None) -> dict:
+        """Retrieve list of orders by telephone number, dates and revision.
+        POST /api/1/deliveries/by_delivery_date_and_phone · Orders: receiving → OrdersWithRevisionResponse
+        """
+        return await self.call('/api/1/deliveries/by_delivery_date_and_phone', compact({'phone': phone, 'organizationIds': organization_ids, 'deliveryDateFrom': delivery_date_from, 'deliveryDateTo': delivery_date_to, 'startRevision': start_revision, 'sourceKeys': source_keys, 'rowsCount': rows_count}), group='Orders: receiving')
+
+    async def deliveries_by_delivery_date_and_source_key_and_filter(self, *, organization_ids: list[str], terminal_group_ids: list[str] | None = None, delivery_date_from: str | None = None, delivery_date_to: str | None = None, statuses: list[dict] | None = None, has_problem: bool | None = None, order_service_type: dict | None = None, search_text: str | None = None, time_to_cooking_error_timeout: int | None = None, cooking_timeout: int | None = None, sort_property: dict | None = None, sort_direction: dict | None = None, rows_count: int | None = None, source_keys: list[str] | None = None, order_ids: list[str] | None = None, pos_order_ids: list[str] | None = None) -> dict:
+        """Search orders by search text and additional filters (date, problem, statuses and other).
+        POST /api/1/deliveries/by_delivery_date_and_source_key_and_filter · Orders: receiving → OrdersWithRevisionResponse
+        """
+        return await self.call('/api/1/deliveries/by_delivery_date_and_source_key_and_filter', compact({'organizationIds': organization_ids, 'terminalGroupIds': terminal_group_ids, 'deliveryDateFrom': delivery_date_from, 'deliveryDateTo': delivery_date_to, 'statuses': statuses, 'hasProblem': has_problem, 'orderServiceType': order_service_type, 'searchText': search_text, 'timeToCookingErrorTimeout': time_to_cooking_error_timeout, 'cookingTimeout': cooking_timeout, 'sortProperty': sort_property, 'sortDirection': sort_direction, 'rowsCount': rows_count, 'sourceKeys': source_keys, 'orderIds': order_ids, 'posOrderIds': pos_order_ids}), group='Orders: receiving')
+
+    async def deliveries_history_by_delivery_date_and_phone(self, *, phone: str, organization_ids: list[str], rows_count: int, delivery_date_from: str | None = None, delivery_date_to: str | None = None, start_revision: int | None = None, source_keys: list[str] | None = None) -> dict:
+        """Retrieve list of history orders by telephone number, dates and revision.
+        POST /api/1/deliveries/history/by_delivery_date_and_phone · Orders: receiving → OrdersWithRevisionResponse
+        """
+        return await self.call('/api/1/deliveries/history/by_delivery_date_and_phone', compact({'phone': phone, 'organizationIds': organization_ids, 'rowsCount': rows_count, 'deliveryDateFrom': delivery_date_from, 'deliveryDateTo': delivery_date_to, 'startRevision': start_revision, 'sourceKeys': source_keys}), group='Orders: receiving')
+
+    async def delivery_restrictions(self, *, organization_ids: list[str]) -> dict:
+        """Retrieve list of delivery restrictions.
+        POST /api/1/delivery_restrictions · Data: dictionaries → GetDeliveryRestrictionsResponse
+        """
+        return await self.call('/api/1/delivery_restrictions', compact({'organizationIds': organization_ids}), group='Data: dictionaries')
+
+    async def delivery_restrictions_allowed(self, *, is_courier_delivery: bool, organization_id: str | None = None, organization_ids: list[str] | None = None, delivery_address: dict | None = None, order_location: dict | None = None, order_items: list[dict] | None = None, delivery_date: str | None = None, delivery_sum: float | None = None, discount_sum: float | None = None) -> dict:
+        """Get suitable terminal groups for delivery restrictions.
+        POST /api/1/delivery_restrictions/allowed · Orders: preparing → GetAllowedRestrictionsResponse
+        """
+        return await self.call('/api/1/delivery_restrictions/allowed', compact({'isCourierDelivery': is_courier_delivery, 'organizationId': organization_id, 'organizationIds': organization_ids, 'deliveryAddress': delivery_address, 'orderLocation': order_location, 'orderItems': order_items, 'deliveryDate': delivery_date, 'deliverySum': delivery_sum, 'discountSum': discount_sum}), group='Orders: preparing')
+
+    async def organizations(self, *, organization_ids: list[str] | None = None, return_additional_info: bool | None = None, include_disabled: bool | None = None, return_external_data: list[str] | None = None) -> dict:
+        """Returns organizations available to api-login user.
+        POST /api/1/organizations · Data: dictionaries → GetOrganizationsResponse
+        """
+        return await self.call('/api/1/organizations', compact({'organizationIds': organization_ids, 'returnAdditionalInfo': return_additional_info, 'includeDisabled': include_disabled, 'returnExternalData': return_external_data}), group='Data: dictionaries')
+
+    async def cancel_causes(self, *, organization_ids: list[str]) -> dict:
+        """Delivery cancel causes.
+        POST /api/1/cancel_causes · Data: dictionaries → CancelCausesResponse
+        """
+        return await self.call('/api/1/cancel_causes', compact({'organizationIds': organization_ids}), group='Data: dictionaries')
+
+    async def deliveries_order_types(self, *, organization_ids: list[str]) -> dict:
+        """Order types.
+        POST /api/1/deliveries/order_types · Data: dictionaries → OrderTypesResponse
+        """
+        return await self.call('/api/1/deliveries/order_types', compact({'organizationIds': organization_ids}), group='Data: dictionaries')
+
+    async def discounts(self, *, organization_ids: list[str]) -> dict:
+        """Discounts / surcharges.
+        POST /api/1/discounts · Data: dictionaries → DiscountsResponse
+        """
+        return await self.call('/api/1/discounts', compact({'organizationIds': organization_ids}), group='Data: dictionaries')
+
+    async def payment_types(self, *, organization_ids: list[str]) -> dict:
+        """Payment types.
+        POST /api/1/payment_types · Data: dictionaries → PaymentTypesResponse
+        """
+        return await self.call('/api/1/payment_types', compact({'organizationIds': organization_ids}), group='Data: dictionaries')
+
+    async def removal_types(self, *, organization_ids: list[str]) -> dict:
+        """Removal types (reasons for deletion).
+        POST /api/1/removal_types · Data: dictionaries → RemovalTypesResponse
+        """
+        return await self.call('/api/1/removal_types', compact({'organizationIds': organization_ids}), group='Data: dictionaries')
+
+    async def tips_types(self) -> dict:
+        """Get tips types for api-login`s rms group.
+        POST /api/1/tips_types · Data: dictionaries → TipsTypesResponse
+        """
+        return await self.call('/api/1/tips_types', None, group='Data: dictionaries')
+
+    async def deliveries_drafts_by_id(self, *, organization_id: str, order_id: str) -> dict:
+        """Retrieve order draft by ID.
+        POST /api/1/deliveries/drafts/by_id · Drafts: receiving → GetDraftResponse
+        """
+        return await self.call('/api/1/deliveries/drafts/by_id', compact({'organizationId': organization_id, 'orderId': order_id}), group='Drafts: receiving')
+
+    async def deliveries_drafts_by_filter(self, *, organization_ids: list[str], date_from: str | None = None, date_to: str | None = None, phone: str | None = None, limit: int | None = None, offset: int | None = None, source_keys: list[str] | None = None, terminal_group_ids: list[str] | None = None, search_text: str | None = None, sort_property: dict | None = None, sort_direction: dict | None = None, operator_ids: list[str] | None = None, order_type_ids: list[str] | None = None) -> dict:
+        """Retrieve order drafts list by parameters.
+        POST /api/1/deliveries/drafts/by_filter · Drafts: receiving → FilterDraftsResponse
+        """
+        return await self.call('/api/1/deliveries/drafts/by_filter', compact({'organizationIds': organization_ids, 'dateFrom': date_from, 'dateTo': date_to, 'phone': phone, 'limit': limit, 'offset': offset, 'sourceKeys': source_keys, 'terminalGroupIds': terminal_group_ids, 'searchText': search_text, 'sortProperty': sort_property, 'sortDirection': sort_direction, 'operatorIds': operator_ids, 'orderTypeIds': order_type_ids}), group='Drafts: receiving')
+
+    async def deliveries_drafts_create(self, *, organization_id: str, order: dict, terminal_group_id: str | None = None) -> dict:
+        """Create delivery order draft.
+        POST /api/1/deliveries/drafts/create · Drafts: creating → CreateOrSaveDraftResponse
+        """
+        return await self.call('/api/1/deliveries/drafts/create', compact({'organizationId': organization_id, 'order': order, 'terminalGroupId': terminal_group_id}), group='Drafts: creating')
+
+    async def deliveries_drafts_save(self, *, employee_id: str, organization_id: str, order: dict, terminal_group_id: str | None = None) -> dict:
+        """Update existing delivery order draft.
+        POST /api/1/deliveries/drafts/save · Drafts: creating → CreateOrSaveDraftResponse
+        """
+        return await self.call('/api/1/deliveries/drafts/save', compact({'employeeId': employee_id, 'organizationId': organization_id, 'order': order, 'terminalGroupId': terminal_group_id}), group='Drafts: creating')
+
+    async def deliveries_drafts_commit(self, *, organization_id: str, order_id: str, terminal_group_id: str | None = None, create_order_settings: dict | None = None) -> dict:
+        """Admit order draft changes and send them to Front.
+        POST /api/1/deliveries/drafts/commit · Drafts: changing → OrderResponse
+        """
+        return await self.call('/api/1/deliveries/drafts/commit', compact({'organizationId': organization_id, 'orderId': order_id, 'terminalGroupId': terminal_group_id, 'createOrderSettings': create_order_settings}), group='Drafts: changing')
+
+    async def deliveries_drafts_delete(self, *, organization_id: str, order_id: str) -> dict:
+        """Delete order draft.
+        POST /api/1/deliveries/drafts/delete · Drafts: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/drafts/delete', compact({'organizationId': organization_id, 'orderId': order_id}), group='Drafts: changing')
+
+    async def deliveries_drafts_lock(self, *, organization_id: str, order_id: str, employee_id: str) -> dict:
+        """Lock order draft.
+        POST /api/1/deliveries/drafts/lock · Drafts: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/drafts/lock', compact({'organizationId': organization_id, 'orderId': order_id, 'employeeId': employee_id}), group='Drafts: changing')
+
+    async def deliveries_drafts_unlock(self, *, organization_id: str, order_id: str, employee_id: str) -> dict:
+        """Unlock order draft.
+        POST /api/1/deliveries/drafts/unlock · Drafts: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/deliveries/drafts/unlock', compact({'organizationId': organization_id, 'orderId': order_id, 'employeeId': employee_id}), group='Drafts: changing')
+
+    async def employees_couriers_locations_by_time_offset(self, *, organization_ids: list[str], offset_in_seconds: int | None = None) -> dict:
+        """Method of obtaining drivers' coordinates history.
+        POST /api/1/employees/couriers/locations/by_time_offset · Drivers: location → CourierLocationsByTimeOffsetResponse
+        """
+        return await self.call('/api/1/employees/couriers/locations/by_time_offset', compact({'organizationIds': organization_ids, 'offsetInSeconds': offset_in_seconds}), group='Drivers: location')
+
+    async def employees_couriers(self, *, organization_ids: list[str]) -> dict:
+        """Returns list of all employees which are delivery drivers in specified restaurants.
+        POST /api/1/employees/couriers · Drivers: dictionaries → EmployeesResponse
+        """
+        return await self.call('/api/1/employees/couriers', compact({'organizationIds': organization_ids}), group='Drivers: dictionaries')
+
+    async def employees_couriers_by_role(self, *, organization_ids: list[str], roles_to_check: list[str]) -> dict:
+        """Returns list of all employees which are delivery drivers in specified restaurants, 
+and checks whether each employee has passed role.
+        POST /api/1/employees/couriers/by_role · Drivers: dictionaries → EmployeesWithRoleSignResponse
+        """
+        return await self.call('/api/1/employees/couriers/by_role', compact({'organizationIds': organization_ids, 'rolesToCheck': roles_to_check}), group='Drivers: dictionaries')
+
+    async def employees_couriers_active_location_by_terminal(self, *, organization_id: str, terminal_group_id: str) -> dict:
+        """Returns list of all active (courier session is opened) courier's locations which are delivery drivers in specified 
+restaurant and are clocked in on specified delivery terminal.
+        POST /api/1/employees/couriers/active_location/by_terminal · Drivers: location → ActiveCourierLocationsResponse
+        """
+        return await self.call('/api/1/employees/couriers/active_location/by_terminal', compact({'organizationId': organization_id, 'terminalGroupId': terminal_group_id}), group='Drivers: location')
+
+    async def employees_couriers_active_location(self, *, organization_ids: list[str]) -> dict:
+        """Returns list of all active (courier session is opened) courier's locations which are delivery drivers 
+in specified restaurants.
+        POST /api/1/employees/couriers/active_location · Drivers: location → ActiveCourierLocationsResponse
+        """
+        return await self.call('/api/1/employees/couriers/active_location', compact({'organizationIds': organization_ids}), group='Drivers: location')
+
+    async def employees_info(self, *, organization_id: str, id: str) -> dict:
+        """Returns employee info.
+        POST /api/1/employees/info · Employees: dictionaries → EmployeeInfoResponse
+        """
+        return await self.call('/api/1/employees/info', compact({'organizationId': organization_id, 'id': id}), group='Employees: dictionaries')
+
+    async def employees_shift_clockin(self, *, organization_id: str, terminal_group_id: str, employee_id: str, role_id: str | None = None) -> dict:
+        """Open personal session.
+        POST /api/1/employees/shift/clockin · Employees: shifts → ChangePersonalSessionResponse
+        """
+        return await self.call('/api/1/employees/shift/clockin', compact({'organizationId': organization_id, 'terminalGroupId': terminal_group_id, 'employeeId': employee_id, 'roleId': role_id}), group='Employees: shifts')
+
+    async def employees_shift_clockout(self, *, organization_id: str, terminal_group_id: str, employee_id: str) -> dict:
+        """Close personal session.
+        POST /api/1/employees/shift/clockout · Employees: shifts → ChangePersonalSessionResponse
+        """
+        return await self.call('/api/1/employees/shift/clockout', compact({'organizationId': organization_id, 'terminalGroupId': terminal_group_id, 'employeeId': employee_id}), group='Employees: shifts')
+
+    async def employees_shift_is_open(self, *, organization_id: str, terminal_group_id: str, employee_id: str) -> dict:
+        """Check if personal session is open.
+        POST /api/1/employees/shift/is_open · Employees: shifts → GetPersonalSessionInfoResponse
+        """
+        return await self.call('/api/1/employees/shift/is_open', compact({'organizationId': organization_id, 'terminalGroupId': terminal_group_id, 'employeeId': employee_id}), group='Employees: shifts')
+
+    async def employees_shifts_by_courier(self, *, employee_id: str) -> dict:
+        """Get terminal groups where employee session is opened.
+        POST /api/1/employees/shifts/by_courier · Employees: shifts → GetTerminalGroupsOfEmployeeResponse
+        """
+        return await self.call('/api/1/employees/shifts/by_courier', compact({'employeeId': employee_id}), group='Employees: shifts')
+
+    async def marketing_sources(self, *, organization_ids: list[str]) -> dict:
+        """Marketing sources.
+        POST /api/1/marketing_sources · Data: dictionaries → MarketingSourcesResponse
+        """
+        return await self.call('/api/1/marketing_sources', compact({'organizationIds': organization_ids}), group='Data: dictionaries')
+
+    async def nomenclature(self, *, organization_id: str, start_revision: int | None = None) -> dict:
+        """Menu.
+        POST /api/1/nomenclature · Data: menu → NomenclatureResponse
+        """
+        return await self.call('/api/1/nomenclature', compact({'organizationId': organization_id, 'startRevision': start_revision}), group='Data: menu')
+
+    async def menu_v2(self) -> dict:
+        """External menus with price categories.
+        POST /api/2/menu · Data: menu → MenusDataResponse
+        """
+        return await self.call('/api/2/menu', None, group='Data: menu')
+
+    async def menu_by_id_v2(self, *, external_menu_id: str, organization_ids: list[str], price_category_id: str | None = None, version: int | None = None, language: str | None = None, async_mode: bool | None = None, start_revision: int | None = None) -> dict:
+        """Retrieve external menu by ID.
+        POST /api/2/menu/by_id · Data: menu
+        """
+        return await self.call('/api/2/menu/by_id', compact({'externalMenuId': external_menu_id, 'organizationIds': organization_ids, 'priceCategoryId': price_category_id, 'version': version, 'language': language, 'asyncMode': async_mode, 'startRevision': start_revision}), group='Data: menu')
+
+    async def stop_lists(self, *, organization_ids: list[str], return_size: bool | None = None, terminal_groups_ids: list[str] | None = None) -> dict:
+        """Out-of-stock items.
+        POST /api/1/stop_lists · Data: stoplists → StopListsResponse
+        """
+        return await self.call('/api/1/stop_lists', compact({'organizationIds': organization_ids, 'returnSize': return_size, 'terminalGroupsIds': terminal_groups_ids}), group='Data: stoplists')
+
+    async def stop_lists_check(self, *, organization_id: str, terminal_group_id: str, items: list[dict]) -> dict:
+        """Check items in out-of-stock list.
+        POST /api/1/stop_lists/check · Orders: creating → CheckStopListResponse
+        """
+        return await self.call('/api/1/stop_lists/check', compact({'organizationId': organization_id, 'terminalGroupId': terminal_group_id, 'items': items}), group='Orders: creating')
+
+    async def stop_lists_add(self, *, organization_id: str, terminal_group_id: str, items: list[dict]) -> dict:
+        """Add items to out-of-stock list.
+(You should have extra rights to use this method).
+        POST /api/1/stop_lists/add · Data: changing stoplists → CorrelationIdResponse
+        """
+        return await self.call('/api/1/stop_lists/add', compact({'organizationId': organization_id, 'terminalGroupId': terminal_group_id, 'items': items}), group='Data: changing stoplists')
+
+    async def stop_lists_remove(self, *, organization_id: str, terminal_group_id: str, items: list[dict]) -> dict:
+        """Remove items from out-of-stock list.
+(You should have extra rights to use this method).
+        POST /api/1/stop_lists/remove · Data: changing stoplists → CorrelationIdResponse
+        """
+        return await self.call('/api/1/stop_lists/remove', compact({'organizationId': organization_id, 'terminalGroupId': terminal_group_id, 'items': items}), group='Data: changing stoplists')
+
+    async def stop_lists_clear(self, *, organization_id: str, terminal_group_id: str) -> dict:
+        """Clear out-of-stock list.
+(You should have extra rights to use this method).
+        POST /api/1/stop_lists/clear · Data: changing stoplists → CorrelationIdResponse
+        """
+        return await self.call('/api/1/stop_lists/clear', compact({'organizationId': organization_id, 'terminalGroupId': terminal_group_id}), group='Data: changing stoplists')
+
+    async def notifications_send(self, *, message_type: str, organization_id: str) -> dict:
+        """Send notification to external systems.
+        POST /api/1/notifications/send · Notifications → CorrelationIdResponse
+        """
+        return await self.call('/api/1/notifications/send', compact({'messageType': message_type, 'organizationId': organization_id}), group='Notifications')
+
+    async def commands_status(self, *, organization_id: str, correlation_id: str) -> dict:
+        """Get status of command.
+        POST /api/1/commands/status · Commands → GetCommandStatusResponse
+        """
+        return await self.call('/api/1/commands/status', compact({'organizationId': organization_id, 'correlationId': correlation_id}), group='Commands')
+
+    async def order_create(self, *, organization_id: str, terminal_group_id: str, order: dict | None = None, create_order_settings: dict | None = None) -> dict:
+        """Create order.
+        POST /api/1/order/create · Orders: creating → TableOrderResponse
+        """
+        return await self.call('/api/1/order/create', compact({'organizationId': organization_id, 'terminalGroupId': terminal_group_id, 'order': order, 'createOrderSettings': create_order_settings}), group='Orders: creating')
+
+    async def order_by_id(self, *, organization_ids: list[str], source_keys: list[str] | None = None, order_ids: list[str] | None = None, pos_order_ids: list[str] | None = None, return_external_data_keys: list[str] | None = None) -> dict:
+        """Retrieve orders by IDs.
+        POST /api/1/order/by_id · Orders: receiving → TableOrdersResponse
+        """
+        return await self.call('/api/1/order/by_id', compact({'organizationIds': organization_ids, 'sourceKeys': source_keys, 'orderIds': order_ids, 'posOrderIds': pos_order_ids, 'returnExternalDataKeys': return_external_data_keys}), group='Orders: receiving', batch=(('orderIds', 'posOrderIds'), 'orders'))
+
+    async def order_by_table(self, *, organization_ids: list[str], table_ids: list[str], source_keys: list[str] | None = None, statuses: list[dict] | None = None, date_from: str | None = None, date_to: str | None = None) -> dict:
+        """Retrieve orders by tables.
+        POST /api/1/order/by_table · Orders: receiving → TableOrdersResponse
+        """
+        return await self.call('/api/1/order/by_table', compact({'organizationIds': organization_ids, 'tableIds': table_ids, 'sourceKeys': source_keys, 'statuses': statuses, 'dateFrom': date_from, 'dateTo': date_to}), group='Orders: receiving')
+
+    async def order_add_items(self, *, order_id: str, organization_id: str, items: list[dict], add_order_items_settings: dict | None = None, combos: list[dict] | None = None) -> dict:
+        """Add order items.
+        POST /api/1/order/add_items · Orders: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/order/add_items', compact({'orderId': order_id, 'organizationId': organization_id, 'items': items, 'addOrderItemsSettings': add_order_items_settings, 'combos': combos}), group='Orders: changing')
+
+    async def order_close(self, *, organization_id: str, order_id: str, cheque_additional_info: dict | None = None) -> dict:
+        """Close order.
+        POST /api/1/order/close · Order status: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/order/close', compact({'organizationId': organization_id, 'orderId': order_id, 'chequeAdditionalInfo': cheque_additional_info}), group='Order status: changing')
+
+    async def order_cancel(self, *, organization_id: str, order_id: str, removal_type_id: str | None = None, removal_comment: str | None = None, user_id_for_writeoff: str | None = None) -> dict:
+        """Cancel the table order.
+        POST /api/1/order/cancel → CorrelationIdResponse
+        """
+        return await self.call('/api/1/order/cancel', compact({'organizationId': organization_id, 'orderId': order_id, 'removalTypeId': removal_type_id, 'removalComment': removal_comment, 'userIdForWriteoff': user_id_for_writeoff}), group=None)
+
+    async def order_change_payments(self, *, organization_id: str, order_id: str, payments: list[dict], tips: list[dict] | None = None) -> dict:
+        """Change table order's payments.
+        POST /api/1/order/change_payments · Order payments: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/order/change_payments', compact({'organizationId': organization_id, 'orderId': order_id, 'payments': payments, 'tips': tips}), group='Order payments: changing')
+
+    async def order_change_external_data(self, *, organization_id: str, order_id: str, external_data: list[dict]) -> dict:
+        """Change table order external_data.
+        POST /api/1/order/change_external_data · Orders: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/order/change_external_data', compact({'organizationId': organization_id, 'orderId': order_id, 'externalData': external_data}), group='Orders: changing')
+
+    async def order_init_by_table(self, *, organization_id: str, terminal_group_id: str, table_ids: list[str]) -> dict:
+        """Init orders, created on POS, by tables.
+        POST /api/1/order/init_by_table · Orders: loading data → CorrelationIdResponse
+        """
+        return await self.call('/api/1/order/init_by_table', compact({'organizationId': organization_id, 'terminalGroupId': terminal_group_id, 'tableIds': table_ids}), group='Orders: loading data')
+
+    async def order_init_by_posorder(self, *, organization_id: str, terminal_group_id: str, pos_order_ids: list[str]) -> dict:
+        """Init orders, created on POS, by POS orders.
+        POST /api/1/order/init_by_posOrder · Orders: loading data → CorrelationIdResponse
+        """
+        return await self.call('/api/1/order/init_by_posOrder', compact({'organizationId': organization_id, 'terminalGroupId': terminal_group_id, 'posOrderIds': pos_order_ids}), group='Orders: loading data')
+
+    async def order_add_customer(self, *, organization_id: str, order_id: str, customer: dict) -> dict:
+        """Add customer to order.
+        POST /api/1/order/add_customer · Orders: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/order/add_customer', compact({'organizationId': organization_id, 'orderId': order_id, 'customer': customer}), group='Orders: changing')
+
+    async def order_add_payments(self, *, order_id: str, organization_id: str, payments: list[dict], tips: list[dict] | None = None) -> dict:
+        """Add order payments.
+        POST /api/1/order/add_payments · Order payments: changing → CorrelationIdResponse
+        """
+        return await self.call('/api/1/order/add_payments', compact({'orderId': order_id, 'organizationId': organization_id, 'payments': payments, 'tips': tips}), group='Order payments: changing')
+
+    async def organizations_settings(self, *, organization_ids: list[str] | None = None, include_disabled: bool | None = None, parameters: list[dict] | None = None, return_external_data: list[str] | None = None) -> dict:
+        """Returns available to api-login user organizations specified settings.
+        POST /api/1/organizations/settings · Organizations: settings → OrganizationsSettingsResponse
+        """
+        return await self.call('/api/1/organizations/settings', compact({'organizationIds': organization_ids, 'includeDisabled': include_disabled, 'parameters': parameters, 'returnExternalData': return_external_data}), group='Organizations: settings')
+
+    async def terminal_groups(self, *, organization_ids: list[str], include_disabled: bool | None = None, return_external_data: list[str] | None = None) -> dict:
+        """Method that returns information on groups of delivery terminals.
+        POST /api/1/terminal_groups · Data: dictionaries → TerminalGroupsResponse
+        """
+        return await self.call('/api/1/terminal_groups', compact({'organizationIds': organization_ids, 'includeDisabled': include_disabled, 'returnExternalData': return_external_data}), group='Data: dictionaries')
+
+    async def terminal_groups_is_alive(self, *, terminal_group_ids: list[str], organization_id: str | None = None, organization_ids: list[str] | None = None) -> dict:
+        """Returns information on availability of group of terminals.
+        POST /api/1/terminal_groups/is_alive · POS: availability → TerminalGroupsIsAliveResponse
+        """
+        return await self.call('/api/1/terminal_groups/is_alive', compact({'terminalGroupIds': terminal_group_ids, 'organizationId': organization_id, 'organizationIds': organization_ids}), group='POS: availability')
+
+    async def terminal_groups_awake(self, *, organization_ids: list[str], terminal_group_ids: list[str]) -> dict:
+        """Awake terminal groups from sleep mode.
+        POST /api/1/terminal_groups/awake · Organizations: settings → AwakeTerminalGroupsResponse
+        """
+        return await self.call('/api/1/terminal_groups/awake', compact({'organizationIds': organization_ids, 'terminalGroupIds': terminal_group_ids}), group='Organizations: settings')
+
+    async def webhooks_settings(self, *, organization_id: str) -> dict:
+        """Get webhooks settings for specified organization and authorized API login.
+        POST /api/1/webhooks/settings · Organizations: settings → GetWebHookSettingsResponse
+        """
+        return await self.call('/api/1/webhooks/settings', compact({'organizationId': organization_id}), group='Organizations: settings')
+
+    async def webhooks_update_settings(self, *, organization_id: str, web_hooks_uri: str, auth_token: str | None = None, web_hooks_filter: dict | None = None) -> dict:
+        """Update webhooks settings for specified organization and authorized API login.
+        POST /api/1/webhooks/update_settings · Organizations: settings → CorrelationIdResponse
+        """
+        return await self.call('/api/1/webhooks/update_settings', compact({'organizationId': organization_id, 'webHooksUri': web_hooks_uri, 'authToken': auth_token, 'webHooksFilter': web_hooks_filter}), group='Organizations: settings')
+
+    async def loyalty_syrve_customer_info(self, *, type: str, organization_id: str | None = None) -> dict:
+        """Get customer info.
+        POST /api/1/loyalty/syrve/customer/info · Guests: info → GetCustomerInfoResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/customer/info', compact({'type': type, 'organizationId': organization_id}), group='Guests: info')
+
+    async def loyalty_syrve_calculate(self, *, order: dict, organization_id: str, coupon: str | None = None, referrer_id: str | None = None, terminal_group_id: str | None = None, available_payment_marketing_campaign_ids: list[str] | None = None, applicable_manual_conditions: list[str] | None = None, dynamic_discounts: list[dict] | None = None, is_loyalty_trace_enabled: bool | None = None) -> dict:
+        """Calculate checkin.
+        POST /api/1/loyalty/syrve/calculate · Loyalty: order calculate → CalculateCheckinResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/calculate', compact({'order': order, 'organizationId': organization_id, 'coupon': coupon, 'referrerId': referrer_id, 'terminalGroupId': terminal_group_id, 'availablePaymentMarketingCampaignIds': available_payment_marketing_campaign_ids, 'applicableManualConditions': applicable_manual_conditions, 'dynamicDiscounts': dynamic_discounts, 'isLoyaltyTraceEnabled': is_loyalty_trace_enabled}), group='Loyalty: order calculate')
+
+    async def combo(self, *, organization_id: str, extra_data: bool | None = None) -> dict:
+        """Get combos info
+        POST /api/1/combo · Data: menu → GetCombosInfoResponse
+        """
+        return await self.call('/api/1/combo', compact({'organizationId': organization_id, 'extraData': extra_data}), group='Data: menu')
+
+    async def combo_calculate(self, *, items: list[dict], organization_id: str) -> dict:
+        """Calculate combo price
+        POST /api/1/combo/calculate · Loyalty: order calculate → CalculateComboPriceResponse
+        """
+        return await self.call('/api/1/combo/calculate', compact({'items': items, 'organizationId': organization_id}), group='Loyalty: order calculate')
+
+    async def loyalty_syrve_manual_condition(self, *, organization_id: str | None = None) -> dict:
+        """Get manual conditions.
+        POST /api/1/loyalty/syrve/manual_condition · Loyalty: dictionaries → GetManualConditionsResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/manual_condition', compact({'organizationId': organization_id}), group='Loyalty: dictionaries')
+
+    async def loyalty_syrve_customer_category(self, *, organization_id: str) -> dict:
+        """Get customer categories.
+        POST /api/1/loyalty/syrve/customer_category · Loyalty: dictionaries → GetCategoriesResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/customer_category', compact({'organizationId': organization_id}), group='Loyalty: dictionaries')
+
+    async def loyalty_syrve_customer_create_or_update(self, *, organization_id: str, id: str | None = None, phone: str | None = None, card_track: str | None = None, card_number: str | None = None, name: str | None = None, middle_name: str | None = None, sur_name: str | None = None, birthday: str | None = None, email: str | None = None, sex: dict | None = None, consent_status: dict | None = None, should_receive_loyalty_info: bool | None = None, should_receive_promo_actions_info: bool | None = None, referrer_id: str | None = None, user_data: str | None = None, is_deleted: bool | None = None) -> dict:
+        """Create or update customer.
+        POST /api/1/loyalty/syrve/customer/create_or_update · Guests: creating → CreateOrUpdateCustomerResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/customer/create_or_update', compact({'organizationId': organization_id, 'id': id, 'phone': phone, 'cardTrack': card_track, 'cardNumber': card_number, 'name': name, 'middleName': middle_name, 'surName': sur_name, 'birthday': birthday, 'email': email, 'sex': sex, 'consentStatus': consent_status, 'shouldReceiveLoyaltyInfo': should_receive_loyalty_info, 'shouldReceivePromoActionsInfo': should_receive_promo_actions_info, 'referrerId': referrer_id, 'userData': user_data, 'isDeleted': is_deleted}), group='Guests: creating')
+
+    async def loyalty_syrve_delete_customers(self, *, customer_ids: list[str], organization_id: str) -> dict:
+        """Logical deletion of customers.
+        POST /api/1/loyalty/syrve/delete_customers → DeleteCustomersResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/delete_customers', compact({'customerIds': customer_ids, 'organizationId': organization_id}), group=None)
+
+    async def loyalty_syrve_restore_customers(self, *, customer_ids: list[str], organization_id: str) -> dict:
+        """Logical recovery of customers.
+        POST /api/1/loyalty/syrve/restore_customers → RestoreCustomersResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/restore_customers', compact({'customerIds': customer_ids, 'organizationId': organization_id}), group=None)
+
+    async def loyalty_syrve_customer_category_add(self, *, customer_id: str, category_id: str, organization_id: str) -> dict:
+        """Add category for customer.
+        POST /api/1/loyalty/syrve/customer_category/add · Guests: changing → ChangeCategoryForCustomerResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/customer_category/add', compact({'customerId': customer_id, 'categoryId': category_id, 'organizationId': organization_id}), group='Guests: changing')
+
+    async def loyalty_syrve_customer_category_remove(self, *, customer_id: str, category_id: str, organization_id: str) -> dict:
+        """Remove category for customer.
+        POST /api/1/loyalty/syrve/customer_category/remove · Guests: changing → ChangeCategoryForCustomerResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/customer_category/remove', compact({'customerId': customer_id, 'categoryId': category_id, 'organizationId': organization_id}), group='Guests: changing')
+
+    async def loyalty_syrve_check_sms_sending_possibility(self, *, organization_id: str) -> dict:
+        """Check sms sending possibility.
+        POST /api/1/loyalty/syrve/check_sms_sending_possibility → SmsSendingPossibilityResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/check_sms_sending_possibility', compact({'organizationId': organization_id}), group=None)
+
+    async def loyalty_syrve_message_send_sms(self, *, phone: str, text: str, organization_id: str) -> dict:
+        """Send sms.
+        POST /api/1/loyalty/syrve/message/send_sms · Loyalty: messages → SendSmsResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/message/send_sms', compact({'phone': phone, 'text': text, 'organizationId': organization_id}), group='Loyalty: messages')
+
+    async def loyalty_syrve_check_sms_status(self, *, sms_ids: list[str], organization_id: str) -> dict:
+        """Check SMS status.
+        POST /api/1/loyalty/syrve/check_sms_status → CheckSmsStatusResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/check_sms_status', compact({'smsIds': sms_ids, 'organizationId': organization_id}), group=None)
+
+    async def loyalty_syrve_message_send_email(self, *, receiver: str, subject: str, body: str, organization_id: str) -> dict:
+        """Send email.
+        POST /api/1/loyalty/syrve/message/send_email · Loyalty: messages → SendEmailResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/message/send_email', compact({'receiver': receiver, 'subject': subject, 'body': body, 'organizationId': organization_id}), group='Loyalty: messages')
+
+    async def loyalty_syrve_program(self, *, organization_id: str, without_marketing_campaigns: bool | None = None) -> dict:
+        """Get programs.
+        POST /api/1/loyalty/syrve/program · Loyalty: dictionaries → GetProgramsResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/program', compact({'organizationId': organization_id, 'withoutMarketingCampaigns': without_marketing_campaigns}), group='Loyalty: dictionaries')
+
+    async def loyalty_syrve_customer_program_add(self, *, organization_id: str, customer_id: str | None = None, program_id: str | None = None) -> dict:
+        """Add customer to program.
+        POST /api/1/loyalty/syrve/customer/program/add · Guests: changing → AddCustomerToProgramResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/customer/program/add', compact({'organizationId': organization_id, 'customerId': customer_id, 'programId': program_id}), group='Guests: changing')
+
+    async def loyalty_syrve_customer_card_add(self, *, customer_id: str, card_track: str, card_number: str, organization_id: str) -> dict:
+        """Add card.
+        POST /api/1/loyalty/syrve/customer/card/add · Guests: changing → AddMagnetCardResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/customer/card/add', compact({'customerId': customer_id, 'cardTrack': card_track, 'cardNumber': card_number, 'organizationId': organization_id}), group='Guests: changing')
+
+    async def loyalty_syrve_customer_card_remove(self, *, customer_id: str, card_track: str, organization_id: str) -> dict:
+        """Delete card.
+        POST /api/1/loyalty/syrve/customer/card/remove · Guests: changing → DeleteMagnetCardResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/customer/card/remove', compact({'customerId': customer_id, 'cardTrack': card_track, 'organizationId': organization_id}), group='Guests: changing')
+
+    async def loyalty_syrve_customer_wallet_hold(self, *, customer_id: str, wallet_id: str, sum: float, organization_id: str, transaction_id: str | None = None, comment: str | None = None) -> dict:
+        """Hold money.
+        POST /api/1/loyalty/syrve/customer/wallet/hold · Loyalty: wallets → HoldMoneyResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/customer/wallet/hold', compact({'customerId': customer_id, 'walletId': wallet_id, 'sum': sum, 'organizationId': organization_id, 'transactionId': transaction_id, 'comment': comment}), group='Loyalty: wallets')
+
+    async def loyalty_syrve_customer_wallet_cancel_hold(self, *, transaction_id: str, organization_id: str) -> dict:
+        """Cancel hold money.
+        POST /api/1/loyalty/syrve/customer/wallet/cancel_hold · Loyalty: wallets → CancelHoldMoneyResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/customer/wallet/cancel_hold', compact({'transactionId': transaction_id, 'organizationId': organization_id}), group='Loyalty: wallets')
+
+    async def loyalty_syrve_customer_wallet_topup(self, *, organization_id: str, customer_id: str | None = None, wallet_id: str | None = None, sum: float | None = None, comment: str | None = None) -> dict:
+        """Refill balance.
+        POST /api/1/loyalty/syrve/customer/wallet/topup · Loyalty: wallets → RefillUserBalanceResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/customer/wallet/topup', compact({'organizationId': organization_id, 'customerId': customer_id, 'walletId': wallet_id, 'sum': sum, 'comment': comment}), group='Loyalty: wallets')
+
+    async def loyalty_syrve_customer_wallet_chargeoff(self, *, organization_id: str, customer_id: str | None = None, wallet_id: str | None = None, sum: float | None = None, comment: str | None = None) -> dict:
+        """Withdraw balance.
+        POST /api/1/loyalty/syrve/customer/wallet/chargeoff · Loyalty: wallets → WithdrawUserBalanceResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/customer/wallet/chargeoff', compact({'organizationId': organization_id, 'customerId': customer_id, 'walletId': wallet_id, 'sum': sum, 'comment': comment}), group='Loyalty: wallets')
+
+    async def loyalty_syrve_get_counters(self, *, organization_id: str, guest_ids: list[str] | None = None, periods: list[dict] | None = None, metrics: list[dict] | None = None) -> dict:
+        """Get counters.
+        POST /api/1/loyalty/syrve/get_counters → GetCountersResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/get_counters', compact({'organizationId': organization_id, 'guestIds': guest_ids, 'periods': periods, 'metrics': metrics}), group=None)
+
+    async def loyalty_syrve_coupons_info(self, *, number: str, organization_id: str, series: str | None = None) -> dict:
+        """Get coupon info.
+        POST /api/1/loyalty/syrve/coupons/info · Loyalty: coupons → CouponInfoResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/coupons/info', compact({'number': number, 'organizationId': organization_id, 'series': series}), group='Loyalty: coupons')
+
+    async def loyalty_syrve_coupons_series(self, *, organization_id: str) -> dict:
+        """Get coupon series with non-activated coupons.
+        POST /api/1/loyalty/syrve/coupons/series · Loyalty: coupons → SeriesWithNotActivatedCouponsResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/coupons/series', compact({'organizationId': organization_id}), group='Loyalty: coupons')
+
+    async def loyalty_syrve_coupons_by_series(self, *, series: str, organization_id: str, page_size: int | None = None, page: int | None = None) -> dict:
+        """Get non-activated coupons
+        POST /api/1/loyalty/syrve/coupons/by_series · Loyalty: coupons → NotActivatedCouponResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/coupons/by_series', compact({'series': series, 'organizationId': organization_id, 'pageSize': page_size, 'page': page}), group='Loyalty: coupons')
+
+    async def loyalty_syrve_customer_transactions_by_revision(self, *, customer_id: str, page_size: int, organization_id: str, revision: int | None = None, last_transaction_id: str | None = None) -> dict:
+        """Get transaction report by revision.
+        POST /api/1/loyalty/syrve/customer/transactions/by_revision · Guests: transactions → GetTransactionsReportByRevisionResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/customer/transactions/by_revision', compact({'customerId': customer_id, 'pageSize': page_size, 'organizationId': organization_id, 'revision': revision, 'lastTransactionId': last_transaction_id}), group='Guests: transactions')
+
+    async def loyalty_syrve_customer_transactions_by_date(self, *, customer_id: str, date_from: str, date_to: str, page_number: int, page_size: int, organization_id: str) -> dict:
+        """Get transaction report by period.
+        POST /api/1/loyalty/syrve/customer/transactions/by_date · Guests: transactions → GetTransactionsReportByPeriodResponse
+        """
+        return await self.call('/api/1/loyalty/syrve/customer/transactions/by_date', compact({'customerId': customer_id, 'dateFrom': date_from, 'dateTo': date_to, 'pageNumber': page_number, 'pageSize': page_size, 'organizationId': organization_id}), group='Guests: transactions')
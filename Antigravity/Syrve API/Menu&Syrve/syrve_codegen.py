@@ -0,0 +1,168 @@
+"""
+syrve_codegen.py
+Generates syrve_client.py from the Syrve Cloud OpenAPI spec (docs.json).
+
+One async method per (non-deprecated) operation, named after its path
+(/api/1/deliveries/by_id → deliveries_by_id, /api/2/menu → menu_v2). The
+request body's top-level properties become typed keyword-only arguments,
+required ones first; optional arguments left as None are not sent. Each
+method passes its restriction group, and by_id lookups pass the id list
+that SyrveSession may split into batches.
+
+Usage:  python syrve_codegen.py [docs.json] [syrve_client.py]
+"""
+
+import json
+import keyword
+import re
+import sys
+
+SPEC_FILE   = 'docs.json'
+OUTPUT_FILE = 'syrve_client.py'
+
+SKIP_PATHS = {'/api/1/access_token'}      # handled by SyrveSession.token()
+
+SCALAR_TYPES = {'string': 'str', 'integer': 'int', 'number': 'float', 'boolean': 'bool'}
+
+
+def schema_of(spec, ref_or_schema):
+    schema = ref_or_schema
+    while '$ref' in schema:
+        schema = spec['components']['schemas'][schema['$ref'].split('/')[-1]]
+    return schema
+
+
+def annotation(spec, schema):
+    if '$ref' in schema or 'allOf' in schema:
+        return 'dict'
+    kind = schema.get('type')
+    if kind == 'array':
+        return f"list[{annotation(spec, schema.get('items', {}))}]"
+    return SCALAR_TYPES.get(kind, 'dict')
+
+
+def restriction_group(operation):
+    match = re.search(r"Restriction group: `([^`]*)`", operation.get('description', ''))
+    return match.group(1) if match else None
+
+
+def method_name(path):
+    version, _, rest = path[len('/api/'):].partition('/')
+    name = re.sub(r'\W', '_', rest).lower()
+    return name if version == '1' else f"{name}_v{version}"
+
+
+def snake(name):
+    name = re.sub(r'(?<=[a-z0-9])([A-Z])', r'_\1', name).lower()
+    return name + '_' if keyword.iskeyword(name) else name
+
+
+def batch_field(spec, path, request, operation):
+    """((id_fields…), result_field) for by_id lookups whose response is one list."""
+    if not path.endswith('by_id'):
+        return None
+    ok = operation['responses'].get('200', {}).get('content', {}).get('application/json')
+    if not ok:
+        return None
+    lists = [k for k, v in schema_of(spec, ok['schema']).get('properties', {}).items()
+             if v.get('type') == 'array']
+    ids = tuple(k for k, v in request.get('properties', {}).items()
+                if v.get('type') == 'array' and (k == 'ids' or k.endswith('Ids'))
+                and not k.startswith('organization'))
+    if len(lists) == 1 and ids:
+        return ids, lists[0]
+    return None
+
+
+def operations(spec):
+    for path, ops in spec['paths'].items():
+        if path in SKIP_PATHS:
+            continue
+        for verb, op in ops.items():
+            if not op.get('deprecated'):
+                yield path, verb.upper(), op
+
+
+def render_method(spec, path, verb, op):
+    body = op.get('requestBody', {}).get('content', {}).get('application/json')
+    request = schema_of(spec, body['schema']) if body else {}
+    required = set(request.get('required', []))
+    props = request.get('properties', {})
+    ordered = sorted(props, key=lambda k: k not in required)     # stable: required first
+
+    args = []
+    for prop in ordered:
+        hint = annotation(spec, props[prop])
+        args.append(f"{snake(prop)}: {hint}" if prop in required else f"{snake(prop)}: {hint} | None = None")
+
+    group = restriction_group(op)
+    batch = batch_field(spec, path, request, op)
+    ok = op['responses'].get('200', {}).get('content', {}).get('application/json')
+    returns = ok['schema'].get('$ref', '').split('/')[-1].split('.')[-1] if ok else ''
+
+    signature = f"    async def {method_name(path)}(self" + (", *, " + ", ".join(args) if args else "") + ") -> dict:"
+    doc = (op.get('summary') or path).strip().replace('"""', "'''")
+    lines = [signature, f'        """{doc}']
+    lines.append(f"        {verb} {path}" + (f" · {group}" if group else "") + (f" → {returns}" if returns else ""))
+    lines.append('        """')
+
+    payload = "None"
+    if body:
+        payload = "compact({" + ", ".join(f"'{p}': {snake(p)}" for p in ordered) + "})"
+    extra = [f"group={group!r}"]
+    if verb != 'POST':
+        extra.append(f"method={verb!r}")
+    if batch:
+        extra.append(f"batch={batch!r}")
+    lines.append(f"        return await self.call({path!r}, {payload}, {', '.join(extra)})")
+    return "\n".join(lines)
+
+
+def generate(spec):
+    ops = list(operations(spec))
+    out = [
+        '"""',
+        'syrve_client.py',
+        'Typed asyncio client for the Syrve Cloud API.',
+        '',
+        f'GENERATED by syrve_codegen.py from docs.json ({len(ops)} operations) — do not edit;',
+        'change the spec or the generator and re-run it. Transport, token caching,',
+        'restriction-group limits and by_id batching live in syrve_api.py.',
+        '',
+        'Usage:',
+        '    async with SyrveClient() as api:',
+        '        orgs = await api.organizations(return_additional_info=False)',
+        '"""',
+        '',
+        'from syrve_api import SyrveSession, compact',
+        '',
+        '',
+        '# path → (method, restriction group)',
+        'ENDPOINTS = {',
+    ]
+    out += [f"    {path!r}: ({verb!r}, {restriction_group(op)!r})," for path, verb, op in ops]
+    out += ['}', '', '', 'class SyrveClient(SyrveSession):']
+    for path, verb, op in ops:
+        out += ['', render_method(spec, path, verb, op)]
+    return "\n".join(out) + "\n"
+
+
+def main():
+    args = sys.argv[1:]
+    if len(args) > 2 or any(a.startswith('-') for a in args):
+        # -h/--help, or anything that is not a path: show the usage
+        print(__doc__.strip())
+        sys.exit(0 if set(args) & {'-h', '--help'} else 2)
+    spec_path = args[0] if args else SPEC_FILE
+    out_path = args[1] if len(args) > 1 else OUTPUT_FILE
+    with open(spec_path, 'r', encoding='utf-8') as f:
+        spec = json.load(f)
+    source = generate(spec)
+    compile(source, out_path, 'exec')
+    with open(out_path, 'w', encoding='utf-8') as f:
+        f.write(source)
+    print(f"Wrote {out_path}: {source.count('    async def ')} methods")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,197 @@
+"""
+syrve_mock.py
+Local stand-in for Syrve Cloud, built from the same OpenAPI spec (docs.json)
+as syrve_client.py, for trying the client and the sync scripts offline.
+
+Every path in the spec answers with a sample of its 200 response schema
+(spec examples where given, else a typed placeholder). /api/1/access_token
+issues tokens; other calls need a valid "Authorization: Bearer" token or get
+401 with an ErrorResponse. Unknown paths get 404. Connections are kept
+alive like the real API. `stats` counts connections, requests per path and
+the peak number of concurrent calls per restriction group.
+
+Usage:  python syrve_mock.py [port]         (then use base_url=http://127.0.0.1:<port>)
+        python syrve_mock.py --selftest     (run the client against it once)
+"""
+
+import asyncio
+import json
+import re
+import sys
+import time
+import uuid
+from collections import Counter
+
+SPEC_FILE = 'docs.json'
+TOKEN_PATH = '/api/1/access_token'
+SAMPLE_DEPTH = 4          # nested objects below this depth are sampled as {}
+
+
+class MockSyrve:
+    def __init__(self, spec_path=SPEC_FILE, latency=0.0):
+        with open(spec_path, 'r', encoding='utf-8') as f:
+            self.spec = json.load(f)
+        self.latency = latency
+        self.routes = {}                       # (METHOD, path) → (group, 200 schema)
+        for path, ops in self.spec['paths'].items():
+            for verb, op in ops.items():
+                match = re.search(r"Restriction group: `([^`]*)`", op.get('description', ''))
+                ok = op['responses'].get('200', {}).get('content', {}).get('application/json', {})
+                self.routes[(verb.upper(), path)] = (match.group(1) if match else None, ok.get('schema', {}))
+        self.tokens = set()
+        self.stats = {'connections': 0, 'requests': Counter(), 'peak_group': Counter()}
+        self._active = Counter()
+        self._server = None
+        self._handlers = set()
+
+    # ─── Server ─────────────────────────────────────────────────────────────
+    async def start(self, host='127.0.0.1', port=0):
+        self._server = await asyncio.start_server(self._serve, host, port)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"http://{host}:{port}"
+        return self.url
+
+    async def stop(self):
+        self._server.close()
+        for task in self._handlers:
+            task.cancel()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await self._server.wait_closed()
+
+    def revoke_tokens(self):
+        """Invalidate every issued token (the client should renew on the next 401)."""
+        self.tokens.clear()
+
+    async def _serve(self, reader, writer):
+        self.stats['connections'] += 1
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, _ = request_line.decode('latin-1').split(' ', 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                raw = await reader.readexactly(int(headers.get('content-length', 0)))
+                body = json.loads(raw) if raw else None
+
+                status, payload = await self._handle(method, path, headers, body)
+                data = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+                writer.write((f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                              f"Content-Type: application/json; charset=utf-8\r\n"
+                              f"Content-Length: {len(data)}\r\n"
+                              f"Connection: keep-alive\r\n\r\n").encode('latin-1') + data)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            self._handlers.discard(task)
+            writer.close()
+
+    async def _handle(self, method, path, headers, body):
+        self.stats['requests'][path] += 1
+        if path == TOKEN_PATH:
+            if not (body or {}).get('apiLogin'):
+                return 401, error("Wrong apiLogin")
+            token = uuid.uuid4().hex
+            self.tokens.add(token)
+            return 200, {'correlationId': str(uuid.uuid4()), 'token': token}
+
+        route = self.routes.get((method, path))
+        if route is None:
+            return 404, error(f"Unknown operation {method} {path}")
+        auth = headers.get('authorization', '')
+        if not auth.startswith('Bearer ') or auth[7:] not in self.tokens:
+            return 401, error("Token is expired or invalid")
+
+        group, schema = route
+        self._active[group] += 1
+        self.stats['peak_group'][group] = max(self.stats['peak_group'][group], self._active[group])
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            return 200, self.sample(schema)
+        finally:
+            self._active[group] -= 1
+
+    # ─── Samples from the spec ──────────────────────────────────────────────
+    def sample(self, schema, depth=0):
+        if '$ref' in schema:
+            schema = self.spec['components']['schemas'][schema['$ref'].split('/')[-1]]
+        if 'allOf' in schema:
+            merged = {}
+            for part in schema['allOf']:
+                value = self.sample(part, depth)
+                if isinstance(value, dict):
+                    merged.update(value)
+            return merged
+        if 'example' in schema:
+            return schema['example']
+        if 'enum' in schema:
+            return schema['enum'][0]
+        kind = schema.get('type', 'object')
+        if kind == 'array':
+            return [] if depth >= SAMPLE_DEPTH else [self.sample(schema.get('items', {}), depth + 1)]
+        if kind == 'object':
+            if depth >= SAMPLE_DEPTH:
+                return {}
+            return {name: self.sample(sub, depth + 1)
+                    for name, sub in schema.get('properties', {}).items()}
+        if kind == 'string':
+            return {'uuid': str(uuid.uuid4()), 'date-time': '2026-01-01 00:00:00.000'}.get(
+                schema.get('format'), 'string')
+        return {'integer': 0, 'number': 0.0, 'boolean': False}.get(kind)
+
+
+def error(text):
+    return {'correlationId': str(uuid.uuid4()), 'errorDescription': text, 'error': None}
+
+
+async def selftest():
+    from syrve_client import SyrveClient
+
+    mock = MockSyrve(latency=0.01)
+    url = await mock.start()
+    async with SyrveClient(api_login='mock', base_url=url, group_limits={'Data: dictionaries': 2}) as api:
+        start = time.perf_counter()
+        await asyncio.gather(*(api.organizations() for _ in range(20)))
+        mock.revoke_tokens()
+        orders = await api.order_by_id(organization_ids=[str(uuid.uuid4())],
+                                       order_ids=[str(uuid.uuid4()) for _ in range(250)])
+        elapsed = (time.perf_counter() - start) * 1000
+    await mock.stop()
+
+    print(f"{api.calls} requests over {mock.stats['connections']} connections in {elapsed:.0f} ms")
+    print(f"  tokens issued:   {mock.stats['requests'][TOKEN_PATH]}")
+    print(f"  order/by_id:     {mock.stats['requests']['/api/1/order/by_id']} requests, "
+          f"{len(orders['orders'])} results")
+    print(f"  peak per group:  {dict(mock.stats['peak_group'])}")
+
+
+async def serve_forever(port):
+    mock = MockSyrve()
+    url = await mock.start(port=port)
+    print(f"Mock Syrve Cloud ({len(mock.routes)} operations) on {url}")
+    await asyncio.Event().wait()
+
+
+def main():
+    if '--selftest' in sys.argv:
+        asyncio.run(selftest())
+        return
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8080
+    try:
+        asyncio.run(serve_forever(port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+"""
+syrve_sync.py
+Change planner for the catalog (Groups, Product_Categories, Nomenclature,
+modifier schemas) against Syrve, with an idempotent bulk push that runs
+against the local syrve_mock.py server only.
+
+Every entity is turned into a payload keyed by its deterministic
+Syrve_System_ID (uuid5 from catalog_store.generate_uuid) and fingerprinted
+as sha256 of that payload. The ledger (LEDGER_FILE) remembers the
+fingerprint last accepted for each id, so a sync sends only new or changed
+entities: one bulk request per kind (per PUSH_BATCH_SIZE entities), groups
+before categories before products before schemas. A one-item edit in a
+5,000-SKU catalog is a single request. The ledger is updated after each
+accepted request, so an interrupted sync resumes where it stopped. Ids that
+disappeared from the catalog are only reported.
+
+This is not a real Syrve push. The Cloud API (docs.json, syrve_api.py) has
+no nomenclature write operations. The Syrve Server API that does has its own
+host, its own auth (/resto/api/auth key) and per-entity save/update
+endpoints, none of which are implemented here. PUSH_ENDPOINTS and the
+{'items': [...]} bulk body are the mock's protocol. Without --mock the
+script only prints the plan.
+
+Usage:  python syrve_sync.py [--full]          (plan: what a push would send)
+        python syrve_sync.py --mock [--full]   (push to a local syrve_mock server)
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import urllib.parse
+
+from dataset import read_tsv
+from model import Item, ModifierOption, read_table
+from syrve_api import SyrveSession
+
+LEDGER_FILE     = 'syrve_ledger_mock.json'     # what the mock server accepted
+PUSH_BATCH_SIZE = 500
+PUSH_GROUP      = 'Nomenclature: import'
+LOCAL_HOSTS     = {'127.0.0.1', 'localhost', '::1'}
+
+# kind → bulk path served by syrve_mock (not Syrve endpoints); dict order is
+# the push order (parents first)
+PUSH_ENDPOINTS = {
+    'groups':           '/resto/api/v2/entities/products/group/import',
+    'categories':       '/resto/api/v2/entities/productCategories/import',
+    'products':         '/resto/api/v2/entities/products/import',
+    'modifier_schemas': '/resto/api/v2/entities/modifierSchemas/import',
+}
+
+
+def fingerprint(payload):
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+# ─── Catalog → payloads ─────────────────────────────────────────────────────
+def catalog_entities():
+    """{kind: {syrve_id: payload}} in PUSH_ENDPOINTS order."""
+    groups = read_tsv('Groups.tsv')
+    categories = read_tsv('Product_Categories.tsv')
+    nomenclature = [i for i in read_table('Nomenclature.tsv', Item) if i.syrve_sync == 'Yes']
+    registry = read_tsv('Modifier_Schema_Registry.tsv')
+
+    group_id = {r['Group_Code']: r['Syrve_System_ID'] for r in groups}
+    category_id = {r['Category_Code']: r['Syrve_System_ID'] for r in categories}
+    schema_id = {r['Schema_Code']: r['Syrve_System_ID'] for r in registry}
+    product_id = {i.code: i.sys_id for i in nomenclature}
+
+    entities = {kind: {} for kind in PUSH_ENDPOINTS}
+    for r in groups:
+        entities['groups'][r['Syrve_System_ID']] = {
+            'id': r['Syrve_System_ID'], 'code': r['Group_Code'], 'name': r['Group_Name'],
+            'parentGroup': group_id.get(r['Parent_Group_Code']), 'description': r['Description'],
+        }
+    for r in categories:
+        entities['categories'][r['Syrve_System_ID']] = {
+            'id': r['Syrve_System_ID'], 'code': r['Category_Code'], 'name': r['Category_Name'],
+        }
+    for i in nomenclature:
+        entities['products'][i.sys_id] = {
+            'id': i.sys_id, 'code': i.code, 'name': i.name,
+            'type': i.type, 'orderItemType': i.order_item_type or None,
+            'measureUnit': i.measure_unit or None,
+            'parentGroup': group_id.get(i.group),
+            'productCategoryId': category_id.get(i.category),
+            'modifierSchemaId': schema_id.get(i.schema),
+        }
+
+    schemes = {}
+    for option in read_table('Modifier_Schemes.tsv', ModifierOption):
+        groups_of = schemes.setdefault(option.schema, {})
+        group = groups_of.setdefault(option.group, {
+            'id': product_id.get(option.group),
+            'minAmount': option.min_amount, 'maxAmount': option.max_amount,
+            'items': [],
+        })
+        group['items'].append({'productId': product_id.get(option.item),
+                               'defaultAmount': option.default_amount})
+    for r in registry:
+        entities['modifier_schemas'][r['Syrve_System_ID']] = {
+            'id': r['Syrve_System_ID'], 'code': r['Schema_Code'], 'name': r['Schema_Name'],
+            'productId': product_id.get(r['Dish_Short_Code']),
+            'groups': list(schemes.get(r['Schema_Code'], {}).values()),
+        }
+    return entities
+
+
+# ─── Ledger ─────────────────────────────────────────────────────────────────
+def load_ledger(path=LEDGER_FILE):
+    """{kind: {syrve_id: fingerprint}} of what the server last accepted."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_ledger(ledger, path=LEDGER_FILE):
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(ledger, f, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def plan_changes(entities, ledger):
+    """({kind: [payload, …]} to push, {kind: [id, …]} in the ledger but no longer in the catalog)."""
+    changed, removed = {}, {}
+    for kind, items in entities.items():
+        pushed = ledger.get(kind, {})
+        todo = [p for sid, p in items.items() if pushed.get(sid) != fingerprint(p)]
+        if todo:
+            changed[kind] = todo
+        gone = sorted(set(pushed) - set(items))
+        if gone:
+            removed[kind] = gone
+    return changed, removed
+
+
+# ─── Push ───────────────────────────────────────────────────────────────────
+async def push(session, changed, ledger, ledger_path=LEDGER_FILE):
+    """Send each kind's changes in PUSH_BATCH_SIZE chunks; returns the request count."""
+    requests = 0
+    for kind, path in PUSH_ENDPOINTS.items():
+        payloads = changed.get(kind, [])
+        for start in range(0, len(payloads), PUSH_BATCH_SIZE):
+            chunk = payloads[start:start + PUSH_BATCH_SIZE]
+            await session.call(path, {'items': chunk}, group=PUSH_GROUP)
+            requests += 1
+            accepted = ledger.setdefault(kind, {})
+            for payload in chunk:
+                accepted[payload['id']] = fingerprint(payload)
+            save_ledger(ledger, ledger_path)
+    return requests
+
+
+async def sync(base_url, ledger_path, dry_run=False, full=False, api_login=None):
+    """Plan the changes and, unless dry_run, push them to the syrve_mock server at base_url."""
+    if not dry_run and urllib.parse.urlsplit(base_url).hostname not in LOCAL_HOSTS:
+        raise ValueError(f"{base_url}: pushes only go to a local syrve_mock server; "
+                         "Syrve itself has no endpoint for this payload")
+    entities = catalog_entities()
+    ledger = {} if full else load_ledger(ledger_path)
+    changed, removed = plan_changes(entities, ledger)
+
+    total = sum(len(v) for v in entities.values())
+    print(f"Catalog: {total} entities; {sum(len(v) for v in changed.values())} new or changed")
+    for kind, payloads in changed.items():
+        print(f"  {kind:<17} {len(payloads):>5}  " + ", ".join(p['code'] for p in payloads[:5])
+              + (" …" if len(payloads) > 5 else ""))
+    for kind, ids in removed.items():
+        print(f"  {kind:<17} {len(ids):>5} no longer in the catalog (not deleted in Syrve)")
+    if dry_run or not changed:
+        return 0
+
+    async with SyrveSession(api_login=api_login, base_url=base_url) as session:
+        requests = await push(session, changed, ledger, ledger_path)
+    print(f"Pushed to the mock in {requests} request(s); ledger saved to {ledger_path}")
+    return requests
+
+
+async def sync_mock(full):
+    from syrve_mock import MockSyrve
+
+    mock = MockSyrve()
+    for path in PUSH_ENDPOINTS.values():
+        mock.routes[('POST', path)] = (PUSH_GROUP, {})
+    url = await mock.start()
+    try:
+        await sync(url, LEDGER_FILE, full=full, api_login='mock')
+    finally:
+        await mock.stop()
+
+
+def main():
+    full = '--full' in sys.argv
+    if '--mock' in sys.argv:
+        asyncio.run(sync_mock(full))
+        return
+    asyncio.run(sync(None, LEDGER_FILE, dry_run=True, full=full))
+    print("Plan only: Syrve has no endpoint this script can push to; "
+          "use --mock to exercise the push against syrve_mock.py.")
+
+
+if __name__ == '__main__':
+    main()
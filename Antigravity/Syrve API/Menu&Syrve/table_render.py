@@ -0,0 +1,90 @@
+"""
+table_render.py
+Shared streaming table renderer for the HTML/TSV generators.
+
+A table is its column list plus an iterable of rows (usually a generator).
+Rows are escaped and written straight to the file handle one at a time, so
+rendering is linear in the number of cells and never holds the document in
+memory — no more `html += …` inside loops.
+
+The data artifact of a table is JSON lines (<name>.jsonl): the header first,
+then one JSON array of cell strings per row. upload_to_sheets reads it
+directly; the HTML page is only a view for people, rendered by re-reading
+the artifact (read_jsonl_table) so a table is built and streamed only once.
+"""
+
+import csv
+import html
+import json
+from collections import namedtuple
+
+# columns: list of header names; rows: iterable of row sequences
+Table = namedtuple('Table', 'columns rows')
+
+HTML_HEAD = '<!DOCTYPE html>\n<html><head><meta charset="utf-8"></head><body>\n'
+HTML_TAIL = '</body></html>\n'
+
+
+def text(value):
+    return "" if value is None else str(value)
+
+
+def esc(value):
+    return "" if value is None else html.escape(str(value), quote=False)
+
+
+def iter_html_table(table, table_id=None):
+    """Yield the <table> markup of `table` chunk by chunk (one chunk per row)."""
+    yield f"<table id='{table_id}'>\n" if table_id else "<table>\n"
+    yield "<tr>" + "".join(f"<th>{esc(c)}</th>" for c in table.columns) + "</tr>\n"
+    for row in table.rows:
+        yield "<tr>" + "".join(f"<td>{esc(c)}</td>" for c in row) + "</tr>\n"
+    yield "</table>\n"
+
+
+def iter_html_document(table, head=HTML_HEAD):
+    """A complete single-table HTML page."""
+    yield head
+    yield from iter_html_table(table)
+    yield HTML_TAIL
+
+
+def write_chunks(fh, chunks):
+    for chunk in chunks:
+        fh.write(chunk)
+
+
+def write_html(path, table, head=HTML_HEAD):
+    with open(path, 'w', encoding='utf-8') as f:
+        write_chunks(f, iter_html_document(table, head))
+
+
+def write_tsv(path, table):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        w = csv.writer(f, delimiter='\t')
+        w.writerow(table.columns)
+        w.writerows(table.rows)
+
+
+def read_tsv_table(f):
+    """Table view of an open TSV file; rows are read lazily from the handle."""
+    rows = csv.reader(f, delimiter='\t')
+    return Table(next(rows, []), rows)
+
+
+def iter_jsonl(table):
+    yield json.dumps([text(c) for c in table.columns], ensure_ascii=False) + "\n"
+    for row in table.rows:
+        yield json.dumps([text(c) for c in row], ensure_ascii=False) + "\n"
+
+
+def read_jsonl_table(f):
+    """Table view of an open .jsonl artifact; rows are read lazily from the handle."""
+    rows = (json.loads(line) for line in f if line.strip())
+    return Table(next(rows, []), rows)
+
+
+def read_jsonl(path):
+    """Rows (header included) of a .jsonl table artifact."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
@@ -1,5 +1,8 @@
 import os
 import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload
@@ -7,56 +10,115 @@ from googleapiclient.http import MediaFileUpload
 # Scopes needed for Google Drive API
 SCOPES = ['https://www.googleapis.com/auth/drive']
 FOLDER_ID = '1bskKhKJ4BzoRNfsRO7wbNjsQ21Apn-pb'
+LINKS_FILE = 'drive_links.json'
+
+# Uploads run in a thread pool; each thread gets its own Drive service
+# object because googleapiclient's http transport is not thread-safe.
+MAX_WORKERS = 8
+# Drive accepts at most 100 calls in one batch request
+PERMISSION_BATCH_SIZE = 100
+
+_local = threading.local()
 
 def authenticate():
     cred_path = 'gdisk_cred.json'
     creds = Credentials.from_service_account_file(cred_path, scopes=SCOPES)
     return build('drive', 'v3', credentials=creds)
 
-def upload_file(drive_service, filepath, folder_id):
-    filename = os.path.basename(filepath)
-    file_metadata = {
-        'name': filename,
-        'parents': [folder_id]
-    }
-    
+def thread_service():
+    if not hasattr(_local, 'service'):
+        _local.service = authenticate()
+    return _local.service
+
+def guess_mimetype(filename):
     # Simple mime-type guessing
     if filename.endswith('.pdf'):
-        mimetype = 'application/pdf'
+        return 'application/pdf'
     elif filename.endswith('.jpg') or filename.endswith('.jpeg'):
-        mimetype = 'image/jpeg'
+        return 'image/jpeg'
     elif filename.endswith('.png'):
-        mimetype = 'image/png'
-    else:
-        mimetype = 'application/octet-stream'
+        return 'image/png'
+    return 'application/octet-stream'
 
-    media = MediaFileUpload(filepath, mimetype=mimetype, resumable=True)
-    
-    try:
-        file = drive_service.files().create(
-            body=file_metadata,
+def file_md5(filepath):
+    h = hashlib.md5()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def list_folder(drive_service, folder_id):
+    """{name: {id, md5Checksum, webViewLink}} for every file in the folder (one paged listing)."""
+    remote, page_token = {}, None
+    while True:
+        resp = drive_service.files().list(
+            q=f"'{folder_id}' in parents and trashed = false",
+            fields='nextPageToken, files(id, name, md5Checksum, webViewLink)',
+            pageSize=1000,
+            pageToken=page_token,
+            supportsAllDrives=True,
+            includeItemsFromAllDrives=True
+        ).execute()
+        for f in resp.get('files', []):
+            remote.setdefault(f['name'], f)   # duplicates from older runs: keep the first
+        page_token = resp.get('nextPageToken')
+        if not page_token:
+            return remote
+
+def sync_file(filepath, remote_file, folder_id):
+    """
+    Make the Drive copy of `filepath` match the local bytes.
+    Returns (status, file_id, webViewLink); status is 'skipped' when the
+    md5 already matches, 'updated' when the existing file got new content
+    in place (same id, link and permissions) and 'created' otherwise.
+    """
+    filename = os.path.basename(filepath)
+    if remote_file and remote_file.get('md5Checksum') == file_md5(filepath):
+        return 'skipped', remote_file['id'], remote_file.get('webViewLink')
+
+    drive_service = thread_service()
+    media = MediaFileUpload(filepath, mimetype=guess_mimetype(filename), resumable=True)
+    if remote_file:
+        file = drive_service.files().update(
+            fileId=remote_file['id'],
             media_body=media,
-            fields='id, webViewLink, webContentLink',
+            fields='id, webViewLink',
             supportsAllDrives=True
         ).execute()
-        
-        file_id = file.get('id')
-        
-        # Set permission to anyone with link
-        permission = {
-            'type': 'anyone',
-            'role': 'reader'
-        }
-        drive_service.permissions().create(fileId=file_id, body=permission, supportsAllDrives=True).execute()
-        print(f"Uploaded: {filename}")
-        return {
-            'id': file_id,
-            'webViewLink': file.get('webViewLink'),
-            'webContentLink': file.get('webContentLink')
-        }
-    except Exception as e:
-        print(f"Error uploading {filename}: {e}")
-        return None
+        return 'updated', file.get('id'), file.get('webViewLink')
+
+    file = drive_service.files().create(
+        body={'name': filename, 'parents': [folder_id]},
+        media_body=media,
+        fields='id, webViewLink',
+        supportsAllDrives=True
+    ).execute()
+    return 'created', file.get('id'), file.get('webViewLink')
+
+def share_files(drive_service, file_ids):
+    """Set 'anyone with link can read' on new files, batched per 100."""
+    def callback(request_id, response, exception):
+        if exception:
+            print(f"Error sharing {request_id}: {exception}")
+
+    permission = {
+        'type': 'anyone',
+        'role': 'reader'
+    }
+    for start in range(0, len(file_ids), PERMISSION_BATCH_SIZE):
+        batch = drive_service.new_batch_http_request(callback=callback)
+        for file_id in file_ids[start:start + PERMISSION_BATCH_SIZE]:
+            batch.add(drive_service.permissions().create(
+                fileId=file_id, body=permission, supportsAllDrives=True
+            ), request_id=file_id)
+        batch.execute()
+
+def load_links():
+    try:
+        with open(LINKS_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
 
 def main():
     try:
@@ -68,26 +130,55 @@ def main():
     files_to_upload = [
         "Техкарты/Borsch.pdf"
     ]
-    
+
     photo_dir = "Техкарты/Photo"
     if os.path.exists(photo_dir):
-        for f in os.listdir(photo_dir):
+        for f in sorted(os.listdir(photo_dir)):
             if f.lower().endswith(('.jpg', '.jpeg', '.png')):
                 files_to_upload.append(os.path.join(photo_dir, f))
 
-    results = {}
+    existing = [p for p in files_to_upload if os.path.exists(p)]
     for f_path in files_to_upload:
-        if os.path.exists(f_path):
-            res = upload_file(drive_service, f_path, FOLDER_ID)
-            if res:
-                results[os.path.basename(f_path)] = res.get('webViewLink')
-        else:
+        if f_path not in existing:
             print(f"File not found: {f_path}")
 
-    with open("drive_links.json", "w", encoding='utf-8') as f:
-        json.dump(results, f, ensure_ascii=False, indent=4)
-        
-    print("All uploads complete. Links saved to drive_links.json")
+    remote = list_folder(drive_service, FOLDER_ID)
+
+    def task(f_path):
+        try:
+            return f_path, sync_file(f_path, remote.get(os.path.basename(f_path)), FOLDER_ID)
+        except Exception as e:
+            print(f"Error uploading {os.path.basename(f_path)}: {e}")
+            return f_path, None
+
+    results, created, counts = {}, [], {'created': 0, 'updated': 0, 'skipped': 0}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        for f_path, res in pool.map(task, existing):
+            if not res:
+                continue
+            status, file_id, link = res
+            counts[status] += 1
+            if status != 'skipped':
+                print(f"{status.capitalize()}: {os.path.basename(f_path)}")
+            if status == 'created':
+                created.append(file_id)
+            results[os.path.basename(f_path)] = link
+
+    if created:
+        share_files(drive_service, created)
+
+    # Merge, so links for files not handled in this run are kept
+    previous = load_links()
+    links = {**previous, **results}
+    if links != previous:
+        # Atomic replace: readers see the old file or the new one, never half of it
+        tmp = LINKS_FILE + ".tmp"
+        with open(tmp, "w", encoding='utf-8') as f:
+            json.dump(links, f, ensure_ascii=False, indent=4)
+        os.replace(tmp, LINKS_FILE)
+
+    print(f"All uploads complete: {counts['created']} created, {counts['updated']} updated, "
+          f"{counts['skipped']} unchanged. Links saved to {LINKS_FILE}")
 
 if __name__ == '__main__':
     main()
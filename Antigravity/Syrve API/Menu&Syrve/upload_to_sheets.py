@@ -1,46 +1,67 @@
 """
 upload_to_sheets.py
-Reads all generated HTML tables and pushes them to the corresponding sheets
+Reads all generated tables and pushes them to the corresponding sheets
 in the Google Spreadsheet. Uses PyJWT + cryptography (no google-auth needed).
+
+Tables are read from the generators' .jsonl data artifacts (source TSVs are
+read as-is), so nothing is parsed back out of HTML; .html files still work.
+
+By default the sheets are synced: current contents are read once
+(values:batchGet), diffed against the new tables, and only changed
+rectangles are written; rows past the new end are cleared. Pass --full to
+clear and rewrite every sheet instead.
 """
 
-import json, time, re, urllib.request, urllib.parse
+import csv, datetime, json, sys, time, re, urllib.request, urllib.parse
 from html.parser import HTMLParser
 
-import jwt  # PyJWT
+from table_render import read_jsonl
 
 # ─── Config ─────────────────────────────────────────────────────────────────
 SPREADSHEET_ID = '1-bNwX3XkDiYADdJ1AuoqQM4YhvKSMxnJ_QkMuPGU2u8'
 CRED_FILE      = 'gdisk_cred.json'
 SCOPES         = 'https://www.googleapis.com/auth/spreadsheets'
 TOKEN_URL      = 'https://oauth2.googleapis.com/token'
+SHEETS_URL     = 'https://sheets.googleapis.com/v4/spreadsheets'
+
+# "--full" clears and rewrites every sheet instead of writing only the diff
+FULL_MODE = '--full' in sys.argv
 
-# Map: local HTML file → Sheet name in Google Sheets
+# batchUpdate payload limits (Sheets recommends ≤ 2 MB per request)
+MAX_CELLS_PER_REQUEST = 100_000
+MAX_BYTES_PER_REQUEST = 2_000_000
+
+# Map: local table file → Sheet name in Google Sheets
 SHEET_MAP = [
     # ── Syrve Catalogue Structure (v2) ─────────────────────────────────────────
-    ('Groups_table.html',                     'Groups'),
-    ('Product_Categories_table.html',         'Product_Categories'),
-    ('Modifier_Schema_Registry_table.html',   'Modifier_Schemas'),
+    ('Groups_table.jsonl',                    'Groups'),
+    ('Product_Categories_table.jsonl',        'Product_Categories'),
+    ('Modifier_Schema_Registry_table.jsonl',  'Modifier_Schemas'),
     # ── Core Menu Data ──────────────────────────────────────────────────────────
-    ('Nomenclature_Operational_table.html',   'Nomenclature'),
-    ('BOM_Operational_table.html',            'BOM'),
+    ('Nomenclature_Operational_table.jsonl',  'Nomenclature'),
+    ('BOM_Operational_table.jsonl',           'BOM'),
     ('Modifier_Schemes.tsv',                  'Modifier_Schemes'),
     # ── Production & Planning ───────────────────────────────────────────────────
-    ('Purchasing_Inventory_table.html',       'Purchasing_Inventory'),
-    ('Daily_Production_Plan_table.html',      'Daily_Production_Plan'),
-    ('Production_Flow_Operational_table.html','Production_Flow'),
-    ('Resource_Capacity_table.html',          'Resource_Capacity'),
-    ('Resource_Load_Report_table.html',       'Resource Load Report'),
-    ('Chef_Job_List_table.html',              'Chef Job List'),
-    ('Warehouse_Request_table.html',          'Warehouse Request'),
-    ('UOM_Mapping_table.html',               'UOM_Mapping'),
+    ('Purchasing_Inventory_table.jsonl',      'Purchasing_Inventory'),
+    ('Daily_Production_Plan_table.jsonl',     'Daily_Production_Plan'),
+    ('Production_Flow_Operational_table.jsonl','Production_Flow'),
+    ('Resource_Capacity_table.jsonl',         'Resource_Capacity'),
+    ('Resource_Load_Report_table.jsonl',      'Resource Load Report'),
+    ('Chef_Job_List_table.jsonl',             'Chef Job List'),
+    ('Production_Schedule_table.jsonl',       'Production_Schedule'),
+    ('Batch_Plan_table.jsonl',                'Batch_Plan'),
+    ('Warehouse_Request_table.jsonl',         'Warehouse Request'),
+    ('UOM_Mapping.tsv',                       'UOM_Mapping'),
     # ── Costing Breakdown (v3) ──────────────────────────────────────────────────
-    ('Modifier_Costs_table.html',            'Modifier_Costs'),
-    ('Dish_Cost_Summary_table.html',         'Dish_Cost_Summary'),
+    ('Modifier_Costs_table.jsonl',            'Modifier_Costs'),
+    ('Dish_Cost_Summary_table.jsonl',         'Dish_Cost_Summary'),
 ]
 
 # ─── Auth ────────────────────────────────────────────────────────────────────
 def get_access_token():
+    # Imported here so SHEET_MAP / load_rows work without PyJWT installed
+    import jwt  # PyJWT
+
     with open(CRED_FILE) as f:
         cred = json.load(f)
 
@@ -82,18 +103,194 @@ def sheets_request(method, url, token, body=None):
         return None
 
 
-def clear_sheet(token, sheet_name):
-    url = (f"https://sheets.googleapis.com/v4/spreadsheets/{SPREADSHEET_ID}"
-           f"/values/{urllib.parse.quote(sheet_name)}!A1:ZZ:clear")
-    sheets_request("POST", url, token)
+def sheet_range(sheet_name, cells):
+    """A1 range with the sheet name quoted ('Chef Job List'!A1:ZZ)."""
+    return "'" + sheet_name.replace("'", "''") + "'!" + cells
+
+
+def batch_clear(token, ranges):
+    """Clear a list of A1 ranges in one values:batchClear call."""
+    url = f"{SHEETS_URL}/{SPREADSHEET_ID}/values:batchClear"
+    return sheets_request("POST", url, token, {"ranges": ranges})
+
+
+def batch_get(token, ranges):
+    """
+    Current contents (formulas as typed) of a list of ranges, in one call.
+    Dates and times come back as serial numbers; same_cell compares them.
+    """
+    query = urllib.parse.urlencode([("ranges", r) for r in ranges] +
+                                   [("valueRenderOption", "FORMULA"),
+                                    ("dateTimeRenderOption", "SERIAL_NUMBER")])
+    result = sheets_request("GET", f"{SHEETS_URL}/{SPREADSHEET_ID}/values:batchGet?{query}", token)
+    if result is None:
+        return None
+    return [vr.get("values", []) for vr in result.get("valueRanges", [])]
+
+
+def batch_update(token, data):
+    """Write a list of {range, values} in one values:batchUpdate call."""
+    url = f"{SHEETS_URL}/{SPREADSHEET_ID}/values:batchUpdate"
+    body = {"valueInputOption": "USER_ENTERED", "data": data}
+    return sheets_request("POST", url, token, body)
+
+
+def col_letter(index):
+    """0 → A, 25 → Z, 26 → AA."""
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+def plan_batches(blocks, max_cells=MAX_CELLS_PER_REQUEST, max_bytes=MAX_BYTES_PER_REQUEST):
+    """
+    Pack [(sheet_name, row0, col0, rows), …] into as few batchUpdate payloads
+    as the limits allow; (row0, col0) is the 0-based top-left cell of the
+    block. A block too big for one request is split into row slices, each
+    written at its own start row. Returns [[{range, values}, …], …].
+    """
+    batches, batch, cells, size = [], [], 0, 0
+
+    def flush():
+        nonlocal batch, cells, size
+        if batch:
+            batches.append(batch)
+        batch, cells, size = [], 0, 0
+
+    for sheet_name, row0, col0, rows in blocks:
+        start = 0
+        while start < len(rows):
+            # Grow the slice row by row until the current request is full
+            end, block_cells, block_size = start, 0, 0
+            while end < len(rows):
+                row_cells = len(rows[end])
+                row_size = len(json.dumps(rows[end], ensure_ascii=False).encode())
+                if (cells + block_cells + row_cells > max_cells
+                        or size + block_size + row_size > max_bytes):
+                    break
+                block_cells += row_cells
+                block_size += row_size
+                end += 1
+            if end == start:
+                if batch:           # request is full: start a new one
+                    flush()
+                    continue
+                end = start + 1     # a single row over the limit goes alone
+            batch.append({"range":  sheet_range(sheet_name, f"{col_letter(col0)}{row0 + start + 1}"),
+                          "values": rows[start:end]})
+            cells += block_cells
+            size += block_size
+            start = end
+    flush()
+    return batches
+
+
+# ─── Diff sync ───────────────────────────────────────────────────────────────
+def _number(value):
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = value.strip().replace(",", "")
+    scale = 1.0
+    if text.endswith("%"):
+        text, scale = text[:-1], 0.01
+    try:
+        return float(text) * scale
+    except ValueError:
+        return None
+
+
+# Dates/times the generators write, and how Sheets parses them (USER_ENTERED)
+DATE_FORMATS = ('%Y-%m-%d', '%Y-%m-%d %H:%M', '%Y-%m-%d %H:%M:%S', '%H:%M', '%H:%M:%S')
+SERIAL_EPOCH = datetime.datetime(1899, 12, 30)
+
+
+def _serial(text):
+    """Sheets serial number (days since 1899-12-30) of a date/time string; None if not one."""
+    for fmt in DATE_FORMATS:
+        try:
+            value = datetime.datetime.strptime(text.strip(), fmt)
+        except ValueError:
+            continue
+        if fmt.startswith('%H'):                # time only: fraction of a day
+            return (value.hour * 3600 + value.minute * 60 + value.second) / 86400
+        return (value - SERIAL_EPOCH).total_seconds() / 86400
+    return None
+
+
+def same_cell(current, new):
+    """
+    True if a sheet cell already holds what USER_ENTERED `new` would put
+    there. batchGet returns numbers as numbers ("33%" comes back as 0.33),
+    dates and times as serial numbers and booleans as true/false, so compare
+    those by value.
+    """
+    if isinstance(current, bool):
+        return str(current).upper() == new.strip().upper()
+    if str(current) == new:
+        return True
+    a, b = _number(current), _number(new)
+    if a is not None and b is None:
+        b = _serial(new)
+    return a is not None and b is not None and abs(a - b) <= 1e-9 * max(1.0, abs(a), abs(b))
 
 
-def write_rows(token, sheet_name, rows):
-    url = (f"https://sheets.googleapis.com/v4/spreadsheets/{SPREADSHEET_ID}"
-           f"/values/{urllib.parse.quote(sheet_name)}!A1"
-           f"?valueInputOption=USER_ENTERED")
-    body = {"values": rows}
-    return sheets_request("PUT", url, token, body)
+def diff_table(current, new):
+    """
+    Compare a sheet's current rows with the new rows.
+    Returns (rectangles, trailing):
+      rectangles — [(row0, col0, rows), …] changed blocks to write, padded
+                   with "" so cleared cells inside the table are blanked
+      trailing   — 0-based row from which old rows run past the new table
+                   and must be cleared (None if the sheet is not longer)
+    Changed cells are grouped into column runs per row, and runs with the
+    same columns on consecutive rows are merged into one rectangle.
+    """
+    width = max((len(r) for r in new), default=0)
+    runs = []   # (row, c0, c1) — c1 exclusive
+    for r, new_row in enumerate(new):
+        cur_row = current[r] if r < len(current) else []
+        row_width = max(width, len(cur_row))
+        c = 0
+        while c < row_width:
+            new_val = new_row[c] if c < len(new_row) else ""
+            cur_val = cur_row[c] if c < len(cur_row) else ""
+            if same_cell(cur_val, new_val):
+                c += 1
+                continue
+            c0 = c
+            while c < row_width:
+                new_val = new_row[c] if c < len(new_row) else ""
+                cur_val = cur_row[c] if c < len(cur_row) else ""
+                if same_cell(cur_val, new_val):
+                    break
+                c += 1
+            runs.append((r, c0, c))
+
+    rectangles, open_rects = [], {}   # (c0, c1) → [row0, last_row]
+    for r, c0, c1 in runs:
+        rect = open_rects.get((c0, c1))
+        if rect and rect[1] == r - 1:
+            rect[1] = r
+        else:
+            if rect:
+                rectangles.append((rect[0], rect[1], c0, c1))
+            open_rects[(c0, c1)] = [r, r]
+    rectangles += [(r0, r1, c0, c1) for (c0, c1), (r0, r1) in open_rects.items()]
+    rectangles.sort()
+
+    blocks = []
+    for r0, r1, c0, c1 in rectangles:
+        values = [[(new[r][c] if c < len(new[r]) else "") for c in range(c0, c1)]
+                  for r in range(r0, r1 + 1)]
+        blocks.append((r0, c0, values))
+    trailing = len(new) if len(current) > len(new) and any(
+        any(str(v) != "" for v in row) for row in current[len(new):]) else None
+    return blocks, trailing
 
 
 # ─── HTML table parser ───────────────────────────────────────────────────────
@@ -129,32 +326,93 @@ def parse_html_table(filepath):
     return p.rows
 
 
+def load_rows(filepath):
+    """Rows (header first) of a .jsonl table, a source .tsv, or an .html view."""
+    if filepath.endswith('.jsonl'):
+        return read_jsonl(filepath)
+    if filepath.endswith('.tsv'):
+        with open(filepath, 'r', encoding='utf-8', newline='') as f:
+            return [row for row in csv.reader(f, delimiter='\t') if row]
+    return parse_html_table(filepath)
+
+
 # ─── Main ─────────────────────────────────────────────────────────────────────
 def main():
     print("🔑  Getting access token via service account JWT…")
     token = get_access_token()
     print(f"✅  Token obtained.\n📋  Spreadsheet: {SPREADSHEET_ID}\n")
 
-    for html_file, sheet_name in SHEET_MAP:
-        print(f"📄  {html_file} → [{sheet_name}]")
+    tables = []   # (sheet_name, rows)
+    for table_file, sheet_name in SHEET_MAP:
         try:
-            rows = parse_html_table(html_file)
-            if not rows:
-                print(f"    ⚠  Empty table, skipping.")
-                continue
-            clear_sheet(token, sheet_name)
-            result = write_rows(token, sheet_name, rows)
-            if result:
-                updated = result.get("updatedCells", "?")
-                print(f"    ✅  {len(rows)} rows, {updated} cells written.")
-            else:
-                print(f"    ❌  Write failed (see error above).")
+            rows = load_rows(table_file)
         except FileNotFoundError:
-            print(f"    ❌  File not found: {html_file}")
-        except Exception as e:
-            print(f"    ❌  {e}")
+            print(f"📄  {table_file} → [{sheet_name}]\n    ❌  File not found: {table_file}")
+            continue
+        if not rows:
+            print(f"📄  {table_file} → [{sheet_name}]\n    ⚠  Empty table, skipping.")
+            continue
+        tables.append((sheet_name, rows))
+
+    if not tables:
+        print("Nothing to upload.")
+        return
+
+    if FULL_MODE:
+        # One call clears every sheet, then every table is written from A1
+        print(f"🧹  Clearing {len(tables)} sheets…")
+        if batch_clear(token, [sheet_range(name, "A1:ZZ") for name, _ in tables]) is None:
+            print("    ❌  Clear failed (see error above).")
+            return
+        blocks = [(name, 0, 0, rows) for name, rows in tables]
+        requests = 1
+    else:
+        # Read everything once, write back only what differs
+        current = batch_get(token, [sheet_range(name, "A1:ZZ") for name, _ in tables])
+        if current is None:
+            print("    ❌  Read failed (see error above).")
+            return
+        blocks, clears = [], []
+        for (name, rows), cur in zip(tables, current):
+            rects, trailing = diff_table(cur, rows)
+            blocks += [(name, r0, c0, values) for r0, c0, values in rects]
+            if trailing is not None:
+                clears.append(sheet_range(name, f"A{trailing + 1}:ZZ"))
+                print(f"    ✂  [{name}] {len(cur) - trailing} old rows past row {trailing} cleared")
+        requests = 1
+        if clears:
+            if batch_clear(token, clears) is None:
+                print("    ❌  Clear failed (see error above).")
+                return
+            requests += 1
+        if not blocks:
+            print(f"✅  All {len(tables)} sheets already up to date ({requests} request).")
+            return
+
+    written, failed = {}, set()
+    batches = plan_batches(blocks)
+    for i, data in enumerate(batches, 1):
+        print(f"📤  batchUpdate {i}/{len(batches)}: {len(data)} ranges")
+        result = batch_update(token, data)
+        if result is None:
+            failed.update(d["range"].rsplit("!", 1)[0] for d in data)
+            continue
+        for resp in result.get("responses", []):
+            sheet = resp.get("updatedRange", "").rsplit("!", 1)[0]
+            written[sheet] = written.get(sheet, 0) + resp.get("updatedCells", 0)
+
+    for sheet_name, rows in tables:
+        quoted = sheet_range(sheet_name, "")[:-1]
+        cells = written.get(quoted, written.get(sheet_name, 0))
+        if quoted in failed:
+            print(f"    ❌  [{sheet_name}] write failed (see error above).")
+        elif cells or FULL_MODE:
+            print(f"    ✅  [{sheet_name}] {len(rows)} rows, {cells} cells written.")
+        else:
+            print(f"    ·  [{sheet_name}] unchanged.")
 
-    print("\n🎉  Upload complete!")
+    total = sum(written.values())
+    print(f"\n🎉  Upload complete! {total} cells, {requests + len(batches)} requests.")
 
 
 if __name__ == '__main__':
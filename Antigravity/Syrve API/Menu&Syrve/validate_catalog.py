@@ -0,0 +1,259 @@
+"""
+validate_catalog.py
+Integrity check of the catalog TSVs in one pass, before anything is
+generated or uploaded (a broken reference otherwise only shows up as #N/A
+or YIELD ERR after the Sheets recalculation).
+
+Every file is read once (model.read_table) and every cross-reference is a
+dict/set lookup, so the check is linear in the number of rows. Errors:
+
+    name_is_code          Nomenclature Name equals its Short_Code
+    duplicate_sys_id      Syrve_System_ID used by more than one row
+    short_code_collision  one Short_Code for different names (make_short_code
+                          keeps only the first two words of a name)
+    unknown_code          BOM / UOM / modifier / flow row naming a code that
+                          is not in Nomenclature (orphan)
+    bad_quantity          non-numeric or zero quantity, ratio or duration
+    bom_cycle             an item that is, directly or not, its own ingredient
+    missing_uom           item without a UOM_Mapping row (modifier groups and
+                          service items need none)
+    unknown_equipment     Equipment_ID not in kitchen.RESOURCE_CAPACITY
+
+Warnings:
+
+    name_mismatch         BOM / UOM / flow name differs from Nomenclature
+    yield_imbalance       a BOM's net output (gross × yield, Processing Loss
+                          included) differs from Standard_Output_Amount — the
+                          sheet's Batch_Validation shows YIELD ERR for it
+
+The report is JSON: the sha256 and row count of every input, counts per
+check and one entry per problem (severity, check, file, line, code, message).
+
+pipeline.py runs it after cleanup_nomenclature and writes the report to
+REPORT_FILE; errors stop the generators and uploads.
+
+Usage:  python validate_catalog.py [--json] [--report FILE]
+        (exit status 1 when there are errors)
+"""
+
+import json
+import os
+import sys
+from collections import Counter
+
+from bom_engine import BomCycleError, BomIndex
+from build_manifest import BUILD_DIR, file_hash
+from catalog_store import LOSS_ITEM
+from cost_rollup import round_half_up, yield_for
+from kitchen import MANUAL_EQUIPMENT, RESOURCE_CAPACITY
+from model import BomLine, FlowStep, Item, ModifierOption, Uom, read_table
+
+INPUTS = {
+    'Nomenclature.tsv':     Item,
+    'BOM.tsv':              BomLine,
+    'UOM_Mapping.tsv':      Uom,
+    'Modifier_Schemes.tsv': ModifierOption,
+    'Production_Flow.tsv':  FlowStep,
+}
+REPORT_FILE = os.path.join(BUILD_DIR, 'catalog_report.json')
+UOM_EXEMPT_TYPES = {'modifier_group', 'service'}
+EQUIPMENT = {e_id for e_id, _, _, _ in RESOURCE_CAPACITY} | {MANUAL_EQUIPMENT, ''}
+
+
+class Report:
+    def __init__(self):
+        self.problems = []
+        self.files = {}
+
+    def add(self, severity, check, file, line, code, message):
+        self.problems.append({'severity': severity, 'check': check, 'file': file,
+                              'line': line, 'code': code, 'message': message})
+
+    def error(self, *args):
+        self.add('error', *args)
+
+    def warning(self, *args):
+        self.add('warning', *args)
+
+    @property
+    def errors(self):
+        return sum(p['severity'] == 'error' for p in self.problems)
+
+    def as_dict(self):
+        counts = Counter((p['severity'], p['check']) for p in self.problems)
+        return {
+            'ok':       self.errors == 0,
+            'errors':   self.errors,
+            'warnings': len(self.problems) - self.errors,
+            'checks':   {f"{sev}:{check}": n for (sev, check), n in sorted(counts.items())},
+            'files':    self.files,
+            'problems': self.problems,
+        }
+
+
+# ─── Checks ─────────────────────────────────────────────────────────────────
+def check_nomenclature(items, report):
+    f = 'Nomenclature.tsv'
+    by_code, seen_ids = {}, {}
+    for line, item in enumerate(items, 2):
+        if item.name == item.code:
+            report.error('name_is_code', f, line, item.code, "Name is the Short_Code")
+        if item.sys_id in seen_ids:
+            report.error('duplicate_sys_id', f, line, item.code,
+                         f"Syrve_System_ID {item.sys_id} already used on line {seen_ids[item.sys_id]}")
+        else:
+            seen_ids[item.sys_id] = line
+        first = by_code.get(item.code)
+        if first is None:
+            by_code[item.code] = item
+        elif first.name != item.name:
+            report.error('short_code_collision', f, line, item.code,
+                         f"'{item.name}' and '{first.name}' both map to {item.code}")
+    return by_code
+
+
+def check_name(report, file, line, code, name, items):
+    item = items.get(code)
+    if item is None:
+        report.error('unknown_code', file, line, code, f"{code} is not in Nomenclature")
+        return False
+    if name and name != item.name:
+        report.warning('name_mismatch', file, line, code, f"'{name}' ≠ Nomenclature '{item.name}'")
+    return True
+
+
+def check_bom(bom, items, uom, report):
+    f = 'BOM.tsv'
+    net = {}
+    loss = {}
+    for line, row in enumerate(bom, 2):
+        check_name(report, f, line, row.parent, row.parent_name, items)
+        check_name(report, f, line, row.child, row.child_name, items)
+        if row.qty is None or (row.qty == 0 and row.child_name != LOSS_ITEM):
+            report.error('bad_quantity', f, line, row.child, f"QuantityGross '{row.qty_text}'")
+            continue
+        net[row.parent] = net.get(row.parent, 0.0) + row.qty * float(yield_for(items.get(row.child)))
+        if row.child_name == LOSS_ITEM:
+            loss[row.parent] = loss.get(row.parent, 0.0) + row.qty
+
+    try:
+        BomIndex(bom, items)
+    except BomCycleError as e:
+        report.error('bom_cycle', f, None, e.cycle[0], str(e))
+
+    # Same test as CostRollup.batch_validation (the sheet's Batch_Validation)
+    for parent, total in net.items():
+        item = items.get(parent)
+        if item is None:
+            continue
+        if item.std_output is None:
+            report.warning('yield_imbalance', f, None, parent, "no Standard_Output_Amount")
+            continue
+        ratio = None
+        if parent.startswith("SALE-") or item.type == "Compound":
+            ratio = uom[parent].sale_ratio if parent in uom else None
+            produced = round_half_up(total / ratio, 2) if ratio else -1
+        else:
+            produced = round_half_up(total, 2)
+        if produced != item.std_output:
+            message = f"nets {produced:g} against Standard_Output_Amount {item.std_output:g} {item.std_uom}"
+            if ratio is None:
+                balance = loss.get(parent, 0.0) + item.std_output - total
+                message += f"; balancing Processing Loss {balance:.4f}"
+            report.warning('yield_imbalance', f, None, parent, message)
+
+
+def check_uom(uom_rows, nomenclature, items, report):
+    f = 'UOM_Mapping.tsv'
+    for line, u in enumerate(uom_rows, 2):
+        check_name(report, f, line, u.code, u.name, items)
+        for column, value in (('Storage_Ratio', u.storage_ratio), ('Sale_Ratio', u.sale_ratio)):
+            if not value:
+                report.error('bad_quantity', f, line, u.code, f"{column} '{u[column]}'")
+    mapped = {u.code for u in uom_rows}
+    for line, item in enumerate(nomenclature, 2):
+        if item.code not in mapped and item.type not in UOM_EXEMPT_TYPES:
+            mapped.add(item.code)                 # report each code once
+            report.error('missing_uom', 'Nomenclature.tsv', line, item.code,
+                         f"{item.name} has no UOM_Mapping row")
+
+
+def check_modifiers(options, items, report):
+    f = 'Modifier_Schemes.tsv'
+    for line, o in enumerate(options, 2):
+        check_name(report, f, line, o.dish, o.dish_name, items)
+        check_name(report, f, line, o.group, o.group_name, items)
+        check_name(report, f, line, o.item, o.item_name, items)
+        if o.min_amount > o.max_amount:
+            report.error('bad_quantity', f, line, o.group,
+                         f"MinAmount_Group {o.min_amount} > MaxAmount_Group {o.max_amount}")
+
+
+def check_flow(steps, items, report):
+    f = 'Production_Flow.tsv'
+    for line, s in enumerate(steps, 2):
+        check_name(report, f, line, s.product, s.product_name, items)
+        if s.equipment not in EQUIPMENT:
+            report.error('unknown_equipment', f, line, s.product,
+                         f"Equipment_ID {s.equipment} is not in kitchen.RESOURCE_CAPACITY")
+        if s.duration <= 0:
+            report.error('bad_quantity', f, line, s.product, f"Duration_Min '{s.duration_text}'")
+
+
+def validate(directory='.'):
+    """Report of every check over the TSVs in `directory`."""
+    report = Report()
+    tables = {}
+    for filename, cls in INPUTS.items():
+        path = f"{directory}/{filename}"
+        try:
+            tables[filename] = read_table(path, cls)
+        except FileNotFoundError:
+            report.error('missing_file', filename, None, '', f"{filename} not found")
+            tables[filename] = []
+        report.files[filename] = {'sha256': file_hash(path), 'rows': len(tables[filename])}
+
+    # Keyed by first occurrence: later duplicates are reported, not indexed
+    items = check_nomenclature(tables['Nomenclature.tsv'], report)
+    uom = {}
+    for u in tables['UOM_Mapping.tsv']:
+        uom.setdefault(u.code, u)
+    check_bom(tables['BOM.tsv'], items, uom, report)
+    check_uom(tables['UOM_Mapping.tsv'], tables['Nomenclature.tsv'], items, report)
+    check_modifiers(tables['Modifier_Schemes.tsv'], items, report)
+    check_flow(tables['Production_Flow.tsv'], items, report)
+    return report
+
+
+def print_summary(result):
+    rows = sum(f['rows'] for f in result['files'].values())
+    print(f"Catalog check: {rows} rows in {len(result['files'])} files — "
+          f"{result['errors']} error(s), {result['warnings']} warning(s)")
+    for p in result['problems']:
+        where = f"{p['file']}:{p['line']}" if p['line'] else p['file']
+        print(f"  {p['severity']:<7} {p['check']:<21} {where:<26} {p['code']}: {p['message']}")
+
+
+def check(report_path=None, as_json=False, directory='.'):
+    """Validate, print the summary (or the JSON) and write the report if asked; returns it."""
+    result = validate(directory).as_dict()
+    if report_path:
+        os.makedirs(os.path.dirname(report_path) or '.', exist_ok=True)
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=1)
+    if as_json:
+        json.dump(result, sys.stdout, ensure_ascii=False, indent=1)
+        print()
+    else:
+        print_summary(result)
+    return result
+
+
+def main():
+    report = sys.argv[sys.argv.index('--report') + 1] if '--report' in sys.argv else None
+    if not check(report, '--json' in sys.argv)['ok']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
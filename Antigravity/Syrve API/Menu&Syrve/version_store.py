@@ -0,0 +1,194 @@
+"""
+version_store.py
+Content-addressed version store for the generated tables.
+
+The latest table stays a plain file (Groups_table.jsonl, …) and is only
+rewritten when its content changes. History lives under versions/:
+
+    versions/objects/ab/ab12….gz        one gzip blob per unique content
+    versions/<table>.json               [{version, sha256, size}, …] oldest first
+
+A run that produces the same content as the previous version adds nothing.
+Old entries are pruned by RETENTION and unreferenced blobs are deleted.
+
+Usage:
+    python version_store.py list [table]
+    python version_store.py restore <table> <version> [out_file]
+    python version_store.py prune [--keep N] [--days D]
+"""
+
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+from build_manifest import file_hash
+
+STORE_DIR = 'versions'
+OBJECTS   = os.path.join(STORE_DIR, 'objects')
+
+# Default retention: keep the newest `keep_last` versions per table and drop
+# anything older than `max_age_days` (the newest version is always kept).
+RETENTION = {
+    "keep_last":    int(os.environ.get("SYRVE_VERSIONS_KEEP", 30)),
+    "max_age_days": int(os.environ.get("SYRVE_VERSIONS_DAYS", 180)),
+}
+
+VERSION_FORMAT = "v%Y%m%d_%H%M"
+
+
+def _history_path(table):
+    return os.path.join(STORE_DIR, f"{table}.json")
+
+
+def _blob_path(sha):
+    return os.path.join(OBJECTS, sha[:2], f"{sha}.gz")
+
+
+def history(table):
+    try:
+        with open(_history_path(table), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return []
+
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+def save_table(filename, content, version=None):
+    """
+    Write `filename` and record its content as a version. `content` is a
+    str/bytes or an iterable of str chunks (e.g. table_render output), which
+    is streamed to disk and hashed on the way. The file is only replaced when
+    its content changed. Returns the history entry for the current content.
+    """
+    chunks = [content] if isinstance(content, (str, bytes)) else content
+    h, size = hashlib.sha256(), 0
+    tmp = filename + ".tmp"
+    with open(tmp, 'wb') as f:
+        for chunk in chunks:
+            data = chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+            h.update(data)
+            size += len(data)
+            f.write(data)
+    sha = h.hexdigest()
+
+    if file_hash(filename) == sha:
+        os.remove(tmp)
+    else:
+        os.replace(tmp, filename)
+
+    entries = history(filename)
+    if entries and entries[-1]["sha256"] == sha:
+        return entries[-1]
+
+    blob = _blob_path(sha)
+    if not os.path.exists(blob):
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        with open(filename, 'rb') as src, gzip.open(blob, 'wb') as dst:
+            shutil.copyfileobj(src, dst)
+
+    entry = {
+        "version": version or datetime.datetime.now().strftime(VERSION_FORMAT),
+        "sha256":  sha,
+        "size":    size,
+    }
+    previous = {e["sha256"] for e in entries}
+    if entries and entries[-1]["version"] == entry["version"]:
+        entries.pop()   # re-run within the same minute: newest content wins
+    entries.append(entry)
+    kept = _apply_retention(entries)
+    _write_json(_history_path(filename), kept)
+    _drop_blobs(previous - {e["sha256"] for e in kept})
+    return entry
+
+
+def _apply_retention(entries, keep_last=None, max_age_days=None):
+    keep_last = RETENTION["keep_last"] if keep_last is None else keep_last
+    max_age_days = RETENTION["max_age_days"] if max_age_days is None else max_age_days
+    cutoff = datetime.datetime.now() - datetime.timedelta(days=max_age_days)
+
+    kept = entries[-keep_last:] if keep_last > 0 else entries[-1:]
+    newest = kept[-1:]
+    kept = [e for e in kept[:-1]
+            if datetime.datetime.strptime(e["version"], VERSION_FORMAT) >= cutoff]
+    return kept + newest
+
+
+def _drop_blobs(shas):
+    """Delete blobs that no table history references any more."""
+    if not shas:
+        return 0
+    for table in tables():
+        shas = shas - {e["sha256"] for e in history(table)}
+    for sha in shas:
+        try:
+            os.remove(_blob_path(sha))
+        except FileNotFoundError:
+            pass
+    return len(shas)
+
+
+def load_version(table, version):
+    for entry in history(table):
+        if entry["version"] == version:
+            with gzip.open(_blob_path(entry["sha256"]), 'rb') as f:
+                return f.read()
+    raise KeyError(f"{table} has no version {version}")
+
+
+def tables():
+    if not os.path.isdir(STORE_DIR):
+        return []
+    return sorted(name[:-5] for name in os.listdir(STORE_DIR) if name.endswith('.json'))
+
+
+def prune(keep_last=None, max_age_days=None):
+    """Apply retention to every table, then delete blobs nobody references."""
+    referenced = set()
+    for table in tables():
+        entries = _apply_retention(history(table), keep_last, max_age_days)
+        _write_json(_history_path(table), entries)
+        referenced.update(e["sha256"] for e in entries)
+
+    orphans = set()
+    if os.path.isdir(OBJECTS):
+        for _, _, files in os.walk(OBJECTS):
+            orphans.update(name.split('.')[0] for name in files)
+    return _drop_blobs(orphans - referenced)
+
+
+def main():
+    args = sys.argv[1:]
+    cmd = args[0] if args else "list"
+
+    if cmd == "list":
+        for table in (args[1:] or tables()):
+            print(table)
+            for e in history(table):
+                print(f"   {e['version']}  {e['sha256'][:12]}  {e['size']:>9} B")
+    elif cmd == "restore" and len(args) >= 3:
+        table, version = args[1], args[2]
+        out = args[3] if len(args) > 3 else table
+        with open(out, 'wb') as f:
+            f.write(load_version(table, version))
+        print(f"Restored {table} {version} → {out}")
+    elif cmd == "prune":
+        keep = int(args[args.index("--keep") + 1]) if "--keep" in args else None
+        days = int(args[args.index("--days") + 1]) if "--days" in args else None
+        print(f"Pruned; {prune(keep, days)} unreferenced blobs removed.")
+    else:
+        print(__doc__)
+
+
+if __name__ == '__main__':
+    main()